@@ -12,9 +12,21 @@ from typing import Any, Dict, List, Optional
 
 import httpx
 
+try:
+    import orjson
+except ImportError:  # orjson is an optional speedup
+    orjson = None
+
 logger = logging.getLogger(__name__)
 
 
+def _decode_json(response: httpx.Response) -> Dict[str, Any]:
+    """Decode a GraphQL response body, using orjson when it is installed."""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+
 class GitHubClient:
     """
     Async GitHub GraphQL API client for Projects v2 operations.
@@ -30,6 +42,7 @@ class GitHubClient:
         base_url: str = "https://api.github.com/graphql",
         rate_limit_enabled: bool = False,
         requests_per_hour: int = 5000,
+        session: Optional[httpx.AsyncClient] = None,
     ):
         """
         Initialize the GitHub client.
@@ -39,6 +52,8 @@ class GitHubClient:
             base_url: GraphQL API endpoint URL (for GitHub Enterprise support)
             rate_limit_enabled: Whether to enforce rate limiting
             requests_per_hour: Maximum requests per hour (GitHub default: 5000)
+            session: Existing HTTP session to reuse. Its connection pool is
+                shared with the caller, which remains responsible for closing it.
 
         Raises:
             ValueError: If no token is provided
@@ -56,14 +71,19 @@ class GitHubClient:
         self.reset_time: Optional[int] = None
         self.request_timestamps: List[float] = []
 
-        # Set up HTTP client with proper headers
-        headers = {
-            "Authorization": f"Bearer {token}",
-            "Content-Type": "application/json",
-            "Accept": "application/vnd.github.v4+json",
-        }
+        # Reuse the caller's connection pool when one is provided
+        self._owns_session = session is None
+        if session is not None:
+            self.session = session
+        else:
+            # Set up HTTP client with proper headers
+            headers = {
+                "Authorization": f"Bearer {token}",
+                "Content-Type": "application/json",
+                "Accept": "application/vnd.github.v4+json",
+            }
 
-        self.session = httpx.AsyncClient(headers=headers, timeout=30.0)
+            self.session = httpx.AsyncClient(headers=headers, timeout=30.0)
 
         logger.info(f"Initialized GitHub client for {base_url}")
         if rate_limit_enabled:
@@ -181,7 +201,7 @@ class GitHubClient:
         # Update rate limit state from response headers
         await self._update_rate_limit_state(response)
 
-        data = response.json()
+        data = _decode_json(response)
 
         if "errors" in data:
             error_msg = "; ".join(
@@ -223,7 +243,7 @@ class GitHubClient:
         # Update rate limit state from response headers
         await self._update_rate_limit_state(response)
 
-        data = response.json()
+        data = _decode_json(response)
 
         if "errors" in data:
             error_msg = "; ".join(
@@ -234,7 +254,10 @@ class GitHubClient:
         return data.get("data", {})
 
     async def close(self) -> None:
-        """Close the HTTP client session."""
+        """Close the HTTP client session if this client created it."""
+        if not self._owns_session:
+            return
+
         await self.session.aclose()
         logger.debug("GitHub client session closed")
 
@@ -9,6 +9,7 @@ comprehensive PRD lifecycle management.
 import logging
 from typing import Any, Dict, List, Optional
 
+import httpx
 from mcp.types import CallToolResult, TextContent, Tool
 
 from github_project_manager_mcp.github_client import GitHubClient
@@ -21,16 +22,21 @@ logger = logging.getLogger(__name__)
 # Global GitHub client instance
 _github_client: Optional[GitHubClient] = None
 
+# Validators hold no state, so one instance serves every request
+prd_validator = PRDValidator()
+
 
 def get_github_client() -> Optional[GitHubClient]:
     """Get the initialized GitHub client."""
     return _github_client
 
 
-def initialize_github_client(token: str) -> None:
-    """Initialize the GitHub client with authentication token."""
+def initialize_github_client(
+    token: str, session: Optional[httpx.AsyncClient] = None
+) -> None:
+    """Initialize the GitHub client, optionally reusing an existing HTTP session."""
     global _github_client
-    _github_client = GitHubClient(token)
+    _github_client = GitHubClient(token, session=session)
     logger.info("GitHub client initialized for PRD handlers")
 
 
@@ -141,8 +147,6 @@ async def add_prd_to_project_handler(arguments: Dict[str, Any]) -> CallToolResul
     """
     try:
         # Comprehensive validation using PRDValidator
-        validator = PRDValidator()
-
         # Validate project_id separately
         project_id = arguments.get("project_id", "").strip()
         if not project_id:
@@ -167,7 +171,7 @@ async def add_prd_to_project_handler(arguments: Dict[str, Any]) -> CallToolResul
             "status": arguments.get("status", "Backlog"),
         }
 
-        validation_result = validator.validate_prd_creation(prd_data)
+        validation_result = prd_validator.validate_prd_creation(prd_data)
         if not validation_result.is_valid:
             error_message = f"Validation failed: {', '.join(validation_result.errors)}"
             return CallToolResult(
@@ -838,8 +842,6 @@ async def update_prd_handler(arguments: Dict[str, Any]) -> CallToolResult:
             )
 
         # Comprehensive validation using PRDValidator
-        validator = PRDValidator()
-
         # Prepare update data for validation
         update_data = {}
         if arguments.get("title") is not None:
@@ -852,7 +854,7 @@ async def update_prd_handler(arguments: Dict[str, Any]) -> CallToolResult:
             update_data["assignee_ids"] = arguments.get("assignee_ids")
 
         # Validate update data
-        validation_result = validator.validate_prd_update(update_data)
+        validation_result = prd_validator.validate_prd_update(update_data)
         if not validation_result.is_valid:
             error_message = f"Validation failed: {', '.join(validation_result.errors)}"
             return CallToolResult(
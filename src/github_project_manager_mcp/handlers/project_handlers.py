@@ -9,6 +9,7 @@ import logging
 import re
 from typing import Any, Dict, Optional
 
+import httpx
 from mcp.server.models import InitializationOptions
 from mcp.types import CallToolResult, TextContent, Tool
 
@@ -26,15 +27,18 @@ query_builder = ProjectQueryBuilder()
 project_validator = ProjectValidator()
 
 
-def initialize_github_client(token: str) -> None:
+def initialize_github_client(
+    token: str, session: Optional[httpx.AsyncClient] = None
+) -> None:
     """
     Initialize the GitHub client with authentication token.
 
     Args:
         token: GitHub Personal Access Token
+        session: Optional HTTP session whose connection pool should be reused
     """
     global github_client
-    github_client = GitHubClient(token=token, rate_limit_enabled=True)
+    github_client = GitHubClient(token=token, rate_limit_enabled=True, session=session)
     logger.info("GitHub client initialized for project handlers")
 
 
@@ -10,6 +10,7 @@ import logging
 from datetime import datetime, timezone
 from typing import Any, Dict, List, Optional
 
+import httpx
 from mcp.types import CallToolResult, TextContent, Tool
 
 from ..github_client import GitHubClient
@@ -31,15 +32,18 @@ search_manager: Optional[ProjectSearchManager] = None
 _search_manager_client_id: Optional[id] = None
 
 
-def initialize_github_client(token: str) -> None:
+def initialize_github_client(
+    token: str, session: Optional[httpx.AsyncClient] = None
+) -> None:
     """
     Initialize the GitHub client with authentication token.
 
     Args:
         token: GitHub Personal Access Token
+        session: Optional HTTP session whose connection pool should be reused
     """
     global github_client, search_manager, _search_manager_client_id
-    github_client = GitHubClient(token=token, rate_limit_enabled=True)
+    github_client = GitHubClient(token=token, rate_limit_enabled=True, session=session)
 
     # Reset search manager when client changes to ensure consistency
     search_manager = None
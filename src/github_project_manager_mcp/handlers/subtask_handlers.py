@@ -9,6 +9,7 @@ error handling and parameter validation.
 import logging
 from typing import Any, Dict, List, Optional
 
+import httpx
 from mcp.types import CallToolResult, TextContent, Tool
 
 from ..models.subtask import Subtask, SubtaskStatus
@@ -25,12 +26,14 @@ def get_github_client():
     return _github_client
 
 
-def initialize_github_client(token: str) -> None:
-    """Initialize the GitHub client with authentication token."""
+def initialize_github_client(
+    token: str, session: Optional[httpx.AsyncClient] = None
+) -> None:
+    """Initialize the GitHub client, optionally reusing an existing HTTP session."""
     global _github_client
     from ..github_client import GitHubClient
 
-    _github_client = GitHubClient(token)
+    _github_client = GitHubClient(token, session=session)
 
 
 def _build_subtask_description_body(
@@ -7,8 +7,10 @@ comprehensive task lifecycle management.
 """
 
 import logging
+import re
 from typing import Any, Dict, List, Optional
 
+import httpx
 from mcp.types import CallToolResult, TextContent, Tool
 
 from github_project_manager_mcp.github_client import GitHubClient
@@ -17,6 +19,9 @@ from github_project_manager_mcp.utils.query_builder import ProjectQueryBuilder
 
 logger = logging.getLogger(__name__)
 
+# Matches the "**Parent PRD:** PVTI_xxxx" line written into task descriptions
+PARENT_PRD_BODY_PATTERN = re.compile(r"\*\*Parent PRD:\*\*\s+(PVTI_\w+)")
+
 # Global GitHub client instance
 _github_client: Optional[GitHubClient] = None
 
@@ -26,10 +31,12 @@ def get_github_client() -> Optional[GitHubClient]:
     return _github_client
 
 
-def initialize_github_client(token: str) -> None:
-    """Initialize the GitHub client with authentication token."""
+def initialize_github_client(
+    token: str, session: Optional[httpx.AsyncClient] = None
+) -> None:
+    """Initialize the GitHub client, optionally reusing an existing HTTP session."""
     global _github_client
-    _github_client = GitHubClient(token)
+    _github_client = GitHubClient(token, session=session)
     logger.info("GitHub client initialized for Task handlers")
 
 
@@ -506,13 +513,12 @@ async def list_tasks_handler(arguments: Dict[str, Any]) -> CallToolResult:
             # Fallback: Check description for Parent PRD if field is not set
             if not item_parent_prd_id:
                 # Look for "Parent PRD: PVTI_xxxx" pattern in content body
-                content_body = content.get("body", "")
+                content_body = content.get("body") or ""
+                if parent_prd_id and parent_prd_id not in content_body:
+                    # Cannot reference the requested PRD; skip the regex scan
+                    continue
                 if content_body:
-                    import re
-
-                    prd_match = re.search(
-                        r"\*\*Parent PRD:\*\*\s+(PVTI_\w+)", content_body
-                    )
+                    prd_match = PARENT_PRD_BODY_PATTERN.search(content_body)
                     if prd_match:
                         item_parent_prd_id = prd_match.group(1)
 
@@ -271,6 +271,7 @@ class GitHubProjectManagerMCPFastServer:
 
         # Mark that async components need initialization
         self._async_initialized = False
+        self._async_init_lock = asyncio.Lock()
         self.github_client = None
 
         logger.info(
@@ -282,6 +283,15 @@ class GitHubProjectManagerMCPFastServer:
         if self._async_initialized:
             return
 
+        # Concurrent tool calls may all arrive before the first one finishes
+        # initializing; only the first should load the token and build clients.
+        async with self._async_init_lock:
+            if self._async_initialized:
+                return
+            await self._initialize_async_components()
+
+    async def _initialize_async_components(self):
+        """Load the GitHub token and initialize the GitHub clients."""
         logger.info("Initializing async components...")
 
         try:
@@ -299,12 +309,14 @@ class GitHubProjectManagerMCPFastServer:
                     base_url=self.github_config.get("base_url"),
                     rate_limit_enabled=True,
                 )
-                # Also initialize the global client for handlers
-                initialize_github_client(github_token)
-                initialize_prd_github_client(github_token)
-                initialize_task_github_client(github_token)
-                initialize_subtask_github_client(github_token)
-                initialize_search_github_client(github_token)
+                # Also initialize the global client for handlers, sharing one
+                # connection pool so keep-alive connections are reused
+                session = self.github_client.session
+                initialize_github_client(github_token, session=session)
+                initialize_prd_github_client(github_token, session=session)
+                initialize_task_github_client(github_token, session=session)
+                initialize_subtask_github_client(github_token, session=session)
+                initialize_search_github_client(github_token, session=session)
                 logger.info(
                     "GitHub client initialized successfully for project, PRD, task, subtask, and search handlers"
                 )
@@ -323,9 +335,10 @@ class GitHubProjectManagerMCPFastServer:
         """Register all MCP tools with FastMCP."""
         logger.info("Registering MCP tools...")
 
-        # Test connection tool
+        # Test connection tool. It does no I/O, so it is registered as a plain
+        # function and FastMCP invokes it directly instead of awaiting it.
         @self.mcp.tool()
-        async def test_connection(message: str = "No message provided") -> str:
+        def test_connection(message: str = "No message provided") -> str:
             """Test the MCP server connection."""
             logger.info(f"Test connection called with message: {message}")
             return f"GitHub Project Manager MCP Server is running! Received: {message}"
@@ -32,6 +32,14 @@ class PRDPriority(Enum):
     CRITICAL = "Critical"
 
 
+# Option name -> enum member lookups, avoiding Enum.__call__ and its
+# exception path when parsing single-select field values
+_STATUS_BY_VALUE: Dict[str, PRDStatus] = {status.value: status for status in PRDStatus}
+_PRIORITY_BY_VALUE: Dict[str, PRDPriority] = {
+    priority.value: priority for priority in PRDPriority
+}
+
+
 @dataclass
 class PRD:
     """
@@ -145,15 +153,9 @@ class PRD:
                 value = option_name
 
                 if field_name in ["status", "state"]:
-                    try:
-                        status = PRDStatus(option_name)
-                    except ValueError:
-                        status = PRDStatus.BACKLOG
+                    status = _STATUS_BY_VALUE.get(option_name, PRDStatus.BACKLOG)
                 elif field_name == "priority":
-                    try:
-                        priority = PRDPriority(option_name)
-                    except ValueError:
-                        priority = PRDPriority.MEDIUM
+                    priority = _PRIORITY_BY_VALUE.get(option_name, PRDPriority.MEDIUM)
 
             if value is not None:
                 custom_fields[field_name] = value
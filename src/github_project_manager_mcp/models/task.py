@@ -6,9 +6,11 @@ including status tracking, priority management, parent PRD relationship, and
 comprehensive metadata handling.
 """
 
+import sys
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
+from operator import attrgetter
 from typing import Any, Dict, List, Optional
 
 
@@ -32,14 +34,60 @@ class TaskPriority(Enum):
     CRITICAL = "Critical"
 
 
-@dataclass
+# Option name -> enum member lookups, avoiding Enum.__call__ and its
+# exception path when parsing single-select field values
+_STATUS_BY_VALUE: Dict[str, TaskStatus] = {
+    status.value: status for status in TaskStatus
+}
+_PRIORITY_BY_VALUE: Dict[str, TaskPriority] = {
+    priority.value: priority for priority in TaskPriority
+}
+
+# Lower-cased project field names mapped to the Task attribute they populate,
+# one table per field value type, so each field is routed with a single lookup
+_TEXT_FIELD_TARGETS = {
+    "parent prd": "parent_prd_id",
+    "parent_prd": "parent_prd_id",
+    "prd": "parent_prd_id",
+}
+_NUMBER_FIELD_TARGETS = {
+    "estimated hours": "estimated_hours",
+    "estimated_hours": "estimated_hours",
+    "actual hours": "actual_hours",
+    "actual_hours": "actual_hours",
+}
+_SELECT_FIELD_TARGETS = {
+    "status": ("status", _STATUS_BY_VALUE, TaskStatus.TODO),
+    "state": ("status", _STATUS_BY_VALUE, TaskStatus.TODO),
+    "priority": ("priority", _PRIORITY_BY_VALUE, TaskPriority.MEDIUM),
+}
+
+# Fields that Task.to_dict() includes only when they are set
+_OPTIONAL_DICT_FIELDS = (
+    "description",
+    "estimated_hours",
+    "actual_hours",
+    "created_at",
+    "updated_at",
+    "creator_login",
+    "assignee_login",
+    "content_id",
+    "content_url",
+    "content_type",
+    "position",
+)
+_get_optional_dict_values = attrgetter(*_OPTIONAL_DICT_FIELDS)
+
+
+@dataclass(slots=True)
 class Task:
     """
     Represents a Task as a GitHub Projects v2 item with relationship to parent PRD.
 
     This model maps to GitHub GraphQL API ProjectV2Item objects that represent
     Tasks with custom fields for status, priority, parent PRD relationship,
-    and time tracking metadata.
+    and time tracking metadata. Instances use slots, since pages of Tasks are
+    held in memory at once and no per-instance attributes are needed.
     """
 
     # Required fields
@@ -124,28 +172,26 @@ class Task:
         # Extract field values (GitHub Projects v2 custom fields)
         field_values = item_data.get("fieldValues", {}).get("nodes", [])
         custom_fields = {}
-        status = TaskStatus.TODO
-        priority = TaskPriority.MEDIUM
-        parent_prd_id = None
-        estimated_hours = None
-        actual_hours = None
+        known_fields: Dict[str, Any] = {}
 
         for field_value in field_values:
-            field_name = field_value.get("field", {}).get("name", "").lower()
+            # Interned: the same few names key custom_fields on every Task
+            field_name = sys.intern(
+                field_value.get("field", {}).get("name", "").lower()
+            )
             value = None
 
             # Handle different field types
             if "text" in field_value:
                 value = field_value["text"]
-                # Special handling for parent PRD field
-                if field_name in ["parent prd", "parent_prd", "prd"]:
-                    parent_prd_id = value
+                target = _TEXT_FIELD_TARGETS.get(field_name)
+                if target:
+                    known_fields[target] = value
             elif "number" in field_value:
                 value = field_value["number"]
-                if field_name in ["estimated hours", "estimated_hours"]:
-                    estimated_hours = value
-                elif field_name in ["actual hours", "actual_hours"]:
-                    actual_hours = value
+                target = _NUMBER_FIELD_TARGETS.get(field_name)
+                if target:
+                    known_fields[target] = value
             elif "date" in field_value:
                 value = field_value["date"]
             elif "name" in field_value or "singleSelectOption" in field_value:
@@ -160,21 +206,16 @@ class Task:
                     )
                 value = option_name
 
-                if field_name in ["status", "state"]:
-                    try:
-                        status = TaskStatus(option_name)
-                    except ValueError:
-                        status = TaskStatus.TODO
-                elif field_name == "priority":
-                    try:
-                        priority = TaskPriority(option_name)
-                    except ValueError:
-                        priority = TaskPriority.MEDIUM
+                select_target = _SELECT_FIELD_TARGETS.get(field_name)
+                if select_target:
+                    target, members, default = select_target
+                    known_fields[target] = members.get(option_name, default)
 
             if value is not None:
                 custom_fields[field_name] = value
 
         # Validate that parent PRD is specified
+        parent_prd_id = known_fields.get("parent_prd_id")
         if not parent_prd_id:
             raise ValueError("Task must have a parent PRD specified")
 
@@ -188,16 +229,16 @@ class Task:
             if assignees:
                 assignee_login = assignees[0].get("login")
 
-        return cls(
+        task = cls(
             id=item_data["id"],
             project_id=project_id,
             parent_prd_id=parent_prd_id,
             title=title,
             description=description,
-            status=status,
-            priority=priority,
-            estimated_hours=estimated_hours,
-            actual_hours=actual_hours,
+            status=known_fields.get("status", TaskStatus.TODO),
+            priority=known_fields.get("priority", TaskPriority.MEDIUM),
+            estimated_hours=known_fields.get("estimated_hours"),
+            actual_hours=known_fields.get("actual_hours"),
             created_at=item_data.get("createdAt"),
             updated_at=item_data.get("updatedAt"),
             creator_login=creator_login,
@@ -210,6 +251,12 @@ class Task:
             custom_fields=custom_fields,
         )
 
+        # Many Tasks share a project and parent PRD; keep one copy of each ID.
+        # Interned only after __post_init__ has checked they are non-empty
+        task.project_id = sys.intern(task.project_id)
+        task.parent_prd_id = sys.intern(task.parent_prd_id)
+        return task
+
     def to_dict(self) -> Dict[str, Any]:
         """
         Convert the Task instance to a dictionary.
@@ -228,24 +275,13 @@ class Task:
         }
 
         # Add optional fields if they have values
-        optional_fields = [
-            "description",
-            "estimated_hours",
-            "actual_hours",
-            "created_at",
-            "updated_at",
-            "creator_login",
-            "assignee_login",
-            "content_id",
-            "content_url",
-            "content_type",
-            "position",
-        ]
-
-        for field_name in optional_fields:
-            value = getattr(self, field_name)
-            if value is not None:
-                result[field_name] = value
+        result.update(
+            (field_name, value)
+            for field_name, value in zip(
+                _OPTIONAL_DICT_FIELDS, _get_optional_dict_values(self)
+            )
+            if value is not None
+        )
 
         # Add custom fields
         if self.custom_fields:
@@ -263,6 +299,10 @@ class Task:
             return False
         return self.id == other.id
 
+    def __hash__(self) -> int:
+        """Hash consistent with ID-based equality (str caches its own hash)."""
+        return hash(self.id)
+
     # Time tracking and progress methods
     def is_overestimated(self) -> bool:
         """Check if actual hours exceed estimated hours."""
@@ -8,10 +8,124 @@ field selection, and proper parameter validation.
 
 import json
 import logging
+from functools import lru_cache
+from json.encoder import encode_basestring_ascii
 from typing import List, Optional
 
 logger = logging.getLogger(__name__)
 
+# Named fragments shared by item-listing queries. Queries reference them with
+# ``...FragmentName`` and append the definitions once, so the selection is
+# written (and sent) once per document instead of being inlined repeatedly.
+ASSIGNEE_FIELDS_FRAGMENT = """
+fragment AssigneeFields on UserConnection {
+  totalCount
+  nodes {
+    login
+    name
+  }
+}
+""".strip()
+
+PROJECT_ITEM_FIELDS_FRAGMENT = """
+fragment ProjectItemFields on ProjectV2Item {
+  id
+  createdAt
+  updatedAt
+  content {
+    ... on DraftIssue {
+      id
+      title
+      body
+      createdAt
+      updatedAt
+      assignees(first: 50) {
+        ...AssigneeFields
+      }
+    }
+    ... on Issue {
+      id
+      title
+      body
+      number
+      state
+      createdAt
+      updatedAt
+      assignees(first: 50) {
+        ...AssigneeFields
+      }
+      repository {
+        name
+        owner {
+          login
+        }
+      }
+    }
+  }
+  fieldValues(first: 10) {
+    nodes {
+      ... on ProjectV2ItemFieldTextValue {
+        text
+        field {
+          ... on ProjectV2Field {
+            name
+          }
+        }
+      }
+      ... on ProjectV2ItemFieldSingleSelectValue {
+        name
+        field {
+          ... on ProjectV2SingleSelectField {
+            name
+          }
+        }
+      }
+    }
+  }
+}
+""".strip()
+
+_PAGE_INFO_SELECTION = """
+        pageInfo {
+          hasNextPage
+          hasPreviousPage
+          startCursor
+          endCursor
+        }"""
+
+
+@lru_cache(maxsize=None)
+def _project_items_query_template(paginated: bool) -> str:
+    """
+    Build the project item listing document once per pagination shape.
+
+    The returned template carries ``%(project_id)s`` and ``%(pagination_args)s``
+    placeholders, so callers only substitute the already-escaped arguments.
+
+    Args:
+        paginated: Whether the query requests pageInfo
+
+    Returns:
+        Query document template including its fragment definitions
+    """
+    pagination_info = _PAGE_INFO_SELECTION if paginated else ""
+    query = f"""
+query {{
+  node(id: %(project_id)s) {{
+    ... on ProjectV2 {{
+      title
+      items%(pagination_args)s {{
+        totalCount{pagination_info}
+        nodes {{
+          ...ProjectItemFields
+        }}
+      }}
+    }}
+  }}
+}}
+""".strip()
+    return "\n\n".join((query, PROJECT_ITEM_FIELDS_FRAGMENT, ASSIGNEE_FIELDS_FRAGMENT))
+
 
 class ProjectQueryBuilder:
     """
@@ -46,9 +160,23 @@ class ProjectQueryBuilder:
         """Escape a string for use in GraphQL queries."""
         if value is None:
             return '""'
-        # Use JSON encoding to properly escape quotes and special characters
+        # JSON string escaping is valid GraphQL string escaping. For strings,
+        # call the encoder's C routine directly instead of going through
+        # json.dumps(), which re-dispatches on type for every call.
+        if isinstance(value, str):
+            return encode_basestring_ascii(value)
         return json.dumps(value)
 
+    def _project_items_query(
+        self, project_id: str, first: Optional[int], after: Optional[str]
+    ) -> str:
+        """Fill the cached project item listing template for one request."""
+        template = _project_items_query_template(first is not None or after is not None)
+        return template % {
+            "project_id": self._escape_string(project_id),
+            "pagination_args": self._build_pagination_args(first, after),
+        }
+
     def _build_fields_fragment(self, fields: Optional[List[str]] = None) -> str:
         """Build a fields fragment for GraphQL queries."""
         if fields is None:
@@ -473,93 +601,7 @@ mutation {{
         if not project_id:
             raise ValueError("Project ID is required")
 
-        pagination_args = self._build_pagination_args(first, after)
-
-        pagination_info = ""
-        if first is not None or after is not None:
-            pagination_info = """
-        pageInfo {
-          hasNextPage
-          hasPreviousPage
-          startCursor
-          endCursor
-        }"""
-
-        query = f"""
-query {{
-  node(id: {self._escape_string(project_id)}) {{
-    ... on ProjectV2 {{
-      title
-      items{pagination_args} {{
-        totalCount{pagination_info}
-        nodes {{
-          id
-          createdAt
-          updatedAt
-          content {{
-            ... on DraftIssue {{
-              id
-              title
-              body
-              createdAt
-              updatedAt
-              assignees(first: 50) {{
-                totalCount
-                nodes {{
-                  login
-                  name
-                }}
-              }}
-            }}
-            ... on Issue {{
-              id
-              title
-              body
-              number
-              state
-              createdAt
-              updatedAt
-              assignees(first: 50) {{
-                totalCount
-                nodes {{
-                  login
-                  name
-                }}
-              }}
-              repository {{
-                name
-                owner {{
-                  login
-                }}
-              }}
-            }}
-          }}
-          fieldValues(first: 10) {{
-            nodes {{
-              ... on ProjectV2ItemFieldTextValue {{
-                text
-                field {{
-                  ... on ProjectV2Field {{
-                    name
-                  }}
-                }}
-              }}
-              ... on ProjectV2ItemFieldSingleSelectValue {{
-                name
-                field {{
-                  ... on ProjectV2SingleSelectField {{
-                    name
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-  }}
-}}
-""".strip()
+        query = self._project_items_query(project_id, first, after)
 
         logger.debug(f"Built list PRDs in project query for ID: {project_id}")
         return query
@@ -592,97 +634,11 @@ query {{
         if not project_id:
             raise ValueError("Project ID is required")
 
-        pagination_args = self._build_pagination_args(first, after)
-
-        pagination_info = ""
-        if first is not None or after is not None:
-            pagination_info = """
-        pageInfo {
-          hasNextPage
-          hasPreviousPage
-          startCursor
-          endCursor
-        }"""
-
         # Note: GitHub Projects v2 API doesn't support GraphQL-level filtering by field values.
         # When parent_prd_id is specified, we fetch more items to compensate for client-side filtering.
         # This improves the likelihood of returning meaningful results after filtering.
 
-        query = f"""
-query {{
-  node(id: {self._escape_string(project_id)}) {{
-    ... on ProjectV2 {{
-      title
-      items{pagination_args} {{
-        totalCount{pagination_info}
-        nodes {{
-          id
-          createdAt
-          updatedAt
-          content {{
-            ... on DraftIssue {{
-              id
-              title
-              body
-              createdAt
-              updatedAt
-              assignees(first: 50) {{
-                totalCount
-                nodes {{
-                  login
-                  name
-                }}
-              }}
-            }}
-            ... on Issue {{
-              id
-              title
-              body
-              number
-              state
-              createdAt
-              updatedAt
-              assignees(first: 50) {{
-                totalCount
-                nodes {{
-                  login
-                  name
-                }}
-              }}
-              repository {{
-                name
-                owner {{
-                  login
-                }}
-              }}
-            }}
-          }}
-          fieldValues(first: 10) {{
-            nodes {{
-              ... on ProjectV2ItemFieldTextValue {{
-                text
-                field {{
-                  ... on ProjectV2Field {{
-                    name
-                  }}
-                }}
-              }}
-              ... on ProjectV2ItemFieldSingleSelectValue {{
-                name
-                field {{
-                  ... on ProjectV2SingleSelectField {{
-                    name
-                  }}
-                }}
-              }}
-            }}
-          }}
-        }}
-      }}
-    }}
-  }}
-}}
-""".strip()
+        query = self._project_items_query(project_id, first, after)
 
         logger.debug(
             f"Built list tasks in project query for ID: {project_id}, parent PRD: {parent_prd_id}"
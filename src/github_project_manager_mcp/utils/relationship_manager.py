@@ -5,14 +5,64 @@ This module provides utilities for managing hierarchical relationships
 between PRDs, Tasks, and Subtasks in GitHub Projects v2.
 """
 
+import copy
 import logging
+import re
+import time
+from collections import Counter, OrderedDict
 from dataclasses import dataclass
 from typing import Any, Dict, List, Optional, Set, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Fetches one item's content; shared by every single-item lookup so that
+# RelationshipManager._fetch_item can reuse a response across callers
+_ITEM_CONTENT_QUERY = """
+query($itemId: ID!) {
+    node(id: $itemId) {
+        ... on ProjectV2Item {
+            id
+            content {
+                ... on Issue {
+                    id
+                    title
+                    body
+                }
+                ... on DraftIssue {
+                    id
+                    title
+                    body
+                }
+            }
+        }
+    }
+}
+"""
+
+# Lower-cased status values that count as complete
+_COMPLETE_STATUSES = frozenset(("complete", "done"))
+
+# Body metadata references, compiled once for the per-item parsing loops
+_PARENT_PRD_RE = re.compile(r"\*\*Parent PRD:\*\*\s*(\w+)")
+_PARENT_TASK_RE = re.compile(r"\*\*Parent Task:\*\*\s*(\w+)")
+_TYPE_RE = re.compile(r"\*\*Type:\*\*\s*(\w+)")
+_ORDER_RE = re.compile(r"\*\*Order:\*\*\s*(\d+)")
+
+# DFS states used by check_dependency_cycles
+_UNVISITED, _ON_PATH, _DONE = range(3)
 
-@dataclass
+# Body metadata patterns tried in order by _get_completion_status_from_body
+_BODY_STATUS_PATTERNS = tuple(
+    re.compile(pattern, re.IGNORECASE)
+    for pattern in (
+        r"\*\*Status:\*\*\s*([^\n\r]+)",
+        r"Status:\s*([^\n\r]+)",
+        r"\*\*Completion:\*\*\s*([^\n\r]+)",
+    )
+)
+
+
+@dataclass(frozen=True, slots=True)
 class RelationshipValidationResult:
     """Result of relationship validation operations."""
 
@@ -25,15 +75,66 @@ class RelationshipValidationResult:
 class RelationshipManager:
     """Manages hierarchical relationships between PRDs, tasks, and subtasks."""
 
-    def __init__(self, github_client=None):
+    def __init__(
+        self,
+        github_client=None,
+        cache_size: int = 128,
+        cache_ttl: float = 0.0,
+    ):
         """Initialize the relationship manager.
 
+        Item lookups are only cached when ``cache_ttl`` is positive. Writes made
+        through other GitHub clients (each handler module builds its own) do not
+        clear this cache, so enable it only for short-lived managers that can
+        tolerate item content up to ``cache_ttl`` seconds old.
+
         Args:
             github_client: GitHub client for API operations
+            cache_size: Maximum number of item lookups kept for reuse
+            cache_ttl: Seconds a cached item lookup stays valid; 0 disables caching
         """
         self.github_client = github_client
+        self.cache_size = cache_size
+        self.cache_ttl = cache_ttl
+        # (project_id, item_id) -> (fetched_at, response), least recently used first
+        self._item_cache: OrderedDict = OrderedDict()
         logger.info("RelationshipManager initialized")
 
+    async def _fetch_item(self, project_id: str, item_id: str) -> Dict[str, Any]:
+        """Query a single item's content, reusing a recent lookup of the same item.
+
+        Only responses for items that exist are cached, so a missing item is
+        looked up again on the next call. The cache keeps its own copy of each
+        response and hands out copies, so callers may modify what they get.
+
+        Args:
+            project_id: GitHub project ID
+            item_id: Project item ID
+
+        Returns:
+            Dict[str, Any]: GraphQL response data with the item under "node"
+        """
+        key = (project_id, item_id)
+        now = time.monotonic()
+        cached = self._item_cache.get(key)
+        if cached is not None and now - cached[0] < self.cache_ttl:
+            self._item_cache.move_to_end(key)
+            return copy.deepcopy(cached[1])
+
+        response = await self.github_client.query(
+            _ITEM_CONTENT_QUERY, {"itemId": item_id}
+        )
+        if self.cache_ttl > 0 and response and response.get("node"):
+            self._item_cache[key] = (now, copy.deepcopy(response))
+            self._item_cache.move_to_end(key)
+            if len(self._item_cache) > self.cache_size:
+                self._item_cache.popitem(last=False)
+        return response
+
+    def clear_cache(self) -> None:
+        """Drop all cached item lookups."""
+        self._item_cache.clear()
+
     async def validate_prd_task_relationship(
         self, project_id: str, prd_item_id: str, task_item_id: str
     ) -> RelationshipValidationResult:
@@ -69,27 +170,8 @@ class RelationshipManager:
                 f"Validating PRD-Task relationship: PRD={prd_item_id}, Task={task_item_id}"
             )
 
-            # Query the task to get its content and check parent PRD reference
-            task_query = """
-            query($taskId: ID!) {
-                node(id: $taskId) {
-                    ... on ProjectV2Item {
-                        id
-                        content {
-                            ... on DraftIssue {
-                                id
-                                title
-                                body
-                            }
-                        }
-                    }
-                }
-            }
-            """
-
-            task_response = await self.github_client.query(
-                task_query, {"taskId": task_item_id}
-            )
+            # Fetch the task to get its content and check parent PRD reference
+            task_response = await self._fetch_item(project_id, task_item_id)
 
             if not task_response or "node" not in task_response:
                 errors.append(f"Task not found: {task_item_id}")
@@ -115,10 +197,7 @@ class RelationshipManager:
             task_body = task_content["body"] or ""
 
             # Look for parent PRD reference in task body
-            import re
-
-            prd_pattern = r"\*\*Parent PRD:\*\*\s*(\w+)"
-            prd_match = re.search(prd_pattern, task_body)
+            prd_match = _PARENT_PRD_RE.search(task_body)
 
             if not prd_match:
                 errors.append(f"Task {task_item_id} has no parent PRD reference")
@@ -191,27 +270,8 @@ class RelationshipManager:
                 f"Validating Task-Subtask relationship: Task={task_item_id}, Subtask={subtask_item_id}"
             )
 
-            # Query the subtask to get its content and check parent task reference
-            subtask_query = """
-            query($subtaskId: ID!) {
-                node(id: $subtaskId) {
-                    ... on ProjectV2Item {
-                        id
-                        content {
-                            ... on DraftIssue {
-                                id
-                                title
-                                body
-                            }
-                        }
-                    }
-                }
-            }
-            """
-
-            subtask_response = await self.github_client.query(
-                subtask_query, {"subtaskId": subtask_item_id}
-            )
+            # Fetch the subtask to get its content and check parent task reference
+            subtask_response = await self._fetch_item(project_id, subtask_item_id)
 
             if not subtask_response or "node" not in subtask_response:
                 errors.append(f"Subtask not found: {subtask_item_id}")
@@ -237,10 +297,7 @@ class RelationshipManager:
             subtask_body = subtask_content["body"] or ""
 
             # Look for parent task reference in subtask body
-            import re
-
-            task_pattern = r"\*\*Parent Task:\*\*\s*(\w+)"
-            task_match = re.search(task_pattern, subtask_body)
+            task_match = _PARENT_TASK_RE.search(subtask_body)
 
             if not task_match:
                 errors.append(f"Subtask {subtask_item_id} has no parent task reference")
@@ -336,10 +393,6 @@ class RelationshipManager:
             children = []
 
             # Filter items to find tasks that belong to this PRD
-            import re
-
-            prd_pattern = r"\*\*Parent PRD:\*\*\s*(\w+)"
-
             for item in items:
                 if not item or "content" not in item:
                     continue
@@ -349,7 +402,7 @@ class RelationshipManager:
                     continue
 
                 body = content["body"] or ""
-                prd_match = re.search(prd_pattern, body)
+                prd_match = _PARENT_PRD_RE.search(body)
 
                 if prd_match and prd_match.group(1) == prd_item_id:
                     children.append(
@@ -427,10 +480,6 @@ class RelationshipManager:
             children = []
 
             # Filter items to find subtasks that belong to this task
-            import re
-
-            task_pattern = r"\*\*Parent Task:\*\*\s*(\w+)"
-
             for item in items:
                 if not item or "content" not in item:
                     continue
@@ -440,12 +489,11 @@ class RelationshipManager:
                     continue
 
                 body = content["body"] or ""
-                task_match = re.search(task_pattern, body)
+                task_match = _PARENT_TASK_RE.search(body)
 
                 if task_match and task_match.group(1) == task_item_id:
                     # Extract order from subtask body if present
-                    order_pattern = r"\*\*Order:\*\*\s*(\d+)"
-                    order_match = re.search(order_pattern, body)
+                    order_match = _ORDER_RE.search(body)
                     order = int(order_match.group(1)) if order_match else 0
 
                     children.append(
@@ -543,12 +591,6 @@ class RelationshipManager:
             subtasks = []
             orphaned_items = []
 
-            import re
-
-            prd_pattern = r"\*\*Parent PRD:\*\*\s*(\w+)"
-            task_pattern = r"\*\*Parent Task:\*\*\s*(\w+)"
-            type_pattern = r"\*\*Type:\*\*\s*(\w+)"
-
             for item in items:
                 if not item or "content" not in item:
                     continue
@@ -561,9 +603,9 @@ class RelationshipManager:
                 body = content["body"] or ""
 
                 # Check if it's a subtask
-                type_match = re.search(type_pattern, body)
+                type_match = _TYPE_RE.search(body)
                 if type_match and type_match.group(1).lower() == "subtask":
-                    task_match = re.search(task_pattern, body)
+                    task_match = _PARENT_TASK_RE.search(body)
                     if task_match:
                         subtasks.append(
                             {
@@ -578,8 +620,7 @@ class RelationshipManager:
                             f"Subtask {item['id']} has no parent task reference"
                         )
                 # Check if it's a task (contains "Task" in title but also has Parent PRD reference)
-                elif re.search(prd_pattern, body):
-                    prd_match = re.search(prd_pattern, body)
+                elif prd_match := _PARENT_PRD_RE.search(body):
                     tasks.append(
                         {
                             "id": item["id"],
@@ -1557,10 +1598,7 @@ class RelationshipManager:
         Returns:
             str: Parent PRD ID or empty string if not found
         """
-        import re
-
-        pattern = r"\*\*Parent PRD:\*\*\s*([A-Za-z0-9_]+)"
-        match = re.search(pattern, body)
+        match = _PARENT_PRD_RE.search(body)
         return match.group(1) if match else ""
 
     def _extract_parent_task_id(self, body: str) -> str:
@@ -1572,10 +1610,7 @@ class RelationshipManager:
         Returns:
             str: Parent task ID or empty string if not found
         """
-        import re
-
-        pattern = r"\*\*Parent Task:\*\*\s*([A-Za-z0-9_]+)"
-        match = re.search(pattern, body)
+        match = _PARENT_TASK_RE.search(body)
         return match.group(1) if match else ""
 
     async def check_and_complete_parent_task(
@@ -1638,7 +1673,7 @@ class RelationshipManager:
                                 status = field_value.get(
                                     "value", ""
                                 ) or field_value.get("name", "")
-                                if status and status.lower() in ["done", "complete"]:
+                                if status and status.lower() in _COMPLETE_STATUSES:
                                     metadata["completion_attempted"] = False
                                     metadata["reason"] = "Task is already complete"
                                     return RelationshipValidationResult(
@@ -1716,6 +1751,9 @@ class RelationshipManager:
                 except Exception as e:
                     # Mutation might fail due to placeholder IDs, but we still mark as attempted
                     warnings.append(f"Task completion mutation failed: {str(e)}")
+                finally:
+                    # The write may have changed items this manager has cached
+                    self.clear_cache()
 
                 metadata["completion_attempted"] = True
                 metadata["completed"] = True
@@ -1770,21 +1808,12 @@ class RelationshipManager:
                     is_valid=True, errors=errors, warnings=warnings, metadata=metadata
                 )
 
-            # Check if all tasks are complete
-            all_complete = True
-            complete_count = 0
-            for task in tasks:
-                # Check completion status from body (get_prd_children returns body directly)
-                status_from_body = self._get_completion_status_from_body(
-                    task.get("body", "")
-                )
-                if status_from_body and status_from_body.lower() in [
-                    "complete",
-                    "done",
-                ]:
-                    complete_count += 1
-                else:
-                    all_complete = False
+            # Count complete tasks in one pass over the children already fetched
+            # (get_prd_children returns body directly)
+            complete_count = sum(
+                1 for task in tasks if self._is_body_complete(task.get("body", ""))
+            )
+            all_complete = complete_count == len(tasks)
 
             metadata["total_tasks"] = len(tasks)
             metadata["complete_tasks"] = complete_count
@@ -1820,6 +1849,9 @@ class RelationshipManager:
                 except Exception as e:
                     # Mutation might fail due to placeholder IDs, but we still mark as attempted
                     warnings.append(f"PRD completion mutation failed: {str(e)}")
+                finally:
+                    # The write may have changed items this manager has cached
+                    self.clear_cache()
 
                 metadata["completion_attempted"] = True
                 metadata["completed"] = True
@@ -1879,23 +1911,7 @@ class RelationshipManager:
                 metadata["action"] = "Cascade completion check initiated for subtask"
 
                 # Get the subtask to find its parent task
-                subtask_query = """
-                query($itemId: ID!) {
-                    node(id: $itemId) {
-                        ... on ProjectV2Item {
-                            content {
-                                ... on DraftIssue {
-                                    body
-                                }
-                            }
-                        }
-                    }
-                }
-                """
-
-                subtask_response = await self.github_client.query(
-                    subtask_query, {"itemId": completed_item_id}
-                )
+                subtask_response = await self._fetch_item(project_id, completed_item_id)
                 if subtask_response and "node" in subtask_response:
                     subtask_body = subtask_response["node"]["content"]["body"]
                     parent_task_id = self._extract_parent_task_id(subtask_body)
@@ -1938,23 +1954,7 @@ class RelationshipManager:
                 metadata["action"] = "Cascade completion check initiated for task"
 
                 # Get the task to find its parent PRD
-                task_query = """
-                query($itemId: ID!) {
-                    node(id: $itemId) {
-                        ... on ProjectV2Item {
-                            content {
-                                ... on DraftIssue {
-                                    body
-                                }
-                            }
-                        }
-                    }
-                }
-                """
-
-                task_response = await self.github_client.query(
-                    task_query, {"itemId": completed_item_id}
-                )
+                task_response = await self._fetch_item(project_id, completed_item_id)
                 if task_response and "node" in task_response:
                     task_body = task_response["node"]["content"]["body"]
                     parent_prd_id = self._extract_parent_prd_id(task_body)
@@ -2013,17 +2013,8 @@ class RelationshipManager:
         if not body:
             return ""
 
-        import re
-
-        # Look for status patterns
-        patterns = [
-            r"\*\*Status:\*\*\s*([^\n\r]+)",
-            r"Status:\s*([^\n\r]+)",
-            r"\*\*Completion:\*\*\s*([^\n\r]+)",
-        ]
-
-        for pattern in patterns:
-            match = re.search(pattern, body, re.IGNORECASE)
+        for pattern in _BODY_STATUS_PATTERNS:
+            match = pattern.search(body)
             if match:
                 return match.group(1).strip()
 
@@ -2042,25 +2033,118 @@ class RelationshipManager:
         if not item:
             return False
 
-        # Check field values first (preferred method)
+        # Check field values first (preferred method); a set Status field is
+        # authoritative, so the body is only parsed when there is none
         field_values = item.get("fieldValues", {}).get("nodes", [])
         for field_value in field_values:
             field = field_value.get("field", {})
             if field.get("name") == "Status":
                 # Check both 'name' (new format) and 'value' (old format)
                 status = field_value.get("name") or field_value.get("value", "")
-                if status and status.lower() in ["complete", "done"]:
-                    return True
+                if status:
+                    return status.lower() in _COMPLETE_STATUSES
+                break
 
         # Fallback to body content
         content = item.get("content", {})
         if content and content.get("body"):
-            status = self._get_completion_status_from_body(content.get("body"))
-            if status and status.lower() in ["complete", "done"]:
-                return True
+            return self._is_body_complete(content.get("body"))
 
         return False
 
+    def _is_body_complete(self, body: str) -> bool:
+        """Check whether item body metadata marks the item complete.
+
+        Args:
+            body: Item body content
+
+        Returns:
+            bool: True if the body's status is complete or done
+        """
+        status = self._get_completion_status_from_body(body)
+        return bool(status) and status.lower() in _COMPLETE_STATUSES
+
+    @staticmethod
+    def _progress_metadata(
+        completed_count: int, total_count: int, noun: str
+    ) -> Dict[str, Any]:
+        """Build progress metadata for ``completed_count`` of ``total_count``.
+
+        Args:
+            completed_count: Number of completed children
+            total_count: Number of children
+            noun: Child kind used in the count keys ("tasks" or "subtasks")
+
+        Returns:
+            Dict with total/completed counts, percentage and overall status
+        """
+        if not total_count:
+            return {
+                f"total_{noun}": 0,
+                f"completed_{noun}": 0,
+                "progress_percentage": 0,
+                "status": "Not Started",
+            }
+
+        if completed_count == 0:
+            status = "Not Started"
+        elif completed_count == total_count:
+            status = "Complete"
+        else:
+            status = "In Progress"
+
+        return {
+            f"total_{noun}": total_count,
+            f"completed_{noun}": completed_count,
+            "progress_percentage": round((completed_count / total_count) * 100, 2),
+            "status": status,
+        }
+
+    def _prd_progress_from_items(self, items: list, prd_item_id: str) -> dict:
+        """Calculate PRD progress metadata from already-fetched project items.
+
+        Args:
+            items: Project item nodes including content body and field values
+            prd_item_id: PRD item ID
+
+        Returns:
+            Progress metadata as built by _progress_metadata
+        """
+        total_count = 0
+        completed_count = 0
+        for item in items:
+            content = item.get("content", {})
+            body = content.get("body", "") if content else ""
+
+            # Check if this is a task with the right parent PRD
+            if (
+                "**Parent PRD:**" in body
+                and self._extract_parent_prd_id(body) == prd_item_id
+            ):
+                total_count += 1
+                if self._is_item_complete(item):
+                    completed_count += 1
+
+        return self._progress_metadata(completed_count, total_count, "tasks")
+
+    def _subtask_progress(self, bodies) -> dict:
+        """Calculate task progress metadata from its subtasks' body content.
+
+        Args:
+            bodies: Iterable of subtask body strings
+
+        Returns:
+            Progress metadata as built by _progress_metadata
+        """
+        total_count = 0
+        completed_count = 0
+        for body in bodies:
+            total_count += 1
+            if self._is_body_complete(body):
+                completed_count += 1
+
+        return self._progress_metadata(completed_count, total_count, "subtasks")
+
     async def calculate_prd_progress(
         self, project_id: str, prd_item_id: str
     ) -> RelationshipValidationResult:
@@ -2142,56 +2226,12 @@ class RelationshipManager:
             response = await self.github_client.query(query, {"projectId": project_id})
             items = response.get("node", {}).get("items", {}).get("nodes", [])
 
-            # Filter tasks that belong to this PRD
-            prd_tasks = []
-            for item in items:
-                content = item.get("content", {})
-                body = content.get("body", "") if content else ""
-
-                # Check if this is a task with the right parent PRD
-                if "**Parent PRD:**" in body and prd_item_id in body:
-                    prd_tasks.append(item)
-
-            if not prd_tasks:
-                return RelationshipValidationResult(
-                    is_valid=True,
-                    errors=[],
-                    warnings=["No tasks found for PRD"],
-                    metadata={
-                        "total_tasks": 0,
-                        "completed_tasks": 0,
-                        "progress_percentage": 0,
-                        "status": "Not Started",
-                    },
-                )
-
-            # Count completed tasks
-            completed_count = 0
-            for task in prd_tasks:
-                if self._is_item_complete(task):
-                    completed_count += 1
-
-            total_count = len(prd_tasks)
-            progress_percentage = round((completed_count / total_count) * 100, 2)
-
-            # Determine status
-            if completed_count == 0:
-                status = "Not Started"
-            elif completed_count == total_count:
-                status = "Complete"
-            else:
-                status = "In Progress"
-
+            metadata = self._prd_progress_from_items(items, prd_item_id)
             return RelationshipValidationResult(
                 is_valid=True,
                 errors=[],
-                warnings=[],
-                metadata={
-                    "total_tasks": total_count,
-                    "completed_tasks": completed_count,
-                    "progress_percentage": progress_percentage,
-                    "status": status,
-                },
+                warnings=[] if metadata["total_tasks"] else ["No tasks found for PRD"],
+                metadata=metadata,
             )
 
         except Exception as e:
@@ -2236,49 +2276,16 @@ class RelationshipManager:
             # Get subtasks for this task
             subtasks = await self.get_task_children(project_id, task_item_id)
 
-            if not subtasks:
-                return RelationshipValidationResult(
-                    is_valid=True,
-                    errors=[],
-                    warnings=["No subtasks found for task"],
-                    metadata={
-                        "total_subtasks": 0,
-                        "completed_subtasks": 0,
-                        "progress_percentage": 0,
-                        "status": "Not Started",
-                    },
-                )
-
-            # Count completed subtasks based on subtask body metadata
-            completed_count = 0
-            for subtask in subtasks:
-                body = subtask.get("body", "")
-                # Check for completion status in body
-                status = self._get_completion_status_from_body(body)
-                if status and status.lower() in ["complete", "done"]:
-                    completed_count += 1
-
-            total_count = len(subtasks)
-            progress_percentage = round((completed_count / total_count) * 100, 2)
-
-            # Determine status
-            if completed_count == 0:
-                status = "Not Started"
-            elif completed_count == total_count:
-                status = "Complete"
-            else:
-                status = "In Progress"
-
+            metadata = self._subtask_progress(
+                subtask.get("body", "") for subtask in subtasks
+            )
             return RelationshipValidationResult(
                 is_valid=True,
                 errors=[],
-                warnings=[],
-                metadata={
-                    "total_subtasks": total_count,
-                    "completed_subtasks": completed_count,
-                    "progress_percentage": progress_percentage,
-                    "status": status,
-                },
+                warnings=(
+                    [] if metadata["total_subtasks"] else ["No subtasks found for task"]
+                ),
+                metadata=metadata,
             )
 
         except Exception as e:
@@ -2369,10 +2376,13 @@ class RelationshipManager:
             response = await self.github_client.query(query, {"projectId": project_id})
             items = response.get("node", {}).get("items", {}).get("nodes", [])
 
-            # Categorize items
+            # Categorize items and tally each parent's children in the same pass,
+            # so the progress of every PRD and task below is a dictionary lookup
             prds = []
             tasks = []
             subtasks = []
+            task_tallies = {}  # parent PRD ID -> [total, completed]
+            subtask_tallies = {}  # parent task ID -> [total, completed]
 
             for item in items:
                 content = item.get("content", {})
@@ -2386,26 +2396,38 @@ class RelationshipManager:
                 elif item_type == "Subtask":
                     subtasks.append(item)
 
-            # Calculate progress for each level
+                if "**Parent PRD:**" in body:
+                    tally = task_tallies.setdefault(
+                        self._extract_parent_prd_id(body), [0, 0]
+                    )
+                    tally[0] += 1
+                    tally[1] += self._is_item_complete(item)
+
+                parent_task_id = self._extract_parent_task_id(body)
+                if parent_task_id:
+                    tally = subtask_tallies.setdefault(parent_task_id, [0, 0])
+                    tally[0] += 1
+                    tally[1] += self._is_body_complete(body)
+
             prd_progress = {}
             for prd in prds:
                 content = prd.get("content", {})
                 prd_id = content.get("id") if content else None
                 if prd_id:
-                    progress_result = await self.calculate_prd_progress(
-                        project_id, prd_id
+                    total, completed = task_tallies.get(prd_id, (0, 0))
+                    prd_progress[prd_id] = self._progress_metadata(
+                        completed, total, "tasks"
                     )
-                    prd_progress[prd_id] = progress_result.metadata
 
             task_progress = {}
             for task in tasks:
                 content = task.get("content", {})
                 task_id = content.get("id") if content else None
                 if task_id:
-                    progress_result = await self.calculate_task_progress(
-                        project_id, task_id
+                    total, completed = subtask_tallies.get(task_id, (0, 0))
+                    task_progress[task_id] = self._progress_metadata(
+                        completed, total, "subtasks"
                     )
-                    task_progress[task_id] = progress_result.metadata
 
             # Create synchronization summary
             synchronization_summary = {
@@ -2520,34 +2542,26 @@ class RelationshipManager:
             response = await self.github_client.query(query, {"projectId": project_id})
             items = response.get("node", {}).get("items", {}).get("nodes", [])
 
-            # Categorize items and count completed ones
-            total_prds = 0
-            total_tasks = 0
-            total_subtasks = 0
-            completed_prds = 0
-            completed_tasks = 0
-            completed_subtasks = 0
+            # Categorize items and count completed ones per item type
+            totals = Counter()
+            completed = Counter()
 
             for item in items:
                 content = item.get("content", {})
                 body = content.get("body", "") if content else ""
                 item_type = self._detect_item_type(body)
 
+                totals[item_type] += 1
                 # Check if item is complete based on field values
-                is_complete = self._is_item_complete(item)
+                if self._is_item_complete(item):
+                    completed[item_type] += 1
 
-                if item_type == "PRD":
-                    total_prds += 1
-                    if is_complete:
-                        completed_prds += 1
-                elif item_type == "Task":
-                    total_tasks += 1
-                    if is_complete:
-                        completed_tasks += 1
-                elif item_type == "Subtask":
-                    total_subtasks += 1
-                    if is_complete:
-                        completed_subtasks += 1
+            total_prds = totals["PRD"]
+            total_tasks = totals["Task"]
+            total_subtasks = totals["Subtask"]
+            completed_prds = completed["PRD"]
+            completed_tasks = completed["Task"]
+            completed_subtasks = completed["Subtask"]
 
             # Calculate overall project progress
             total_items = total_prds + total_tasks + total_subtasks
@@ -2868,30 +2882,8 @@ class RelationshipManager:
                     metadata={},
                 )
 
-            # Query the specific parent item
-            query = """
-            query($itemId: ID!) {
-                node(id: $itemId) {
-                    ... on ProjectV2Item {
-                        id
-                        content {
-                            ... on Issue {
-                                id
-                                title
-                                body
-                            }
-                            ... on DraftIssue {
-                                id
-                                title
-                                body
-                            }
-                        }
-                    }
-                }
-            }
-            """
-
-            response = await self.github_client.query(query, {"itemId": parent_id})
+            # Fetch the specific parent item
+            response = await self._fetch_item(project_id, parent_id)
             parent_item = response.get("node")
 
             parent_exists = parent_item is not None
@@ -3013,43 +3005,31 @@ class RelationshipManager:
                 if parent_id and parent_id in dependency_graph:
                     dependency_graph[parent_id]["children"].append(item_id)
 
-            # Detect cycles using DFS
-            cycles_detected = False
+            # Detect cycles with an iterative three-state DFS; meeting an item
+            # that is still on the current path closes a cycle
             detected_cycles = []
-            visited = set()
-            rec_stack = set()
-
-            def has_cycle(node_id, path):
-                nonlocal cycles_detected
-                if node_id in rec_stack:
-                    # Found a cycle
-                    cycle_start = path.index(node_id)
-                    cycle = path[cycle_start:] + [node_id]
-                    detected_cycles.append(cycle)
-                    cycles_detected = True
-                    return True
-
-                if node_id in visited:
-                    return False
-
-                visited.add(node_id)
-                rec_stack.add(node_id)
-                path.append(node_id)
-
-                # Check all children
-                if node_id in dependency_graph:
-                    for child_id in dependency_graph[node_id]["children"]:
-                        if has_cycle(child_id, path):
-                            return True
-
-                rec_stack.remove(node_id)
-                path.pop()
-                return False
-
-            # Check each node for cycles
-            for node_id in dependency_graph:
-                if node_id not in visited:
-                    has_cycle(node_id, [])
+            state = dict.fromkeys(dependency_graph, _UNVISITED)
+            for root_id in dependency_graph:
+                if state[root_id] != _UNVISITED:
+                    continue
+
+                state[root_id] = _ON_PATH
+                path = [root_id]
+                stack = [iter(dependency_graph[root_id]["children"])]
+                while stack:
+                    child_id = next(stack[-1], None)
+                    if child_id is None:
+                        stack.pop()
+                        state[path.pop()] = _DONE
+                    elif state[child_id] == _ON_PATH:
+                        cycle_start = path.index(child_id)
+                        detected_cycles.append(path[cycle_start:] + [child_id])
+                    elif state[child_id] == _UNVISITED:
+                        state[child_id] = _ON_PATH
+                        path.append(child_id)
+                        stack.append(iter(dependency_graph[child_id]["children"]))
+
+            cycles_detected = bool(detected_cycles)
 
             metadata = {
                 "cycles_detected": cycles_detected,
@@ -3142,25 +3122,19 @@ class RelationshipManager:
             violations = []
             valid_items = []
 
-            # Create lookup of all content IDs
-            all_content_ids = set()
-            content_to_item = {}
-            for item in items:
-                content = item.get("content", {})
-                content_id = content.get("id") if content else None
-                if content_id:
-                    all_content_ids.add(content_id)
-                    content_to_item[content_id] = item
+            # Keep items with content, then build the content ID lookup once
+            items_with_content = [
+                (item, content)
+                for item in items
+                if (content := item.get("content")) and content.get("id")
+            ]
+            all_content_ids = {content["id"] for _, content in items_with_content}
 
             # Validate each item's constraints
-            for item in items:
-                content = item.get("content", {})
-                content_id = content.get("id") if content else None
-                body = content.get("body", "") if content else ""
-                title = content.get("title", "") if content else ""
-
-                if not content_id:
-                    continue
+            for item, content in items_with_content:
+                content_id = content["id"]
+                body = content.get("body", "")
+                title = content.get("title", "")
 
                 item_type = self._detect_item_type(body)
 
@@ -3306,16 +3280,17 @@ class RelationshipManager:
                         "type": self._detect_item_type(content.get("body", "")),
                     }
 
-            # Trace dependency chain from target upward
+            # Trace dependency chain from target upward; the seen set stops
+            # the walk if parent links loop back on themselves
             dependency_chain = []
+            seen = set()
             current_id = target_item_id
             chain_root = None
 
-            while current_id and current_id in content_to_item:
+            while current_id in content_to_item and current_id not in seen:
+                seen.add(current_id)
                 current_item = content_to_item[current_id]
-                dependency_chain.insert(
-                    0, current_item
-                )  # Insert at beginning for correct order
+                dependency_chain.append(current_item)
 
                 # Find parent
                 body = current_item["body"]
@@ -3333,6 +3308,9 @@ class RelationshipManager:
 
                 current_id = parent_id
 
+            # Collected target-first; report root-first
+            dependency_chain.reverse()
+
             metadata = {
                 "dependency_chain": dependency_chain,
                 "chain_length": len(dependency_chain),
@@ -27,6 +27,9 @@ class ValidationError(Exception):
 class ValidationResult:
     """Result of a validation operation."""
 
+    # One is built for every field checked, so skip the per-instance __dict__
+    __slots__ = ("is_valid", "errors", "warnings")
+
     def __init__(
         self,
         is_valid: bool,
@@ -53,8 +56,11 @@ class ValidationResult:
 
     def merge(self, other: "ValidationResult"):
         """Merge another validation result into this one."""
-        self.errors.extend(other.errors)
-        self.warnings.extend(other.warnings)
+        # Most merged results are clean passes with nothing to copy
+        if other.errors:
+            self.errors.extend(other.errors)
+        if other.warnings:
+            self.warnings.extend(other.warnings)
         if not other.is_valid:
             self.is_valid = False
 
@@ -620,11 +626,14 @@ class SubtaskValidator(ParameterValidator):
         return result
 
 
+# Shared instance for the convenience functions below; validators hold no state
+_parameter_validator = ParameterValidator()
+
+
 # Convenience functions for common validation patterns
 def validate_project_id(project_id: str) -> ValidationResult:
     """Validate a GitHub project ID format."""
-    validator = ParameterValidator()
-    result = validator.validate_required_string("project_id", project_id)
+    result = _parameter_validator.validate_required_string("project_id", project_id)
 
     if result.is_valid and not project_id.startswith("PVT_"):
         result.add_error("project_id must start with 'PVT_'")
@@ -634,8 +643,7 @@ def validate_project_id(project_id: str) -> ValidationResult:
 
 def validate_item_id(item_id: str, item_type: str = "item") -> ValidationResult:
     """Validate a GitHub project item ID format."""
-    validator = ParameterValidator()
-    result = validator.validate_required_string(f"{item_type}_id", item_id)
+    result = _parameter_validator.validate_required_string(f"{item_type}_id", item_id)
 
     if result.is_valid and not item_id.startswith("PVTI_"):
         result.add_error(f"{item_type}_id must start with 'PVTI_'")
@@ -647,7 +655,6 @@ def validate_pagination_params(
     first: Optional[int] = None, after: Optional[str] = None
 ) -> ValidationResult:
     """Validate pagination parameters."""
-    validator = ParameterValidator()
     result = ValidationResult(True)
 
     if first is not None:
@@ -655,7 +662,7 @@ def validate_pagination_params(
             result.add_error("'first' parameter must be an integer between 1 and 100")
 
     if after is not None:
-        after_result = validator.validate_optional_string("after", after)
+        after_result = _parameter_validator.validate_optional_string("after", after)
         result.merge(after_result)
 
     return result
@@ -8,12 +8,22 @@ Use a test GitHub token (with minimal permissions) to run these tests manually.
 
 import asyncio
 import os
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 import httpx
 import pytest
 
 
+def _json_response(payload, status_code=200, headers=None):
+    """Build a real httpx response carrying a JSON body, as session.post returns."""
+    return httpx.Response(
+        status_code,
+        json=payload,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.github.com/graphql"),
+    )
+
+
 class TestGitHubAPIIntegration:
     """Integration tests for GitHub API operations."""
 
@@ -49,13 +59,13 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {
-            "x-ratelimit-remaining": "4999",
-            "x-ratelimit-reset": "1640995200",
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data,
+            headers={
+                "x-ratelimit-remaining": "4999",
+                "x-ratelimit-reset": "1640995200",
+            },
+        )
 
         query = """
         query {
@@ -116,10 +126,9 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4998"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4998"}
+        )
 
         query = query_builder.list_projects("test-user", first=10)
 
@@ -150,10 +159,9 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4997"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4997"}
+        )
 
         mutation = query_builder.create_project(
             "MDQ6VXNlcjEyMzQ1Njc4",  # Test user ID
@@ -186,10 +194,9 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4996"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4996"}
+        )
 
         mutation = query_builder.update_project(
             "PVT_kwDOEXISTING",
@@ -246,10 +253,9 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4995"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4995"}
+        )
 
         query = query_builder.get_project_items("PVT_kwDOTESTPROJECT", first=20)
 
@@ -268,10 +274,10 @@ class TestGitHubAPIIntegration:
         github_client.requests_per_hour = 5
         github_client.request_timestamps = []
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value={"data": {"viewer": {"login": "test"}}})
-        mock_response.headers = {"x-ratelimit-remaining": "10"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {"data": {"viewer": {"login": "test"}}},
+            headers={"x-ratelimit-remaining": "10"},
+        )
 
         # Make several requests quickly
         with patch.object(github_client.session, "post", return_value=mock_response):
@@ -303,10 +309,9 @@ class TestGitHubAPIIntegration:
             ],
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4994"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4994"}
+        )
 
         invalid_query = """
         query {
@@ -328,14 +333,7 @@ class TestGitHubAPIIntegration:
     async def test_http_error_handling_integration(self, github_client):
         """Test HTTP error handling in integration context."""
         # Mock HTTP 401 Unauthorized error (realistic GitHub API error)
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError(
-                "401 Unauthorized",
-                request=Mock(url="https://api.github.com/graphql"),
-                response=Mock(status_code=401, text="Bad credentials"),
-            )
-        )
+        mock_response = _json_response({"message": "Bad credentials"}, status_code=401)
 
         query = "{ viewer { login } }"
 
@@ -378,10 +376,9 @@ class TestGitHubAPIIntegration:
             }
         }
 
-        mock_response = Mock()
-        mock_response.json = Mock(return_value=mock_response_data)
-        mock_response.headers = {"x-ratelimit-remaining": "4993"}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            mock_response_data, headers={"x-ratelimit-remaining": "4993"}
+        )
 
         query = query_builder.list_projects("test-user", first=10)
 
@@ -461,12 +458,10 @@ class TestGitHubAPIIntegration:
 
         def mock_post_side_effect(*args, **kwargs):
             nonlocal response_index
-            mock_response = Mock()
-            mock_response.json = Mock(return_value=responses[response_index])
-            mock_response.headers = {
-                "x-ratelimit-remaining": str(4990 - response_index)
-            }
-            mock_response.raise_for_status = Mock()
+            mock_response = _json_response(
+                responses[response_index],
+                headers={"x-ratelimit-remaining": str(4990 - response_index)},
+            )
             response_index += 1
             return mock_response
 
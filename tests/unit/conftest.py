@@ -2,11 +2,42 @@
 pytest configuration and fixtures specific to unit tests.
 """
 
+from collections import deque
 from unittest.mock import Mock
 
 import pytest
 
 
+class StubGitHubClient:
+    """Lightweight async GitHub client double that replays queued results.
+
+    Each ``query``/``mutate`` call pops the next queued result; the last one
+    is repeated once the queue is down to a single entry. Queued exceptions
+    are raised instead of returned. Calls are recorded as ``(args, kwargs)``.
+    """
+
+    def __init__(self):
+        self.query_results = deque()
+        self.mutate_results = deque()
+        self.query_calls = []
+        self.mutate_calls = []
+
+    async def query(self, *args, **kwargs):
+        self.query_calls.append((args, kwargs))
+        return self._next_result(self.query_results)
+
+    async def mutate(self, *args, **kwargs):
+        self.mutate_calls.append((args, kwargs))
+        return self._next_result(self.mutate_results)
+
+    @staticmethod
+    def _next_result(results):
+        result = results.popleft() if len(results) > 1 else results[0]
+        if isinstance(result, BaseException):
+            raise result
+        return result
+
+
 @pytest.fixture
 def mock_github_client():
     """Provide a mock GitHub client for unit tests."""
@@ -16,6 +47,12 @@ def mock_github_client():
     return client
 
 
+@pytest.fixture
+def stub_github_client():
+    """Provide a queue-based async GitHub client stub for unit tests."""
+    return StubGitHubClient()
+
+
 @pytest.fixture
 def mock_mcp_server():
     """Provide a mock MCP server for unit tests."""
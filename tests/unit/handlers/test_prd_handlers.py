@@ -326,14 +326,17 @@ class TestPRDHandlerRegistration:
 
     def test_prd_tools_list(self):
         """Test that PRD_TOOLS contains expected tools."""
-        tool_names = [tool.name for tool in PRD_TOOLS]
-
-        assert "add_prd_to_project" in tool_names
-        assert "list_prds_in_project" in tool_names
-        assert "delete_prd_from_project" in tool_names
-        assert "update_prd" in tool_names
-        assert "update_prd_status" in tool_names
-        assert "complete_prd" in tool_names
+        tool_names = {tool.name for tool in PRD_TOOLS}
+        expected_tools = {
+            "add_prd_to_project",
+            "list_prds_in_project",
+            "delete_prd_from_project",
+            "update_prd",
+            "update_prd_status",
+            "complete_prd",
+        }
+
+        assert not expected_tools - tool_names, expected_tools - tool_names
         assert (
             len(PRD_TOOLS) == 6
         )  # add_prd, list_prds, delete_prd, update_prd, update_prd_status, complete_prd
@@ -349,12 +352,11 @@ class TestPRDHandlerRegistration:
 
     def test_prd_tool_handlers_mapping(self):
         """Test that PRD_TOOL_HANDLERS contains handlers for all tools."""
-        tool_names = [tool.name for tool in PRD_TOOLS]
-        handler_names = list(PRD_TOOL_HANDLERS.keys())
+        tool_names = {tool.name for tool in PRD_TOOLS}
 
         # All tools should have corresponding handlers
-        for tool_name in tool_names:
-            assert tool_name in handler_names, f"No handler found for tool: {tool_name}"
+        missing = tool_names - PRD_TOOL_HANDLERS.keys()
+        assert not missing, f"No handler found for tools: {sorted(missing)}"
 
         # All handlers should be callable
         for handler_name, handler_func in PRD_TOOL_HANDLERS.items():
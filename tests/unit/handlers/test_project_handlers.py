@@ -837,12 +837,15 @@ class TestProjectHandlerRegistration:
         from github_project_manager_mcp.handlers.project_handlers import PROJECT_TOOLS
 
         # Should contain all project management tools
-        tool_names = [tool.name for tool in PROJECT_TOOLS]
-        assert "create_project" in tool_names
-        assert "list_projects" in tool_names
-        assert "update_project" in tool_names
-        assert "delete_project" in tool_names
-        assert "get_project_details" in tool_names
+        tool_names = {tool.name for tool in PROJECT_TOOLS}
+        expected_tools = {
+            "create_project",
+            "list_projects",
+            "update_project",
+            "delete_project",
+            "get_project_details",
+        }
+        assert not expected_tools - tool_names, expected_tools - tool_names
         assert len(PROJECT_TOOLS) == 5
 
     def test_project_tool_handlers_mapping(self):
@@ -276,3 +276,47 @@ class TestTaskHandlersPRDFiltering:
         assert (
             "Total:** 0 tasks" in response_text
         ), "Should show 0 tasks when no matches"
+
+    @pytest.mark.asyncio
+    async def test_list_tasks_description_prd_filter_requires_exact_match(
+        self, mock_github_client
+    ):
+        """Test that description-based filtering ignores prefixes and empty bodies."""
+
+        def item(item_id, title, body):
+            return {
+                "id": item_id,
+                "content": {"id": f"DI_{item_id}", "title": title, "body": body},
+                "fieldValues": {"nodes": []},
+            }
+
+        mock_github_client.query.return_value = {
+            "data": {
+                "node": {
+                    "title": "Test Project",
+                    "items": {
+                        "totalCount": 3,
+                        "nodes": [
+                            item("PVTI_task1", "Task 1", "**Parent PRD:** PVTI_prd1"),
+                            item("PVTI_task2", "Task 2", "**Parent PRD:** PVTI_prd12"),
+                            item("PVTI_task3", "Task 3", None),
+                        ],
+                    },
+                }
+            }
+        }
+
+        with patch(
+            "github_project_manager_mcp.handlers.task_handlers.get_github_client",
+            return_value=mock_github_client,
+        ):
+            result = await list_tasks_handler(
+                {"project_id": "PVT_project1", "parent_prd_id": "PVTI_prd1"}
+            )
+
+        assert not result.isError
+        response_text = result.content[0].text
+        assert "Task 1" in response_text
+        assert "Task 2" not in response_text
+        assert "Task 3" not in response_text
+        assert "Total:** 1 tasks" in response_text
@@ -4,9 +4,20 @@ Unit tests for GitHub GraphQL API client.
 
 from unittest.mock import Mock, patch
 
+import httpx
 import pytest
 
 
+def _json_response(payload, status_code=200, headers=None):
+    """Build a real httpx response carrying a JSON body, as session.post returns."""
+    return httpx.Response(
+        status_code,
+        json=payload,
+        headers=headers,
+        request=httpx.Request("POST", "https://api.github.com/graphql"),
+    )
+
+
 class TestGitHubClient:
     """Test suite for GitHub GraphQL client."""
 
@@ -223,13 +234,13 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token", rate_limit_enabled=True)
 
         # Mock the HTTP response properly
-        mock_response = Mock()
-        mock_response.json = Mock(return_value={"data": {"test": "data"}})
-        mock_response.headers = {
-            "x-ratelimit-remaining": "4999",
-            "x-ratelimit-reset": "1640995200",
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {"data": {"test": "data"}},
+            headers={
+                "x-ratelimit-remaining": "4999",
+                "x-ratelimit-reset": "1640995200",
+            },
+        )
 
         with patch.object(client, "_enforce_rate_limit") as mock_enforce:
             with patch.object(client.session, "post", return_value=mock_response):
@@ -245,13 +256,13 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token", rate_limit_enabled=True)
 
         # Mock the HTTP response properly
-        mock_response = Mock()
-        mock_response.json = Mock(return_value={"data": {"test": "data"}})
-        mock_response.headers = {
-            "x-ratelimit-remaining": "4999",
-            "x-ratelimit-reset": "1640995200",
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {"data": {"test": "data"}},
+            headers={
+                "x-ratelimit-remaining": "4999",
+                "x-ratelimit-reset": "1640995200",
+            },
+        )
 
         with patch.object(client, "_enforce_rate_limit") as mock_enforce:
             with patch.object(client.session, "post", return_value=mock_response):
@@ -320,10 +331,7 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json = Mock(return_value={"data": {"project": {"id": "123"}}})
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response({"data": {"project": {"id": "123"}}}, headers={})
 
         variables = {"projectId": "test-project-123", "first": 10}
 
@@ -348,12 +356,9 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json = Mock(
-            return_value={"data": {"createProject": {"id": "new-123"}}}
+        mock_response = _json_response(
+            {"data": {"createProject": {"id": "new-123"}}}, headers={}
         )
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
 
         variables = {"title": "New Project", "description": "Project description"}
 
@@ -378,18 +383,16 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock response with GraphQL errors
-        mock_response = Mock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response = _json_response(
+            {
                 "data": None,
                 "errors": [
                     {"message": "Field 'invalid' doesn't exist on type 'Query'"},
                     {"message": "Variable '$projectId' is required but not provided"},
                 ],
-            }
+            },
+            headers={},
         )
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
 
         with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(ValueError) as exc_info:
@@ -408,15 +411,13 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock response with GraphQL errors
-        mock_response = Mock()
-        mock_response.json = Mock(
-            return_value={
+        mock_response = _json_response(
+            {
                 "data": None,
                 "errors": [{"message": "Resource not accessible by integration"}],
-            }
+            },
+            headers={},
         )
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
 
         with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(ValueError) as exc_info:
@@ -436,12 +437,7 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock HTTP error response
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError(
-                "401 Unauthorized", request=Mock(), response=Mock()
-            )
-        )
+        mock_response = _json_response({"message": "401 Unauthorized"}, status_code=401)
 
         with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(httpx.HTTPStatusError):
@@ -457,12 +453,7 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock HTTP error response
-        mock_response = Mock()
-        mock_response.raise_for_status = Mock(
-            side_effect=httpx.HTTPStatusError(
-                "403 Forbidden", request=Mock(), response=Mock()
-            )
-        )
+        mock_response = _json_response({"message": "403 Forbidden"}, status_code=403)
 
         with patch.object(client.session, "post", return_value=mock_response):
             with pytest.raises(httpx.HTTPStatusError):
@@ -493,6 +484,55 @@ class TestGitHubClient:
         await client.close()
         assert client.session.is_closed
 
+    @pytest.mark.asyncio
+    async def test_clients_can_share_session(self):
+        """Test that clients reuse a provided session without closing it."""
+        from src.github_project_manager_mcp.github_client import GitHubClient
+
+        owner = GitHubClient(token="test_token")
+        borrower = GitHubClient(token="test_token", session=owner.session)
+        assert borrower.session is owner.session
+
+        await borrower.close()
+        assert not owner.session.is_closed
+
+        await owner.close()
+        assert owner.session.is_closed
+
+    @pytest.mark.asyncio
+    async def test_query_decodes_with_orjson(self):
+        """Test query decodes the response body with orjson when it is installed."""
+        orjson = pytest.importorskip("orjson")
+
+        from src.github_project_manager_mcp import github_client
+        from src.github_project_manager_mcp.github_client import GitHubClient
+
+        client = GitHubClient(token="test_token")
+        response = _json_response({"data": {"viewer": {"login": "octocat"}}})
+
+        with patch.object(client.session, "post", return_value=response), patch.object(
+            github_client.orjson, "loads", wraps=orjson.loads
+        ) as mock_loads:
+            result = await client.query("{ viewer { login } }")
+
+        mock_loads.assert_called_once_with(response.content)
+        assert result == {"viewer": {"login": "octocat"}}
+
+    @pytest.mark.asyncio
+    async def test_query_decodes_without_orjson(self):
+        """Test query falls back to httpx's JSON decoding without orjson."""
+        from src.github_project_manager_mcp.github_client import GitHubClient
+
+        client = GitHubClient(token="test_token")
+        response = _json_response({"data": {"viewer": {"login": "octocat"}}})
+
+        with patch.object(client.session, "post", return_value=response), patch(
+            "src.github_project_manager_mcp.github_client.orjson", None
+        ):
+            result = await client.query("{ viewer { login } }")
+
+        assert result == {"viewer": {"login": "octocat"}}
+
     @pytest.mark.asyncio
     async def test_rate_limit_state_update_with_missing_headers(self):
         """Test rate limit state update handles missing headers gracefully."""
@@ -553,12 +593,9 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token")
 
         # Mock the HTTP response
-        mock_response = Mock()
-        mock_response.json = Mock(
-            return_value={"data": {"viewer": {"login": "testuser"}}}
+        mock_response = _json_response(
+            {"data": {"viewer": {"login": "testuser"}}}, headers={}
         )
-        mock_response.headers = {}
-        mock_response.raise_for_status = Mock()
 
         with patch.object(
             client.session, "post", return_value=mock_response
@@ -579,13 +616,13 @@ class TestGitHubClient:
         client = GitHubClient(token="test_token", rate_limit_enabled=False)
 
         # Mock response with rate limit headers
-        mock_response = Mock()
-        mock_response.json = Mock(return_value={"data": {"test": "data"}})
-        mock_response.headers = {
-            "x-ratelimit-remaining": "4999",
-            "x-ratelimit-reset": "1640995200",
-        }
-        mock_response.raise_for_status = Mock()
+        mock_response = _json_response(
+            {"data": {"test": "data"}},
+            headers={
+                "x-ratelimit-remaining": "4999",
+                "x-ratelimit-reset": "1640995200",
+            },
+        )
 
         with patch.object(client.session, "post", return_value=mock_response):
             await client.query("{ test }")
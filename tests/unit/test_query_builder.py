@@ -2,207 +2,141 @@
 Unit tests for GitHub GraphQL query builder utilities.
 """
 
+import re
+
 import pytest
 
+from src.github_project_manager_mcp.utils.query_builder import ProjectQueryBuilder
+
+
+@pytest.fixture(scope="module")
+def builder():
+    """Provide a shared query builder; ProjectQueryBuilder holds no state."""
+    return ProjectQueryBuilder()
+
+
+_IDENTIFIER = re.compile(r"[A-Za-z_][A-Za-z0-9_]*")
+
+
+def _tokens(query):
+    """Return the set of GraphQL names appearing in a query, scanned once."""
+    return set(_IDENTIFIER.findall(query))
+
 
 class TestProjectQueryBuilder:
     """Test suite for GitHub Projects v2 GraphQL query builder."""
 
-    def test_build_list_projects_query_basic(self):
+    def test_build_list_projects_query_basic(self, builder):
         """Test building basic list projects query."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.list_projects("testuser")
 
-        assert "query" in query
-        assert "testuser" in query
-        assert "projectsV2" in query
-        assert "nodes" in query
+        assert {"query", "testuser", "projectsV2", "nodes"} <= _tokens(query)
 
-    def test_build_list_projects_query_with_pagination(self):
+    def test_build_list_projects_query_with_pagination(self, builder):
         """Test building list projects query with pagination."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.list_projects("testuser", first=10, after="cursor123")
 
         assert "first: 10" in query
         assert 'after: "cursor123"' in query
-        assert "pageInfo" in query
-        assert "hasNextPage" in query
-        assert "endCursor" in query
+        assert {"pageInfo", "hasNextPage", "endCursor"} <= _tokens(query)
 
-    def test_build_list_projects_query_with_custom_fields(self):
+    def test_build_list_projects_query_with_custom_fields(self, builder):
         """Test building list projects query with custom field selection."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         fields = ["id", "title", "description", "createdAt"]
         query = builder.list_projects("testuser", fields=fields)
 
-        for field in fields:
-            assert field in query
-        assert "updatedAt" not in query  # Should not include fields not requested
+        tokens = _tokens(query)
+        missing = set(fields) - tokens
+        assert not missing, missing
+        assert "updatedAt" not in tokens  # Should not include fields not requested
 
-    def test_build_get_project_query(self):
+    def test_build_get_project_query(self, builder):
         """Test building get single project query."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.get_project("project123")
 
-        assert "query" in query
-        assert "node" in query
+        assert {"query", "node"} <= _tokens(query)
         assert 'id: "project123"' in query
         assert "... on ProjectV2" in query
 
-    def test_build_get_project_query_with_custom_fields(self):
+    def test_build_get_project_query_with_custom_fields(self, builder):
         """Test building get project query with custom fields."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         fields = ["id", "title", "url", "viewerCanUpdate"]
         query = builder.get_project("project123", fields=fields)
 
-        for field in fields:
-            assert field in query
+        missing = set(fields) - _tokens(query)
+        assert not missing, missing
 
-    def test_build_project_items_query(self):
+    def test_build_project_items_query(self, builder):
         """Test building query for project items."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.get_project_items("project123")
 
-        assert "query" in query
+        assert {"query", "items", "content"} <= _tokens(query)
         assert 'id: "project123"' in query
-        assert "items" in query
-        assert "content" in query
 
-    def test_build_project_items_query_with_pagination(self):
+    def test_build_project_items_query_with_pagination(self, builder):
         """Test building project items query with pagination."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.get_project_items("project123", first=20, after="item_cursor")
 
         assert "first: 20" in query
         assert 'after: "item_cursor"' in query
 
-    def test_build_search_projects_query(self):
+    def test_build_search_projects_query(self, builder):
         """Test building search projects query."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.search_projects("testuser", search_term="web app")
 
-        assert "projectsV2" in query
-        assert "testuser" in query
+        assert {"projectsV2", "testuser"} <= _tokens(query)
         # Note: GitHub's Projects v2 API doesn't have direct search,
         # so this would be client-side filtering
 
-    def test_build_create_project_mutation(self):
+    def test_build_create_project_mutation(self, builder):
         """Test building create project mutation."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         mutation = builder.create_project(
             "owner123", "My New Project", "Project description"
         )
 
-        assert "mutation" in mutation
-        assert "createProjectV2" in mutation
-        assert "ownerId" in mutation
-        assert "title" in mutation
+        assert {"mutation", "createProjectV2", "ownerId", "title"} <= _tokens(mutation)
         assert "My New Project" in mutation
         # Note: GitHub's CreateProjectV2 API doesn't support description in input
         # Description would need to be set via updateProjectV2 mutation later
 
-    def test_build_update_project_mutation(self):
+    def test_build_update_project_mutation(self, builder):
         """Test building update project mutation."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         mutation = builder.update_project(
             "project123", title="Updated Title", short_description="New description"
         )
 
-        assert "mutation" in mutation
-        assert "updateProjectV2" in mutation
-        assert "projectId" in mutation
+        assert {"mutation", "updateProjectV2", "projectId"} <= _tokens(mutation)
         assert "Updated Title" in mutation
         assert "New description" in mutation
 
-    def test_build_delete_project_mutation(self):
+    def test_build_delete_project_mutation(self, builder):
         """Test building delete project mutation."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         mutation = builder.delete_project("project123")
 
-        assert "mutation" in mutation
-        assert "deleteProjectV2" in mutation
+        assert {"mutation", "deleteProjectV2"} <= _tokens(mutation)
         assert 'projectId: "project123"' in mutation
 
-    def test_build_add_item_to_project_mutation(self):
+    def test_build_add_item_to_project_mutation(self, builder):
         """Test building add item to project mutation."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         mutation = builder.add_item_to_project("project123", "content123")
 
-        assert "mutation" in mutation
-        assert "addProjectV2ItemById" in mutation
-        assert "projectId" in mutation
-        assert "contentId" in mutation
+        assert {
+            "mutation",
+            "addProjectV2ItemById",
+            "projectId",
+            "contentId",
+        } <= _tokens(mutation)
 
-    def test_query_builder_validates_parameters(self):
+    def test_query_builder_validates_parameters(self, builder):
         """Test that query builder validates required parameters."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
-
         with pytest.raises(ValueError, match="Owner is required"):
             builder.list_projects("")
 
         with pytest.raises(ValueError, match="Project ID is required"):
             builder.get_project("")
 
-    def test_query_builder_handles_pagination_parameters(self):
+    def test_query_builder_handles_pagination_parameters(self, builder):
         """Test that query builder handles pagination parameters correctly."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
-
         # Test with only 'first' parameter
         query1 = builder.list_projects("testuser", first=5)
         assert "first: 5" in query1
@@ -213,14 +147,8 @@ class TestProjectQueryBuilder:
         assert "first: 5" in query2
         assert 'after: "cursor"' in query2
 
-    def test_query_builder_escapes_strings_properly(self):
+    def test_query_builder_escapes_strings_properly(self, builder):
         """Test that query builder properly escapes strings in queries."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
-
         # Test with special characters that need escaping
         title_with_quotes = 'Project "with quotes"'
         mutation = builder.create_project("owner123", title_with_quotes)
@@ -228,17 +156,28 @@ class TestProjectQueryBuilder:
         # Should properly escape quotes
         assert '\\"' in mutation or "'" in mutation  # Either escaped or single quotes
 
-    def test_query_builder_default_fields(self):
+    @pytest.mark.parametrize(
+        "value,expected",
+        [
+            ('say "hi"', '"say \\"hi\\""'),
+            ("a\\b\nc\td", '"a\\\\b\\nc\\td"'),
+            ("bell\x07", '"bell\\u0007"'),
+            ("café", '"caf\\u00e9"'),
+            (None, '""'),
+            (42, "42"),
+        ],
+        ids=["quotes", "whitespace", "control", "non_ascii", "none", "non_string"],
+    )
+    def test_escape_string_matches_json_encoding(self, builder, value, expected):
+        """Test that GraphQL string escaping follows JSON string encoding."""
+        assert builder._escape_string(value) == expected
+
+    def test_query_builder_default_fields(self, builder):
         """Test that query builder includes sensible default fields."""
-        from src.github_project_manager_mcp.utils.query_builder import (
-            ProjectQueryBuilder,
-        )
-
-        builder = ProjectQueryBuilder()
         query = builder.list_projects("testuser")
 
         # Should include essential fields by default
         # Note: GitHub Projects v2 uses "shortDescription" not "description"
         essential_fields = ["id", "title", "shortDescription", "url", "createdAt"]
-        for field in essential_fields:
-            assert field in query
+        missing = set(essential_fields) - _tokens(query)
+        assert not missing, missing
@@ -10,28 +10,102 @@ Tests the Subtask model's functionality including:
 - Data serialization and deserialization
 """
 
-from datetime import datetime
-from unittest.mock import Mock
+import dataclasses
+import re
+from types import MappingProxyType
 
 import pytest
 
 from src.github_project_manager_mcp.models.subtask import Subtask, SubtaskStatus
 
+# Status members bound once for use throughout the tests
+INCOMPLETE = SubtaskStatus.INCOMPLETE
+COMPLETE = SubtaskStatus.COMPLETE
+
+# Expected Subtask.to_dict() outputs, shared read-only by the serialization tests
+EXPECTED_FULL_DICT = MappingProxyType(
+    {
+        "id": "SUBTASK_123",
+        "parent_task_id": "PVTI_task456",
+        "title": "Set up database connection",
+        "description": "Configure PostgreSQL connection",
+        "order": 1,
+        "status": "Complete",
+        "created_at": "2024-01-01T10:00:00Z",
+        "updated_at": "2024-01-02T15:30:00Z",
+        "completed_at": "2024-01-02T14:00:00Z",
+        "assignee_login": "developer1",
+        "custom_fields": {"complexity": "low"},
+    }
+)
+
+EXPECTED_MINIMAL_DICT = MappingProxyType(
+    {
+        "id": "SUBTASK_123",
+        "parent_task_id": "PVTI_task456",
+        "title": "Test subtask",
+        "order": 1,
+        "status": "Incomplete",
+    }
+)
+
+# Expected Subtask.to_checklist_format() lines
+EXPECTED_INCOMPLETE_CHECKLIST_LINE = "- [ ] Incomplete task"
+EXPECTED_COMPLETE_CHECKLIST_LINE = "- [x] Complete task"
+
+# Constructor arguments that pass validation; invalid cases override one field
+VALID_SUBTASK_KWARGS = MappingProxyType(
+    {
+        "id": "SUBTASK_123",
+        "parent_task_id": "PVTI_task456",
+        "title": "Test subtask",
+        "order": 1,
+    }
+)
+
+# Precompiled matchers for the validation error messages
+EMPTY_TITLE_ERROR = re.compile("Subtask title cannot be empty")
+MISSING_PARENT_ERROR = re.compile("Subtask must be associated with a parent Task")
+ORDER_ERROR = re.compile("Subtask order must be positive")
+REORDER_ERROR = re.compile("Order must be positive")
+
+# (field overrides, expected error) rows for the constructor validation test
+VALIDATION_ERROR_CASES = [
+    pytest.param({"title": ""}, EMPTY_TITLE_ERROR, id="empty_title"),
+    pytest.param({"title": "   "}, EMPTY_TITLE_ERROR, id="blank_title"),
+    pytest.param({"parent_task_id": ""}, MISSING_PARENT_ERROR, id="empty_parent"),
+    pytest.param({"order": -1}, ORDER_ERROR, id="negative_order"),
+    pytest.param({"order": 0}, ORDER_ERROR, id="zero_order"),
+]
+
+
+@pytest.fixture(scope="module")
+def base_subtask():
+    """Provide a canonical Subtask; tests must not mutate it."""
+    return Subtask(
+        id="SUBTASK_123", parent_task_id="PVTI_task456", title="Test task", order=1
+    )
+
+
+@pytest.fixture
+def make_subtask(base_subtask):
+    """Build fresh Subtask variants from the canonical instance."""
+
+    def _make(**overrides):
+        return dataclasses.replace(base_subtask, **overrides)
+
+    return _make
+
 
 class TestSubtaskStatus:
     """Test SubtaskStatus enum."""
 
     def test_subtask_status_values(self):
-        """Test that SubtaskStatus enum has correct values."""
-        assert SubtaskStatus.INCOMPLETE.value == "Incomplete"
-        assert SubtaskStatus.COMPLETE.value == "Complete"
-
-    def test_subtask_status_iteration(self):
-        """Test that all SubtaskStatus values are accessible."""
-        statuses = list(SubtaskStatus)
-        assert len(statuses) == 2
-        assert SubtaskStatus.INCOMPLETE in statuses
-        assert SubtaskStatus.COMPLETE in statuses
+        """Test that SubtaskStatus has exactly the expected members and values."""
+        assert [(status, status.value) for status in SubtaskStatus] == [
+            (SubtaskStatus.INCOMPLETE, "Incomplete"),
+            (SubtaskStatus.COMPLETE, "Complete"),
+        ]
 
 
 class TestSubtask:
@@ -50,7 +124,7 @@ class TestSubtask:
         assert subtask.parent_task_id == "PVTI_task456"
         assert subtask.title == "Set up database connection"
         assert subtask.order == 1
-        assert subtask.status == SubtaskStatus.INCOMPLETE
+        assert subtask.status == INCOMPLETE
         assert subtask.description is None
         assert subtask.completed_at is None
         assert subtask.custom_fields == {}
@@ -63,7 +137,7 @@ class TestSubtask:
             title="Set up database connection",
             description="Configure PostgreSQL connection with connection pooling",
             order=1,
-            status=SubtaskStatus.COMPLETE,
+            status=COMPLETE,
             created_at="2024-01-01T10:00:00Z",
             updated_at="2024-01-02T15:30:00Z",
             completed_at="2024-01-02T14:00:00Z",
@@ -79,96 +153,66 @@ class TestSubtask:
             == "Configure PostgreSQL connection with connection pooling"
         )
         assert subtask.order == 1
-        assert subtask.status == SubtaskStatus.COMPLETE
+        assert subtask.status == COMPLETE
         assert subtask.created_at == "2024-01-01T10:00:00Z"
         assert subtask.updated_at == "2024-01-02T15:30:00Z"
         assert subtask.completed_at == "2024-01-02T14:00:00Z"
         assert subtask.assignee_login == "developer1"
         assert subtask.custom_fields == {"complexity": "low", "estimated_minutes": 30}
 
-    def test_subtask_validation_empty_title(self):
-        """Test that empty title raises validation error."""
-        with pytest.raises(ValueError, match="Subtask title cannot be empty"):
-            Subtask(id="SUBTASK_123", parent_task_id="PVTI_task456", title="", order=1)
-
-        with pytest.raises(ValueError, match="Subtask title cannot be empty"):
-            Subtask(
-                id="SUBTASK_123", parent_task_id="PVTI_task456", title="   ", order=1
-            )
-
-    def test_subtask_validation_empty_parent_task_id(self):
-        """Test that empty parent_task_id raises validation error."""
-        with pytest.raises(
-            ValueError, match="Subtask must be associated with a parent Task"
-        ):
-            Subtask(id="SUBTASK_123", parent_task_id="", title="Test subtask", order=1)
-
-    def test_subtask_validation_negative_order(self):
-        """Test that negative order raises validation error."""
-        with pytest.raises(ValueError, match="Subtask order must be positive"):
-            Subtask(
-                id="SUBTASK_123",
-                parent_task_id="PVTI_task456",
-                title="Test subtask",
-                order=-1,
-            )
-
-    def test_subtask_validation_zero_order(self):
-        """Test that zero order raises validation error."""
-        with pytest.raises(ValueError, match="Subtask order must be positive"):
-            Subtask(
-                id="SUBTASK_123",
-                parent_task_id="PVTI_task456",
-                title="Test subtask",
-                order=0,
-            )
-
-    def test_subtask_from_checklist_item(self):
+    @pytest.mark.parametrize("overrides,match", VALIDATION_ERROR_CASES)
+    def test_subtask_validation_errors(self, overrides, match):
+        """Test that invalid fields raise validation errors."""
+        with pytest.raises(ValueError, match=match):
+            Subtask(**{**VALID_SUBTASK_KWARGS, **overrides})
+
+    @pytest.mark.parametrize(
+        "checklist_data,expected_status,expected_completed_at",
+        [
+            (
+                {
+                    "id": "SUBTASK_123",
+                    "text": "Set up database connection",
+                    "checked": False,
+                    "position": 1,
+                    "createdAt": "2024-01-01T10:00:00Z",
+                    "updatedAt": "2024-01-02T15:30:00Z",
+                },
+                INCOMPLETE,
+                None,
+            ),
+            (
+                {
+                    "id": "SUBTASK_123",
+                    "text": "Configure database schema",
+                    "checked": True,
+                    "position": 2,
+                    "createdAt": "2024-01-01T10:00:00Z",
+                    "updatedAt": "2024-01-02T15:30:00Z",
+                    "completedAt": "2024-01-02T14:00:00Z",
+                },
+                COMPLETE,
+                "2024-01-02T14:00:00Z",
+            ),
+        ],
+        ids=["incomplete", "completed"],
+    )
+    def test_subtask_from_checklist_item(
+        self, checklist_data, expected_status, expected_completed_at
+    ):
         """Test creating Subtask from GitHub checklist item data."""
-        checklist_data = {
-            "id": "SUBTASK_123",
-            "text": "Set up database connection",
-            "checked": False,
-            "position": 1,
-            "createdAt": "2024-01-01T10:00:00Z",
-            "updatedAt": "2024-01-02T15:30:00Z",
-        }
-
         subtask = Subtask.from_checklist_item(
             checklist_data, parent_task_id="PVTI_task456"
         )
 
         assert subtask.id == "SUBTASK_123"
         assert subtask.parent_task_id == "PVTI_task456"
-        assert subtask.title == "Set up database connection"
-        assert subtask.order == 1
-        assert subtask.status == SubtaskStatus.INCOMPLETE
+        assert subtask.title == checklist_data["text"]
+        assert subtask.order == checklist_data["position"]
+        assert subtask.status == expected_status
         assert subtask.created_at == "2024-01-01T10:00:00Z"
         assert subtask.updated_at == "2024-01-02T15:30:00Z"
-        assert subtask.completed_at is None
-
-    def test_subtask_from_checklist_item_completed(self):
-        """Test creating completed Subtask from GitHub checklist item data."""
-        checklist_data = {
-            "id": "SUBTASK_123",
-            "text": "Configure database schema",
-            "checked": True,
-            "position": 2,
-            "createdAt": "2024-01-01T10:00:00Z",
-            "updatedAt": "2024-01-02T15:30:00Z",
-            "completedAt": "2024-01-02T14:00:00Z",
-        }
-
-        subtask = Subtask.from_checklist_item(
-            checklist_data, parent_task_id="PVTI_task456"
-        )
-
-        assert subtask.id == "SUBTASK_123"
-        assert subtask.parent_task_id == "PVTI_task456"
-        assert subtask.title == "Configure database schema"
-        assert subtask.order == 2
-        assert subtask.status == SubtaskStatus.COMPLETE
-        assert subtask.completed_at == "2024-01-02T14:00:00Z"
+        assert subtask.completed_at == expected_completed_at
 
     def test_subtask_from_custom_field_data(self):
         """Test creating Subtask from GitHub Projects v2 custom field data."""
@@ -195,7 +239,7 @@ class TestSubtask:
             == "Create comprehensive test coverage for authentication module"
         )
         assert subtask.order == 3
-        assert subtask.status == SubtaskStatus.COMPLETE
+        assert subtask.status == COMPLETE
         assert subtask.created_at == "2024-01-01T09:00:00Z"
         assert subtask.updated_at == "2024-01-03T12:00:00Z"
         assert subtask.completed_at == "2024-01-03T11:30:00Z"
@@ -217,18 +261,15 @@ class TestSubtask:
         assert subtask.parent_task_id == "PVTI_task999"
         assert subtask.title == "Deploy to staging"
         assert subtask.order == 4
-        assert subtask.status == SubtaskStatus.INCOMPLETE
+        assert subtask.status == INCOMPLETE
         assert subtask.completed_at is None
 
-    def test_subtask_to_dict(self):
+    def test_subtask_to_dict(self, make_subtask):
         """Test converting Subtask to dictionary."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
+        subtask = make_subtask(
             title="Set up database connection",
             description="Configure PostgreSQL connection",
-            order=1,
-            status=SubtaskStatus.COMPLETE,
+            status=COMPLETE,
             created_at="2024-01-01T10:00:00Z",
             updated_at="2024-01-02T15:30:00Z",
             completed_at="2024-01-02T14:00:00Z",
@@ -236,114 +277,51 @@ class TestSubtask:
             custom_fields={"complexity": "low"},
         )
 
-        result = subtask.to_dict()
+        assert subtask.to_dict() == EXPECTED_FULL_DICT
 
-        expected = {
-            "id": "SUBTASK_123",
-            "parent_task_id": "PVTI_task456",
-            "title": "Set up database connection",
-            "description": "Configure PostgreSQL connection",
-            "order": 1,
-            "status": "Complete",
-            "created_at": "2024-01-01T10:00:00Z",
-            "updated_at": "2024-01-02T15:30:00Z",
-            "completed_at": "2024-01-02T14:00:00Z",
-            "assignee_login": "developer1",
-            "custom_fields": {"complexity": "low"},
-        }
-
-        assert result == expected
-
-    def test_subtask_to_dict_minimal(self):
+    def test_subtask_to_dict_minimal(self, make_subtask):
         """Test converting minimal Subtask to dictionary."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Test subtask",
-            order=1,
-        )
-
-        result = subtask.to_dict()
-
-        expected = {
-            "id": "SUBTASK_123",
-            "parent_task_id": "PVTI_task456",
-            "title": "Test subtask",
-            "order": 1,
-            "status": "Incomplete",
-        }
-
-        assert result == expected
-
-    def test_subtask_to_checklist_item(self):
+        subtask = make_subtask(title="Test subtask")
+
+        assert subtask.to_dict() == EXPECTED_MINIMAL_DICT
+
+    @pytest.mark.parametrize(
+        "title,order,status,checked",
+        [
+            ("Set up database connection", 1, COMPLETE, True),
+            ("Configure logging", 2, INCOMPLETE, False),
+        ],
+        ids=["complete", "incomplete"],
+    )
+    def test_subtask_to_checklist_item(
+        self, make_subtask, title, order, status, checked
+    ):
         """Test converting Subtask to GitHub checklist item format."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Set up database connection",
-            order=1,
-            status=SubtaskStatus.COMPLETE,
-            completed_at="2024-01-02T14:00:00Z",
-        )
+        subtask = make_subtask(title=title, order=order, status=status)
 
         result = subtask.to_checklist_item()
 
         expected = {
             "id": "SUBTASK_123",
-            "text": "Set up database connection",
-            "checked": True,
-            "position": 1,
+            "text": title,
+            "checked": checked,
+            "position": order,
         }
 
         assert result == expected
 
-    def test_subtask_to_checklist_item_incomplete(self):
-        """Test converting incomplete Subtask to checklist item format."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Configure logging",
-            order=2,
-            status=SubtaskStatus.INCOMPLETE,
-        )
-
-        result = subtask.to_checklist_item()
-
-        expected = {
-            "id": "SUBTASK_123",
-            "text": "Configure logging",
-            "checked": False,
-            "position": 2,
-        }
-
-        assert result == expected
-
-    def test_subtask_string_representation(self):
+    def test_subtask_string_representation(self, make_subtask):
         """Test string representation of Subtask."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Set up database connection",
-            order=1,
-            status=SubtaskStatus.COMPLETE,
-        )
+        subtask = make_subtask(title="Set up database connection", status=COMPLETE)
 
         expected = "Subtask: Set up database connection (Order: 1, Status: Complete)"
         assert str(subtask) == expected
 
-    def test_subtask_equality(self):
+    def test_subtask_equality(self, make_subtask):
         """Test equality comparison of Subtask instances."""
-        subtask1 = Subtask(
-            id="SUBTASK_123", parent_task_id="PVTI_task456", title="Task 1", order=1
-        )
-
-        subtask2 = Subtask(
-            id="SUBTASK_123", parent_task_id="PVTI_task789", title="Task 2", order=2
-        )
-
-        subtask3 = Subtask(
-            id="SUBTASK_456", parent_task_id="PVTI_task456", title="Task 3", order=1
-        )
+        subtask1 = make_subtask()
+        subtask2 = make_subtask(parent_task_id="PVTI_task789", title="Task 2", order=2)
+        subtask3 = make_subtask(id="SUBTASK_456", title="Task 3")
 
         # Same ID should be equal
         assert subtask1 == subtask2
@@ -352,22 +330,12 @@ class TestSubtask:
         # Different types should not be equal
         assert subtask1 != "not a subtask"
 
-    def test_subtask_completion_methods(self):
+    def test_subtask_completion_methods(self, make_subtask):
         """Test subtask completion status methods."""
-        incomplete_subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Incomplete task",
-            order=1,
-            status=SubtaskStatus.INCOMPLETE,
-        )
-
-        complete_subtask = Subtask(
+        incomplete_subtask = make_subtask()
+        complete_subtask = make_subtask(
             id="SUBTASK_456",
-            parent_task_id="PVTI_task456",
-            title="Complete task",
-            order=2,
-            status=SubtaskStatus.COMPLETE,
+            status=COMPLETE,
             completed_at="2024-01-02T14:00:00Z",
         )
 
@@ -379,101 +347,70 @@ class TestSubtask:
         assert incomplete_subtask.is_pending()
         assert not complete_subtask.is_pending()
 
-    def test_subtask_mark_complete(self):
-        """Test marking a subtask as complete."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Test task",
-            order=1,
-            status=SubtaskStatus.INCOMPLETE,
+    def test_subtask_checklist_formatting(self, make_subtask):
+        """Test formatting subtask for checklist display."""
+        incomplete_subtask = make_subtask(title="Incomplete task")
+        complete_subtask = make_subtask(
+            id="SUBTASK_456",
+            title="Complete task",
+            order=2,
+            status=COMPLETE,
         )
 
-        # Mark as complete
-        subtask.mark_complete()
-
-        assert subtask.status == SubtaskStatus.COMPLETE
-        assert subtask.completed_at is not None
+        # Test checklist format
+        assert (
+            incomplete_subtask.to_checklist_format(),
+            complete_subtask.to_checklist_format(),
+        ) == (EXPECTED_INCOMPLETE_CHECKLIST_LINE, EXPECTED_COMPLETE_CHECKLIST_LINE)
 
-    def test_subtask_mark_incomplete(self):
-        """Test marking a subtask as incomplete."""
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Test task",
-            order=1,
-            status=SubtaskStatus.COMPLETE,
-            completed_at="2024-01-02T14:00:00Z",
-        )
+    def test_subtask_long_title(self):
+        """Test that a very long title passes validation."""
+        long_title = "A" * 1000
+        subtask = Subtask(**{**VALID_SUBTASK_KWARGS, "title": long_title})
+        assert subtask.title == long_title
 
-        # Mark as incomplete
-        subtask.mark_incomplete()
+    def test_subtask_unicode_title(self):
+        """Test that unicode characters in the title pass validation."""
+        unicode_title = "测试任务 🚀"
+        subtask = Subtask(**{**VALID_SUBTASK_KWARGS, "title": unicode_title})
+        assert subtask.title == unicode_title
 
-        assert subtask.status == SubtaskStatus.INCOMPLETE
-        assert subtask.completed_at is None
 
-    def test_subtask_reorder(self):
-        """Test reordering subtasks."""
-        subtask = Subtask(
-            id="SUBTASK_123", parent_task_id="PVTI_task456", title="Test task", order=1
-        )
+class TestSubtaskMutations:
+    """Test Subtask methods that change the instance in place."""
 
-        # Change order
-        subtask.reorder(5)
+    @pytest.fixture
+    def sub(self, base_subtask):
+        """Provide a fresh copy of the canonical Subtask for each test."""
+        return dataclasses.replace(base_subtask)
 
-        assert subtask.order == 5
+    def test_subtask_mark_complete(self, sub):
+        """Test marking a subtask as complete."""
+        sub.mark_complete()
 
-    def test_subtask_reorder_invalid(self):
-        """Test reordering with invalid order values."""
-        subtask = Subtask(
-            id="SUBTASK_123", parent_task_id="PVTI_task456", title="Test task", order=1
-        )
+        assert sub.status == COMPLETE
+        assert sub.completed_at is not None
 
-        # Test negative order
-        with pytest.raises(ValueError, match="Order must be positive"):
-            subtask.reorder(-1)
+    def test_subtask_mark_incomplete(self, sub):
+        """Test marking a subtask as incomplete."""
+        sub.status = COMPLETE
+        sub.completed_at = "2024-01-02T14:00:00Z"
 
-        # Test zero order
-        with pytest.raises(ValueError, match="Order must be positive"):
-            subtask.reorder(0)
+        sub.mark_incomplete()
 
-    def test_subtask_checklist_formatting(self):
-        """Test formatting subtask for checklist display."""
-        incomplete_subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title="Incomplete task",
-            order=1,
-            status=SubtaskStatus.INCOMPLETE,
-        )
+        assert sub.status == INCOMPLETE
+        assert sub.completed_at is None
 
-        complete_subtask = Subtask(
-            id="SUBTASK_456",
-            parent_task_id="PVTI_task456",
-            title="Complete task",
-            order=2,
-            status=SubtaskStatus.COMPLETE,
-        )
+    def test_subtask_reorder(self, sub):
+        """Test reordering subtasks."""
+        sub.reorder(5)
 
-        # Test checklist format
-        assert incomplete_subtask.to_checklist_format() == "- [ ] Incomplete task"
-        assert complete_subtask.to_checklist_format() == "- [x] Complete task"
+        assert sub.order == 5
 
-    def test_subtask_validation_edge_cases(self):
-        """Test subtask validation with edge cases."""
-        # Test very long title
-        long_title = "A" * 1000
-        subtask = Subtask(
-            id="SUBTASK_123", parent_task_id="PVTI_task456", title=long_title, order=1
-        )
-        assert subtask.title == long_title
+    @pytest.mark.parametrize("new_order", [-1, 0], ids=["negative", "zero"])
+    def test_subtask_reorder_invalid(self, sub, new_order):
+        """Test reordering with invalid order values."""
+        with pytest.raises(ValueError, match=REORDER_ERROR):
+            sub.reorder(new_order)
 
-        # Test unicode characters in title
-        unicode_title = "测试任务 🚀"
-        subtask = Subtask(
-            id="SUBTASK_123",
-            parent_task_id="PVTI_task456",
-            title=unicode_title,
-            order=1,
-        )
-        assert subtask.title == unicode_title
+        assert sub.order == 1
@@ -248,6 +248,83 @@ class TestTask:
         assert task.priority == TaskPriority.MEDIUM
         assert task.content_type is None
 
+    def test_task_from_github_item_unknown_options_use_defaults(self):
+        """Test that unrecognised status and priority options fall back to defaults."""
+        item_data = {
+            "id": "PVTI_task123",
+            "title": "Triage incoming bug",
+            "fieldValues": {
+                "nodes": [
+                    {"field": {"name": "Parent PRD"}, "text": "PVTI_prd789"},
+                    {"field": {"name": "Status"}, "name": "Waiting"},
+                    {"field": {"name": "Priority"}, "name": "Urgent"},
+                ]
+            },
+        }
+
+        task = Task.from_github_item(item_data, "PVT_project123")
+
+        assert task.status == TaskStatus.TODO
+        assert task.priority == TaskPriority.MEDIUM
+        assert task.custom_fields["status"] == "Waiting"
+
+    def test_task_from_github_item_field_name_aliases(self):
+        """Test that alternate field names populate the same Task attributes."""
+        item_data = {
+            "id": "PVTI_task123",
+            "title": "Write migration",
+            "fieldValues": {
+                "nodes": [
+                    {"field": {"name": "PRD"}, "text": "PVTI_prd789"},
+                    {"field": {"name": "State"}, "name": "Blocked"},
+                    {"field": {"name": "actual_hours"}, "number": 3},
+                ]
+            },
+        }
+
+        task = Task.from_github_item(item_data, "PVT_project123")
+
+        assert task.parent_prd_id == "PVTI_prd789"
+        assert task.status == TaskStatus.BLOCKED
+        assert task.actual_hours == 3
+        assert task.estimated_hours is None
+
+    def test_task_from_github_item_interns_shared_ids(self):
+        """Test that IDs and field names repeated across items are shared."""
+        items = [
+            {
+                "id": f"PVTI_task{number}",
+                "title": f"Task {number}",
+                "fieldValues": {
+                    "nodes": [{"field": {"name": "Parent PRD"}, "text": "PVTI_prd1"}]
+                },
+            }
+            for number in (1, 2)
+        ]
+
+        # Separate string objects, as each item would be decoded from JSON
+        first, second = (
+            Task.from_github_item(item, "".join(["PVT_", "project123"]))
+            for item in items
+        )
+
+        assert first.parent_prd_id is second.parent_prd_id
+        assert first.project_id is second.project_id
+        assert list(first.custom_fields)[0] is list(second.custom_fields)[0]
+
+    def test_task_from_github_item_missing_project_id(self):
+        """Test that a missing project ID is rejected by validation, not by interning."""
+        item_data = {
+            "id": "PVTI_task123",
+            "title": "Test task",
+            "fieldValues": {
+                "nodes": [{"field": {"name": "Parent PRD"}, "text": "PVTI_prd1"}]
+            },
+        }
+
+        with pytest.raises(ValueError, match="Task must be associated with a project"):
+            Task.from_github_item(item_data, None)
+
     def test_task_from_github_item_missing_parent_prd(self):
         """Test that missing parent PRD field raises validation error."""
         item_data = {
@@ -362,6 +439,20 @@ class TestTask:
         assert task1 == task2  # Same ID
         assert task1 != task3  # Different ID
         assert task1 != "not a task"  # Different type
+        assert len({task1, task2, task3}) == 2  # Hash follows ID equality
+
+    def test_task_uses_slots(self):
+        """Test that Task instances carry no per-instance __dict__."""
+        task = Task(
+            id="PVTI_task123",
+            project_id="PVT_project123",
+            parent_prd_id="PVTI_prd456",
+            title="Test task",
+        )
+
+        assert not hasattr(task, "__dict__")
+        with pytest.raises(AttributeError):
+            task.unknown_field = "value"
 
     def test_task_progress_calculation(self):
         """Test task progress calculation methods."""
@@ -8,14 +8,20 @@ data integrity checks.
 
 import pytest
 
+from src.github_project_manager_mcp.utils.validation import (
+    ParameterValidator,
+    PRDValidator,
+    SubtaskValidator,
+    TaskValidator,
+    ValidationResult,
+)
+
 
 class TestValidationResult:
     """Test ValidationResult class."""
 
     def test_validation_result_success(self):
         """Test creating a successful validation result."""
-        from src.github_project_manager_mcp.utils.validation import ValidationResult
-
         result = ValidationResult(is_valid=True)
 
         assert result.is_valid is True
@@ -24,8 +30,6 @@ class TestValidationResult:
 
     def test_validation_result_with_errors(self):
         """Test creating a validation result with errors."""
-        from src.github_project_manager_mcp.utils.validation import ValidationResult
-
         errors = ["Field 'title' is required", "Invalid status value"]
         result = ValidationResult(is_valid=False, errors=errors)
 
@@ -33,14 +37,24 @@ class TestValidationResult:
         assert result.errors == errors
         assert result.warnings == []
 
+    def test_validation_result_merge(self):
+        """Test merging results keeps messages and propagates failure."""
+        result = ValidationResult(is_valid=True)
+        result.merge(ValidationResult(is_valid=True))
+        result.merge(ValidationResult(False, ["title is required"], ["short title"]))
+
+        assert result.is_valid is False
+        assert result.errors == ["title is required"]
+        assert result.warnings == ["short title"]
+        assert " ".join(result.errors) == "title is required"
+        assert not hasattr(result, "__dict__")
+
 
 class TestParameterValidator:
     """Test ParameterValidator class."""
 
     def test_validate_required_string_success(self):
         """Test validating required string parameter successfully."""
-        from src.github_project_manager_mcp.utils.validation import ParameterValidator
-
         validator = ParameterValidator()
         result = validator.validate_required_string("project_id", "PVT_test123")
 
@@ -49,8 +63,6 @@ class TestParameterValidator:
 
     def test_validate_required_string_missing(self):
         """Test validating required string parameter when missing."""
-        from src.github_project_manager_mcp.utils.validation import ParameterValidator
-
         validator = ParameterValidator()
         result = validator.validate_required_string("project_id", None)
 
@@ -59,8 +71,6 @@ class TestParameterValidator:
 
     def test_validate_enum_value_success(self):
         """Test validating enum value successfully."""
-        from src.github_project_manager_mcp.utils.validation import ParameterValidator
-
         validator = ParameterValidator()
         valid_values = ["Backlog", "In Progress", "Done"]
         result = validator.validate_enum_value("status", "In Progress", valid_values)
@@ -70,8 +80,6 @@ class TestParameterValidator:
 
     def test_validate_enum_value_invalid(self):
         """Test validating enum value with invalid option."""
-        from src.github_project_manager_mcp.utils.validation import ParameterValidator
-
         validator = ParameterValidator()
         valid_values = ["Backlog", "In Progress", "Done"]
         result = validator.validate_enum_value("status", "Invalid", valid_values)
@@ -85,8 +93,6 @@ class TestPRDValidator:
 
     def test_validate_prd_creation_success(self):
         """Test validating PRD creation successfully."""
-        from src.github_project_manager_mcp.utils.validation import PRDValidator
-
         validator = PRDValidator()
         prd_data = {
             "title": "User Authentication System",
@@ -102,8 +108,6 @@ class TestPRDValidator:
 
     def test_validate_prd_creation_missing_title(self):
         """Test validating PRD creation with missing title."""
-        from src.github_project_manager_mcp.utils.validation import PRDValidator
-
         validator = PRDValidator()
         prd_data = {
             "description": "Implement secure user authentication",
@@ -113,7 +117,7 @@ class TestPRDValidator:
         result = validator.validate_prd_creation(prd_data)
 
         assert result.is_valid is False
-        assert any("title is required" in error for error in result.errors)
+        assert "title is required" in " ".join(result.errors)
 
 
 class TestTaskValidator:
@@ -121,8 +125,6 @@ class TestTaskValidator:
 
     def test_validate_task_creation_success(self):
         """Test validating task creation successfully."""
-        from src.github_project_manager_mcp.utils.validation import TaskValidator
-
         validator = TaskValidator()
         task_data = {
             "title": "Implement OAuth provider",
@@ -137,15 +139,13 @@ class TestTaskValidator:
 
     def test_validate_task_creation_missing_parent_prd(self):
         """Test validating task creation with missing parent PRD."""
-        from src.github_project_manager_mcp.utils.validation import TaskValidator
-
         validator = TaskValidator()
         task_data = {"title": "Implement OAuth provider", "priority": "Medium"}
 
         result = validator.validate_task_creation(task_data)
 
         assert result.is_valid is False
-        assert any("parent_prd_id is required" in error for error in result.errors)
+        assert "parent_prd_id is required" in " ".join(result.errors)
 
 
 class TestSubtaskValidator:
@@ -153,8 +153,6 @@ class TestSubtaskValidator:
 
     def test_validate_subtask_creation_success(self):
         """Test validating subtask creation successfully."""
-        from src.github_project_manager_mcp.utils.validation import SubtaskValidator
-
         validator = SubtaskValidator()
         subtask_data = {
             "title": "Write OAuth unit tests",
@@ -169,12 +167,10 @@ class TestSubtaskValidator:
 
     def test_validate_subtask_creation_missing_parent_task(self):
         """Test validating subtask creation with missing parent task."""
-        from src.github_project_manager_mcp.utils.validation import SubtaskValidator
-
         validator = SubtaskValidator()
         subtask_data = {"title": "Write OAuth unit tests", "order": 1}
 
         result = validator.validate_subtask_creation(subtask_data)
 
         assert result.is_valid is False
-        assert any("parent_task_id is required" in error for error in result.errors)
+        assert "parent_task_id is required" in " ".join(result.errors)
@@ -70,6 +70,29 @@ class TestQueryBuilderTaskFiltering:
         assert "field {" in query
         assert "name" in query
 
+    def test_list_tasks_query_uses_named_fragments(self):
+        """Test that shared item selections are emitted once as named fragments."""
+        query = self.query_builder.list_tasks_in_project(project_id="PVT_test123")
+
+        assert "...ProjectItemFields" in query
+        assert query.count("fragment ProjectItemFields on ProjectV2Item") == 1
+        assert query.count("fragment AssigneeFields on UserConnection") == 1
+        assert query.count("...AssigneeFields") == 2
+
+    def test_list_tasks_query_pages_share_one_shape(self):
+        """Test that successive pages differ only in their pagination arguments."""
+        first_page = self.query_builder.list_tasks_in_project(
+            project_id="PVT_test123", first=25
+        )
+        next_page = self.query_builder.list_tasks_in_project(
+            project_id="PVT_test123", first=25, after="cursor123"
+        )
+
+        assert next_page == first_page.replace(
+            "items(first: 25)", 'items(first: 25, after: "cursor123")'
+        )
+        assert "pageInfo" in first_page
+
     def test_list_tasks_query_pagination_args(self):
         """Test that pagination arguments are properly handled."""
         query_with_pagination = self.query_builder.list_tasks_in_project(
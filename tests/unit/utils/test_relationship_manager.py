@@ -5,9 +5,9 @@ This module tests the hierarchical relationship management functionality
 between PRDs, Tasks, and Subtasks in GitHub Projects v2.
 """
 
-from dataclasses import dataclass
-from typing import Any, Dict, List
-from unittest.mock import AsyncMock, MagicMock, patch
+import copy
+from dataclasses import FrozenInstanceError
+from unittest.mock import Mock, patch
 
 import pytest
 
@@ -16,37 +16,325 @@ from github_project_manager_mcp.utils.relationship_manager import (
     RelationshipValidationResult,
 )
 
+# Error messages shared by the parameter and client guards of every method
+_MISSING_PARAMETERS = "Missing required parameters"
+_NO_CLIENT = "GitHub client not initialized"
+
+
+# Message GitHubClient puts in the ValueError it raises for GraphQL errors
+_GRAPHQL_ERROR = "GraphQL errors: API Error"
+
+
+def _graphql_error():
+    """Build a fresh GraphQL error; reraising one instance would grow its traceback."""
+    return ValueError(_GRAPHQL_ERROR)
+
+
+def _assert_valid(result):
+    """Assert a successful result that reports no errors."""
+    assert result.is_valid is True
+    assert not result.errors
+
+
+def _assert_invalid(result, contains=None):
+    """Assert a failed result whose first error mentions ``contains``."""
+    assert result.is_valid is False
+    assert result.errors
+    if contains is not None:
+        assert contains in result.errors[0]
+
+
+def _items_response(items):
+    """Wrap project item nodes in a project items query response."""
+    return {"node": {"items": {"nodes": list(items)}}}
+
+
+def _task_body(parent_prd, status=None, description=None):
+    """Build a task item body as written by the task handlers."""
+    body = f"**Parent PRD:** {parent_prd}"
+    if status is not None:
+        body += f"\n**Status:** {status}"
+    if description is not None:
+        body += f"\n\n{description}"
+    return body
+
+
+def _subtask_body(parent_task, order=None, status=None, description=None):
+    """Build a subtask item body as written by the subtask handlers."""
+    body = f"**Type:** Subtask\n**Parent Task:** {parent_task}"
+    if order is not None:
+        body += f"\n**Order:** {order}"
+    if status is not None:
+        body += f"\n**Status:** {status}"
+    if description is not None:
+        body += f"\n\n{description}"
+    return body
+
+
+def _item_node(item_id, content_id, title, body, *field_values, created_at=None):
+    """Build a project item node; ``field_values`` become its fieldValues."""
+    node = {
+        "id": item_id,
+        "content": {"id": content_id, "title": title, "body": body},
+    }
+    if field_values:
+        node["fieldValues"] = {"nodes": list(field_values)}
+    if created_at is not None:
+        node["createdAt"] = created_at
+    return node
+
+
+def _task_node(number, parent_prd="PVTI_prd123", status=None, body_status=None):
+    """Build the project item node for PVTI_task<number>.
+
+    ``status`` sets the Status field value and ``body_status`` the status line
+    in the body.
+    """
+    field_values = ()
+    if status is not None:
+        field_values = ({"field": {"name": "Status"}, "value": status},)
+    return _item_node(
+        f"PVTI_task{number}",
+        f"DI_task{number}",
+        f"Task {number}",
+        _task_body(
+            parent_prd,
+            status=body_status,
+            description=f"Task {number} description",
+        ),
+        *field_values,
+    )
+
+
+def _subtask_node(number, parent_task="PVTI_task123", status=None):
+    """Build the project item node for PVTI_subtask<number>."""
+    return _item_node(
+        f"PVTI_subtask{number}",
+        f"DI_subtask{number}",
+        f"Subtask {number}",
+        _subtask_body(
+            parent_task,
+            order=number,
+            status=status,
+            description=f"Subtask {number} description",
+        ),
+    )
+
+
+def _build_items(spec):
+    """Yield project item nodes from ``(id, kind, status, parent)`` tuples.
+
+    PRDs and tasks carry ``status`` as a single-select Status field; subtasks
+    carry it in their body, as created by the subtask handlers.
+    """
+    for item_id, kind, status, parent in spec:
+        field_values = ({"field": {"name": "Status"}, "name": status},)
+        if kind == "PRD":
+            body = "**Type:** PRD"
+        elif kind == "Task":
+            body = _task_body(parent)
+        else:
+            body = _subtask_body(parent, status=status)
+            field_values = ()
+        yield _item_node(item_id, f"CONTENT_{item_id}", item_id, body, *field_values)
+
+
+# Status field values, shared rather than rebuilt per node. Text-style values
+# carry the status under "value" (_FV_*); single-select values carry the
+# option under "name" (_FVN_*).
+_FV_DONE = {"field": {"name": "Status"}, "value": "Done"}
+_FV_IN_PROGRESS = {"field": {"name": "Status"}, "value": "In Progress"}
+_FVN_DONE = {"field": {"name": "Status"}, "name": "Done"}
+_FVN_IN_PROGRESS = {"field": {"name": "Status"}, "name": "In Progress"}
+
+# Single-select Priority field value.
+_FVN_PRIORITY_HIGH = {"field": {"name": "Priority"}, "name": "High"}
+
+# Canned GraphQL responses. RelationshipManager only reads these, so they are
+# shared across tests rather than rebuilt in each one.
+_EMPTY_ITEMS_RESPONSE = _items_response(())
+
+# Two tasks parented to PVTI_prd123.
+_PRD_CHILDREN_RESPONSE = _items_response((_task_node(1), _task_node(2)))
+
+# Two subtasks parented to PVTI_task123.
+_TASK_CHILDREN_RESPONSE = _items_response((_subtask_node(1), _subtask_node(2)))
+
+# A consistent PRD -> Task -> Subtask chain.
+_CONSISTENT_HIERARCHY_RESPONSE = _items_response(
+    (
+        # PRD
+        _item_node("PVTI_prd1", "DI_prd1", "PRD 1", "PRD description"),
+        # Task belonging to PRD
+        _item_node(
+            "PVTI_task1",
+            "DI_task1",
+            "Task 1",
+            _task_body("PVTI_prd1", description="Task description"),
+        ),
+        # Subtask belonging to Task
+        _item_node(
+            "PVTI_subtask1",
+            "DI_subtask1",
+            "Subtask 1",
+            _subtask_body("PVTI_task1", order=1, description="Subtask description"),
+        ),
+    )
+)
+
+# Task PVTI_task123 parented to PVTI_prd123.
+_TASK123_RESPONSE = {
+    "node": _item_node(
+        "PVTI_task123",
+        "DI_task123",
+        "Test Task",
+        _task_body("PVTI_prd123", description="Task description"),
+    )
+}
+
+# Task PVTI_task123 parented to a different PRD.
+_TASK123_OTHER_PRD_RESPONSE = {
+    "node": _item_node(
+        "PVTI_task123",
+        "DI_task123",
+        "Test Task",
+        _task_body("PVTI_different_prd", description="Task description"),
+    )
+}
+
+# Subtask PVTI_subtask123 parented to PVTI_task123.
+_SUBTASK123_RESPONSE = {
+    "node": _item_node(
+        "PVTI_subtask123",
+        "DI_subtask123",
+        "Test Subtask",
+        _subtask_body("PVTI_task123", order=1, description="Subtask description"),
+    )
+}
+
+# Subtask PVTI_subtask123 parented to a different task.
+_SUBTASK123_OTHER_TASK_RESPONSE = {
+    "node": _item_node(
+        "PVTI_subtask123",
+        "DI_subtask123",
+        "Test Subtask",
+        _subtask_body(
+            "PVTI_different_task", order=1, description="Subtask description"
+        ),
+    )
+}
+
+# A task with no parent PRD reference.
+_ORPHANED_TASK_RESPONSE = _items_response(
+    (_item_node("PVTI_task1", "DI_task1", "Orphaned Task", "Task without parent PRD"),)
+)
+
+# A task whose parent PRD is not in the project.
+_MISSING_PRD_RESPONSE = _items_response(
+    (
+        _item_node(
+            "PVTI_task1",
+            "DI_task1",
+            "Task 1",
+            _task_body("PVTI_nonexistent_prd", description="Task description"),
+        ),
+    )
+)
+
+# Status field values for a task that is still In Progress.
+_IN_PROGRESS_TASK_FIELDS_RESPONSE = {
+    "node": {
+        "id": "PVTI_task123",
+        "project": {
+            "id": "PVT_project123",
+            "fields": {
+                "nodes": [
+                    {
+                        "id": "FIELD_STATUS_ID",
+                        "name": "Status",
+                        "dataType": "SINGLE_SELECT",
+                    }
+                ]
+            },
+        },
+        "fieldValues": {
+            "nodes": [
+                {
+                    "field": {"id": "FIELD_STATUS_ID", "name": "Status"},
+                    "value": "In Progress",
+                }
+            ]
+        },
+    }
+}
+
+# Two completed subtasks parented to PVTI_task123.
+_COMPLETE_SUBTASKS_RESPONSE = _items_response(
+    (_subtask_node(1, status="Complete"), _subtask_node(2, status="Complete"))
+)
+
+# Queries issued by check_and_complete_parent_task: the task's status, then
+# its children. Tests queue them on the stub client in this order.
+_CASCADE_COMPLETE_QUERIES = (
+    _IN_PROGRESS_TASK_FIELDS_RESPONSE,
+    _COMPLETE_SUBTASKS_RESPONSE,
+)
+
+# Successful task and PRD field updates.
+_TASK_UPDATE_RESPONSE = {
+    "updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_task123"}}
+}
+_PRD_UPDATE_RESPONSE = {
+    "updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_prd123"}}
+}
+
+
+@pytest.fixture(scope="module")
+def null_manager():
+    """Share one client-less RelationshipManager; it holds no other state."""
+    return RelationshipManager()
+
+
+@pytest.fixture
+def relationship_manager(stub_github_client):
+    """Create a RelationshipManager backed by the queue-based stub client."""
+    return RelationshipManager(github_client=stub_github_client)
+
 
 class TestRelationshipValidationResult:
     """Test the RelationshipValidationResult dataclass."""
 
-    def test_relationship_validation_result_creation(self):
-        """Test creating a RelationshipValidationResult."""
+    @pytest.mark.parametrize(
+        "is_valid,errors,warnings,metadata",
+        [
+            (True, [], ["test warning"], {"test": "data"}),
+            (False, ["validation failed", "missing data"], [], {}),
+        ],
+        ids=["valid_with_warning", "invalid_with_errors"],
+    )
+    def test_relationship_validation_result_creation(
+        self, is_valid, errors, warnings, metadata
+    ):
+        """Test that a RelationshipValidationResult keeps the fields it was given."""
         result = RelationshipValidationResult(
-            is_valid=True,
-            errors=[],
-            warnings=["test warning"],
-            metadata={"test": "data"},
+            is_valid=is_valid, errors=errors, warnings=warnings, metadata=metadata
         )
 
-        assert result.is_valid is True
-        assert result.errors == []
-        assert result.warnings == ["test warning"]
-        assert result.metadata == {"test": "data"}
+        assert result.is_valid is is_valid
+        assert result.errors == errors
+        assert result.warnings == warnings
+        assert result.metadata == metadata
 
-    def test_relationship_validation_result_with_errors(self):
-        """Test creating a RelationshipValidationResult with errors."""
+    def test_relationship_validation_result_is_slotted_and_frozen(self):
+        """Test that results carry no instance dict and reject reassignment."""
         result = RelationshipValidationResult(
-            is_valid=False,
-            errors=["validation failed", "missing data"],
-            warnings=[],
-            metadata={},
+            is_valid=True, errors=[], warnings=[], metadata={}
         )
 
-        assert result.is_valid is False
-        assert len(result.errors) == 2
-        assert "validation failed" in result.errors
-        assert "missing data" in result.errors
+        assert "__slots__" in RelationshipValidationResult.__dict__
+        assert not hasattr(result, "__dict__")
+        with pytest.raises(FrozenInstanceError):
+            result.is_valid = False
 
 
 class TestRelationshipManager:
@@ -54,10 +342,10 @@ class TestRelationshipManager:
 
     def test_relationship_manager_initialization(self):
         """Test RelationshipManager initialization."""
-        mock_client = MagicMock()
+        mock_client = Mock(spec=[])
         manager = RelationshipManager(github_client=mock_client)
 
-        assert manager.github_client == mock_client
+        assert manager.github_client is mock_client
 
     def test_relationship_manager_initialization_without_client(self):
         """Test RelationshipManager initialization without GitHub client."""
@@ -69,918 +357,497 @@ class TestRelationshipManager:
 class TestValidatePrdTaskRelationship:
     """Test cases for validate_prd_task_relationship method."""
 
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_success(self):
+    async def test_validate_prd_task_relationship_success(
+        self, relationship_manager, stub_github_client
+    ):
         """Test successful PRD-Task relationship validation."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
         # Mock successful API response showing task belongs to PRD
-        mock_task_response = {
-            "node": {
-                "id": "PVTI_task123",
-                "content": {
-                    "id": "DI_task123",
-                    "title": "Test Task",
-                    "body": "**Parent PRD:** PVTI_prd123\n\nTask description",
-                },
-            }
-        }
-        mock_client.query.return_value = mock_task_response
+        stub_github_client.query_results.append(_TASK123_RESPONSE)
 
-        result = await manager.validate_prd_task_relationship(
+        result = await relationship_manager.validate_prd_task_relationship(
             project_id="PVT_project123",
             prd_item_id="PVTI_prd123",
             task_item_id="PVTI_task123",
         )
 
         # Should succeed for valid relationship
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_missing_project_id(self):
-        """Test PRD-Task validation with missing project_id."""
-        manager = RelationshipManager()
-
-        result = await manager.validate_prd_task_relationship(
-            project_id="", prd_item_id="PVTI_prd123", task_item_id="PVTI_task123"
-        )
-
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_missing_prd_id(self):
-        """Test PRD-Task validation with missing prd_item_id."""
-        manager = RelationshipManager()
-
-        result = await manager.validate_prd_task_relationship(
-            project_id="PVT_project123", prd_item_id="", task_item_id="PVTI_task123"
-        )
-
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_missing_task_id(self):
-        """Test PRD-Task validation with missing task_item_id."""
-        manager = RelationshipManager()
-
-        result = await manager.validate_prd_task_relationship(
-            project_id="PVT_project123", prd_item_id="PVTI_prd123", task_item_id=""
+        _assert_valid(result)
+        # Each lookup is answered by a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
+
+    @pytest.mark.parametrize(
+        "project_id,prd_item_id,task_item_id",
+        [
+            ("", "PVTI_prd123", "PVTI_task123"),
+            ("PVT_project123", "", "PVTI_task123"),
+            ("PVT_project123", "PVTI_prd123", ""),
+        ],
+        ids=["project_id", "prd_item_id", "task_item_id"],
+    )
+    async def test_validate_prd_task_relationship_missing_parameter(
+        self, null_manager, project_id, prd_item_id, task_item_id
+    ):
+        """Test PRD-Task validation with a missing required parameter."""
+        result = await null_manager.validate_prd_task_relationship(
+            project_id=project_id, prd_item_id=prd_item_id, task_item_id=task_item_id
         )
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
+        _assert_invalid(result, _MISSING_PARAMETERS)
 
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_invalid_relationship(self):
+    async def test_validate_prd_task_relationship_invalid_relationship(
+        self, relationship_manager, stub_github_client
+    ):
         """Test PRD-Task validation with invalid relationship."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
         # Mock API response showing task belongs to different PRD
-        mock_task_response = {
-            "node": {
-                "id": "PVTI_task123",
-                "content": {
-                    "id": "DI_task123",
-                    "title": "Test Task",
-                    "body": "**Parent PRD:** PVTI_different_prd\n\nTask description",
-                },
-            }
-        }
-        mock_client.query.return_value = mock_task_response
+        stub_github_client.query_results.append(_TASK123_OTHER_PRD_RESPONSE)
 
-        result = await manager.validate_prd_task_relationship(
+        result = await relationship_manager.validate_prd_task_relationship(
             project_id="PVT_project123",
             prd_item_id="PVTI_prd123",
             task_item_id="PVTI_task123",
         )
 
         # Should fail for invalid relationship
-        assert result.is_valid is False
-        assert len(result.errors) > 0
-
-    @pytest.mark.asyncio
-    async def test_validate_prd_task_relationship_api_exception(self):
-        """Test PRD-Task validation with API exception."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
+        _assert_invalid(result)
 
-        result = await manager.validate_prd_task_relationship(
-            project_id="PVT_project123",
-            prd_item_id="PVTI_prd123",
-            task_item_id="PVTI_task123",
-        )
 
-        assert result.is_valid is False
-        assert "Validation failed" in result.errors[0]
+class TestItemLookupCache:
+    """Test cases for reuse of single-item lookups."""
 
+    @pytest.fixture
+    def caching_manager(self, stub_github_client):
+        """Create a RelationshipManager with item lookup caching enabled."""
+        return RelationshipManager(github_client=stub_github_client, cache_ttl=30.0)
 
-class TestValidateTaskSubtaskRelationship:
-    """Test cases for validate_task_subtask_relationship method."""
+    async def test_caching_is_off_by_default(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test each validation queries the item unless a cache TTL is set."""
+        stub_github_client.query_results.append(_TASK123_RESPONSE)
 
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_success(self):
-        """Test successful Task-Subtask relationship validation."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+        for _ in range(2):
+            result = await relationship_manager.validate_prd_task_relationship(
+                project_id="PVT_project123",
+                prd_item_id="PVTI_prd123",
+                task_item_id="PVTI_task123",
+            )
+            _assert_valid(result)
 
-        # Mock successful API response showing subtask belongs to task
-        mock_subtask_response = {
-            "node": {
-                "id": "PVTI_subtask123",
-                "content": {
-                    "id": "DI_subtask123",
-                    "title": "Test Subtask",
-                    "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 1\n\nSubtask description",
-                },
-            }
-        }
-        mock_client.query.return_value = mock_subtask_response
+        assert len(stub_github_client.query_calls) == 2
 
-        result = await manager.validate_task_subtask_relationship(
-            project_id="PVT_project123",
-            task_item_id="PVTI_task123",
-            subtask_item_id="PVTI_subtask123",
-        )
+    async def test_repeated_validation_queries_once(
+        self, caching_manager, stub_github_client
+    ):
+        """Test validating the same task twice sends a single query."""
+        stub_github_client.query_results.append(_TASK123_RESPONSE)
 
-        # Should succeed for valid relationship
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        for _ in range(2):
+            result = await caching_manager.validate_prd_task_relationship(
+                project_id="PVT_project123",
+                prd_item_id="PVTI_prd123",
+                task_item_id="PVTI_task123",
+            )
+            _assert_valid(result)
 
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_missing_project_id(self):
-        """Test Task-Subtask validation with missing project_id."""
-        manager = RelationshipManager()
+        assert len(stub_github_client.query_calls) == 1
 
-        result = await manager.validate_task_subtask_relationship(
-            project_id="",
-            task_item_id="PVTI_task123",
-            subtask_item_id="PVTI_subtask123",
-        )
+    async def test_cached_responses_are_copies(
+        self, caching_manager, stub_github_client
+    ):
+        """Test changing a returned response does not alter later cache hits."""
+        stub_github_client.query_results.append(copy.deepcopy(_TASK123_RESPONSE))
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
+        first = await caching_manager._fetch_item("PVT_project123", "PVTI_task123")
+        first["node"]["content"]["body"] = ""
+        second = await caching_manager._fetch_item("PVT_project123", "PVTI_task123")
 
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_missing_task_id(self):
-        """Test Task-Subtask validation with missing task_item_id."""
-        manager = RelationshipManager()
+        assert second == _TASK123_RESPONSE
+        assert len(stub_github_client.query_calls) == 1
 
-        result = await manager.validate_task_subtask_relationship(
-            project_id="PVT_project123",
-            task_item_id="",
-            subtask_item_id="PVTI_subtask123",
+    async def test_missing_item_is_not_cached(
+        self, caching_manager, stub_github_client
+    ):
+        """Test a missing parent is looked up again on the next check."""
+        stub_github_client.query_results.append(_MISSING_NODE_RESPONSE)
+
+        for _ in range(2):
+            await caching_manager.validate_parent_exists(
+                "PROJECT_123", "NONEXISTENT_PRD", "PRD"
+            )
+
+        assert len(stub_github_client.query_calls) == 2
+
+    @pytest.mark.parametrize(
+        "cache_size,item_ids,expected_queries",
+        [
+            (1, ["PRD_123", "PRD_456", "PRD_123"], 3),
+            (2, ["PRD_123", "PRD_456", "PRD_123"], 2),
+        ],
+        ids=["evicted", "retained"],
+    )
+    async def test_cache_size_bound(
+        self, stub_github_client, cache_size, item_ids, expected_queries
+    ):
+        """Test the least recently used lookup is evicted past cache_size."""
+        manager = RelationshipManager(
+            github_client=stub_github_client, cache_size=cache_size, cache_ttl=30.0
         )
+        stub_github_client.query_results.append(_EXISTING_PRD_NODE_RESPONSE)
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_missing_subtask_id(self):
-        """Test Task-Subtask validation with missing subtask_item_id."""
-        manager = RelationshipManager()
+        for item_id in item_ids:
+            result = await manager.validate_parent_exists("PROJECT_123", item_id, "PRD")
+            assert result.is_valid is True
 
-        result = await manager.validate_task_subtask_relationship(
-            project_id="PVT_project123", task_item_id="PVTI_task123", subtask_item_id=""
-        )
+        assert len(stub_github_client.query_calls) == expected_queries
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
 
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_invalid_relationship(self):
-        """Test Task-Subtask validation with invalid relationship."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+class TestValidateTaskSubtaskRelationship:
+    """Test cases for validate_task_subtask_relationship method."""
 
-        # Mock API response showing subtask belongs to different task
-        mock_subtask_response = {
-            "node": {
-                "id": "PVTI_subtask123",
-                "content": {
-                    "id": "DI_subtask123",
-                    "title": "Test Subtask",
-                    "body": "**Type:** Subtask\n**Parent Task:** PVTI_different_task\n**Order:** 1\n\nSubtask description",
-                },
-            }
-        }
-        mock_client.query.return_value = mock_subtask_response
+    async def test_validate_task_subtask_relationship_success(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test successful Task-Subtask relationship validation."""
+        # Mock successful API response showing subtask belongs to task
+        stub_github_client.query_results.append(_SUBTASK123_RESPONSE)
 
-        result = await manager.validate_task_subtask_relationship(
+        result = await relationship_manager.validate_task_subtask_relationship(
             project_id="PVT_project123",
             task_item_id="PVTI_task123",
             subtask_item_id="PVTI_subtask123",
         )
 
-        # Should fail for invalid relationship
-        assert result.is_valid is False
-        assert len(result.errors) > 0
+        # Should succeed for valid relationship
+        _assert_valid(result)
+        # Each lookup is answered by a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
+
+    @pytest.mark.parametrize(
+        "project_id,task_item_id,subtask_item_id",
+        [
+            ("", "PVTI_task123", "PVTI_subtask123"),
+            ("PVT_project123", "", "PVTI_subtask123"),
+            ("PVT_project123", "PVTI_task123", ""),
+        ],
+        ids=["project_id", "task_item_id", "subtask_item_id"],
+    )
+    async def test_validate_task_subtask_relationship_missing_parameter(
+        self, null_manager, project_id, task_item_id, subtask_item_id
+    ):
+        """Test Task-Subtask validation with a missing required parameter."""
+        result = await null_manager.validate_task_subtask_relationship(
+            project_id=project_id,
+            task_item_id=task_item_id,
+            subtask_item_id=subtask_item_id,
+        )
 
-    @pytest.mark.asyncio
-    async def test_validate_task_subtask_relationship_api_exception(self):
-        """Test Task-Subtask validation with API exception."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+        _assert_invalid(result, _MISSING_PARAMETERS)
 
-        # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
+    async def test_validate_task_subtask_relationship_invalid_relationship(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test Task-Subtask validation with invalid relationship."""
+        # Mock API response showing subtask belongs to different task
+        stub_github_client.query_results.append(_SUBTASK123_OTHER_TASK_RESPONSE)
 
-        result = await manager.validate_task_subtask_relationship(
+        result = await relationship_manager.validate_task_subtask_relationship(
             project_id="PVT_project123",
             task_item_id="PVTI_task123",
             subtask_item_id="PVTI_subtask123",
         )
 
-        assert result.is_valid is False
-        assert "Validation failed" in result.errors[0]
+        # Should fail for invalid relationship
+        _assert_invalid(result)
+
+
+# (method, kwargs) for the child lookups, which return a plain list.
+_CHILDREN_LOOKUPS = (
+    pytest.param(
+        "get_prd_children",
+        {"project_id": "PVT_project123", "prd_item_id": "PVTI_prd123"},
+        id="prd_children",
+    ),
+    pytest.param(
+        "get_task_children",
+        {"project_id": "PVT_project123", "task_item_id": "PVTI_task123"},
+        id="task_children",
+    ),
+)
 
 
-class TestGetPrdChildren:
-    """Test cases for get_prd_children method."""
+class TestGetChildren:
+    """Test cases for get_prd_children and get_task_children methods."""
 
-    @pytest.mark.asyncio
-    async def test_get_prd_children_success(self):
+    async def test_get_prd_children_success(
+        self, relationship_manager, stub_github_client
+    ):
         """Test successful retrieval of PRD children (tasks)."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock API response with tasks belonging to PRD
-        mock_tasks_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 1 description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 2 description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_client.query.return_value = mock_tasks_response
+        stub_github_client.query_results.append(_PRD_CHILDREN_RESPONSE)
 
-        children = await manager.get_prd_children(
+        children = await relationship_manager.get_prd_children(
             project_id="PVT_project123", prd_item_id="PVTI_prd123"
         )
 
         # Should return list of child tasks
         assert isinstance(children, list)
         assert len(children) == 2
+        # Each lookup is answered by a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_get_prd_children_empty_result(self):
-        """Test PRD children retrieval with no tasks."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock API response with no tasks
-        mock_empty_response = {"node": {"items": {"nodes": []}}}
-        mock_client.query.return_value = mock_empty_response
+    async def test_get_task_children_success(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test successful retrieval of Task children (subtasks)."""
+        stub_github_client.query_results.append(_TASK_CHILDREN_RESPONSE)
 
-        children = await manager.get_prd_children(
-            project_id="PVT_project123", prd_item_id="PVTI_prd123"
+        children = await relationship_manager.get_task_children(
+            project_id="PVT_project123", task_item_id="PVTI_task123"
         )
 
+        # Should return list of child subtasks
         assert isinstance(children, list)
-        assert len(children) == 0
+        assert len(children) == 2
+        # Each lookup is answered by a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_get_prd_children_api_exception(self):
-        """Test PRD children retrieval with API exception."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+    @pytest.mark.parametrize("method,kwargs", _CHILDREN_LOOKUPS)
+    async def test_get_children_empty_result(
+        self, relationship_manager, stub_github_client, method, kwargs
+    ):
+        """Test children retrieval when the parent has no children."""
+        stub_github_client.query_results.append(_EMPTY_ITEMS_RESPONSE)
 
-        # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
+        children = await getattr(relationship_manager, method)(**kwargs)
 
-        children = await manager.get_prd_children(
-            project_id="PVT_project123", prd_item_id="PVTI_prd123"
-        )
+        assert children == []
 
-        # Should return empty list on error
-        assert isinstance(children, list)
-        assert len(children) == 0
 
+class TestValidateHierarchyConsistency:
+    """Test cases for validate_hierarchy_consistency method."""
 
-class TestGetTaskChildren:
-    """Test cases for get_task_children method."""
+    async def test_validate_hierarchy_consistency_success(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test successful hierarchy consistency validation."""
+        stub_github_client.query_results.append(_CONSISTENT_HIERARCHY_RESPONSE)
 
-    @pytest.mark.asyncio
-    async def test_get_task_children_success(self):
-        """Test successful retrieval of Task children (subtasks)."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+        result = await relationship_manager.validate_hierarchy_consistency(
+            project_id="PVT_project123"
+        )
 
-        # Mock API response with subtasks belonging to task
-        mock_subtasks_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 1\n\nSubtask 1 description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask2",
-                            "content": {
-                                "id": "DI_subtask2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 2\n\nSubtask 2 description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_client.query.return_value = mock_subtasks_response
+        # Should succeed for consistent hierarchy
+        _assert_valid(result)
+        # The whole project is read with a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
+
+    @pytest.mark.parametrize(
+        "response",
+        [_ORPHANED_TASK_RESPONSE, _MISSING_PRD_RESPONSE],
+        ids=["orphaned_items", "missing_parents"],
+    )
+    async def test_validate_hierarchy_consistency_inconsistent(
+        self, relationship_manager, stub_github_client, response
+    ):
+        """Test hierarchy validation with orphaned or dangling parent references."""
+        stub_github_client.query_results.append(response)
 
-        children = await manager.get_task_children(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
+        result = await relationship_manager.validate_hierarchy_consistency(
+            project_id="PVT_project123"
         )
 
-        # Should return list of child subtasks
-        assert isinstance(children, list)
-        assert len(children) == 2
+        # Should fail for inconsistent hierarchy
+        _assert_invalid(result)
 
-    @pytest.mark.asyncio
-    async def test_get_task_children_empty_result(self):
-        """Test Task children retrieval with no subtasks."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
 
-        # Mock API response with no subtasks
-        mock_empty_response = {"node": {"items": {"nodes": []}}}
-        mock_client.query.return_value = mock_empty_response
+class TestApiExceptionHandling:
+    """Test that GitHub API errors are reported rather than raised."""
 
-        children = await manager.get_task_children(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
-        )
+    @pytest.mark.parametrize(
+        "method,kwargs,expected_error",
+        [
+            (
+                "validate_prd_task_relationship",
+                {
+                    "project_id": "PVT_project123",
+                    "prd_item_id": "PVTI_prd123",
+                    "task_item_id": "PVTI_task123",
+                },
+                "Validation failed",
+            ),
+            (
+                "validate_task_subtask_relationship",
+                {
+                    "project_id": "PVT_project123",
+                    "task_item_id": "PVTI_task123",
+                    "subtask_item_id": "PVTI_subtask123",
+                },
+                "Validation failed",
+            ),
+            (
+                "validate_hierarchy_consistency",
+                {"project_id": "PVT_project123"},
+                "Hierarchy validation failed",
+            ),
+        ],
+        ids=["prd_task", "task_subtask", "hierarchy"],
+    )
+    async def test_validation_api_exception(
+        self, relationship_manager, stub_github_client, method, kwargs, expected_error
+    ):
+        """Test that validation methods return a failed result on API errors."""
+        stub_github_client.query_results.append(_graphql_error())
 
-        assert isinstance(children, list)
-        assert len(children) == 0
+        result = await getattr(relationship_manager, method)(**kwargs)
 
-    @pytest.mark.asyncio
-    async def test_get_task_children_api_exception(self):
-        """Test Task children retrieval with API exception."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+        _assert_invalid(result, f"{expected_error}: {_GRAPHQL_ERROR}")
 
-        # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
+    @pytest.mark.parametrize("method,kwargs", _CHILDREN_LOOKUPS)
+    async def test_children_api_exception(
+        self, relationship_manager, stub_github_client, method, kwargs
+    ):
+        """Test that children lookups return an empty list on API errors."""
+        stub_github_client.query_results.append(_graphql_error())
 
-        children = await manager.get_task_children(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
-        )
+        children = await getattr(relationship_manager, method)(**kwargs)
 
-        # Should return empty list on error
-        assert isinstance(children, list)
-        assert len(children) == 0
+        assert children == []
 
 
-class TestValidateHierarchyConsistency:
-    """Test cases for validate_hierarchy_consistency method."""
+class TestCascadeCompletion:
+    """Test cases for cascade completion logic."""
 
-    @pytest.mark.asyncio
-    async def test_validate_hierarchy_consistency_success(self):
-        """Test successful hierarchy consistency validation."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+    async def test_check_and_complete_parent_task_success(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test successful cascade completion of task when all subtasks are complete."""
 
-        # Mock API responses for comprehensive hierarchy check
-        mock_project_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        # PRD
-                        {
-                            "id": "PVTI_prd1",
-                            "content": {
-                                "id": "DI_prd1",
-                                "title": "PRD 1",
-                                "body": "PRD description",
-                            },
-                        },
-                        # Task belonging to PRD
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd1\n\nTask description",
-                            },
-                        },
-                        # Subtask belonging to Task
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task1\n**Order:** 1\n\nSubtask description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_client.query.return_value = mock_project_response
+        stub_github_client.query_results.extend(_CASCADE_COMPLETE_QUERIES)
+        stub_github_client.mutate_results.append(_TASK_UPDATE_RESPONSE)
 
-        result = await manager.validate_hierarchy_consistency(
-            project_id="PVT_project123"
+        result = await relationship_manager.check_and_complete_parent_task(
+            project_id="PVT_project123", task_item_id="PVTI_task123"
         )
 
-        # Should succeed for consistent hierarchy
+        # Should complete the task since all subtasks are complete
         assert result.is_valid is True
-        assert len(result.errors) == 0
+        assert "completed automatically" in result.metadata.get("action", "").lower()
+        assert (
+            stub_github_client.mutate_calls
+        )  # Task completion mutation should be called
 
-    @pytest.mark.asyncio
-    async def test_validate_hierarchy_consistency_orphaned_items(self):
-        """Test hierarchy validation with orphaned items."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
+    async def test_check_and_complete_parent_task_incomplete_children(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test that task is not completed when some subtasks are incomplete."""
+        mock_subtasks_response = _items_response(
+            (_subtask_node(1, status="Complete"), _subtask_node(2, status="Incomplete"))
+        )
+
+        stub_github_client.query_results.append(mock_subtasks_response)
+
+        result = await relationship_manager.check_and_complete_parent_task(
+            project_id="PVT_project123", task_item_id="PVTI_task123"
+        )
+
+        # Should not complete the task since not all subtasks are complete
+        assert result.is_valid is True
+        assert "not all children complete" in result.metadata.get("reason", "").lower()
+        assert (
+            not stub_github_client.mutate_calls
+        )  # No completion mutation should be called
 
-        # Mock API response with orphaned task (no parent PRD)
-        mock_project_response = {
+    async def test_check_and_complete_parent_task_already_complete(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test that already complete task is not processed again."""
+        # Mock task field values showing task is already complete
+        mock_task_fields_response = {
             "node": {
-                "items": {
+                "id": "PVTI_task123",
+                "project": {
+                    "id": "PVT_project123",
+                    "fields": {
+                        "nodes": [
+                            {
+                                "id": "FIELD_STATUS_ID",
+                                "name": "Status",
+                                "dataType": "SINGLE_SELECT",
+                            }
+                        ]
+                    },
+                },
+                "fieldValues": {
                     "nodes": [
                         {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Orphaned Task",
-                                "body": "Task without parent PRD",
-                            },
+                            "field": {"id": "FIELD_STATUS_ID", "name": "Status"},
+                            "value": "Done",
                         }
                     ]
-                }
+                },
             }
         }
-        mock_client.query.return_value = mock_project_response
 
-        result = await manager.validate_hierarchy_consistency(
-            project_id="PVT_project123"
-        )
-
-        # Should fail for inconsistent hierarchy
-        assert result.is_valid is False
-        assert len(result.errors) > 0
-
-    @pytest.mark.asyncio
-    async def test_validate_hierarchy_consistency_missing_parents(self):
-        """Test hierarchy validation with missing parent references."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock API response with task referencing non-existent PRD
-        mock_project_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_nonexistent_prd\n\nTask description",
-                            },
-                        }
-                    ]
-                }
-            }
-        }
-        mock_client.query.return_value = mock_project_response
-
-        result = await manager.validate_hierarchy_consistency(
-            project_id="PVT_project123"
-        )
-
-        # Should fail for missing parent references
-        assert result.is_valid is False
-        assert len(result.errors) > 0
-
-    @pytest.mark.asyncio
-    async def test_validate_hierarchy_consistency_api_exception(self):
-        """Test hierarchy validation with API exception."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
-
-        result = await manager.validate_hierarchy_consistency(
-            project_id="PVT_project123"
-        )
-
-        assert result.is_valid is False
-        assert "Hierarchy validation failed" in result.errors[0]
-
-
-class TestCascadeCompletion:
-    """Test cases for cascade completion logic."""
-
-    @pytest.mark.asyncio
-    async def test_check_and_complete_parent_task_success(self):
-        """Test successful cascade completion of task when all subtasks are complete."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock task field values response (showing task is not yet complete) - FIRST CALL
-        mock_task_fields_response = {
-            "node": {
-                "id": "PVTI_task123",
-                "project": {
-                    "id": "PVT_project123",
-                    "fields": {
-                        "nodes": [
-                            {
-                                "id": "FIELD_STATUS_ID",
-                                "name": "Status",
-                                "dataType": "SINGLE_SELECT",
-                            }
-                        ]
-                    },
-                },
-                "fieldValues": {
-                    "nodes": [
-                        {
-                            "field": {"id": "FIELD_STATUS_ID", "name": "Status"},
-                            "value": "In Progress",
-                        }
-                    ]
-                },
-            }
-        }
-
-        # Mock the main project items query that get_task_children uses - SECOND CALL
-        mock_project_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 1\n**Status:** Complete\n\nSubtask 1 description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask2",
-                            "content": {
-                                "id": "DI_subtask2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 2\n**Status:** Complete\n\nSubtask 2 description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        # Mock successful task completion response
-        mock_task_update_response = {
-            "updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_task123"}}
-        }
-
-        mock_client.query.side_effect = [
-            mock_task_fields_response,  # First call: get task status
-            mock_project_response,  # Second call: get_task_children query for project items
-        ]
-        mock_client.mutate.return_value = mock_task_update_response
-
-        result = await manager.check_and_complete_parent_task(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
-        )
-
-        # Should complete the task since all subtasks are complete
-        assert result.is_valid is True
-        assert "completed automatically" in result.metadata.get("action", "").lower()
-        assert mock_client.mutate.called  # Task completion mutation should be called
-
-    @pytest.mark.asyncio
-    async def test_check_and_complete_parent_task_incomplete_children(self):
-        """Test that task is not completed when some subtasks are incomplete."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock subtasks with mixed completion status
-        mock_subtasks_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 1\n**Status:** Complete\n\nSubtask 1 description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask2",
-                            "content": {
-                                "id": "DI_subtask2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 2\n**Status:** Incomplete\n\nSubtask 2 description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        mock_client.query.return_value = mock_subtasks_response
-
-        result = await manager.check_and_complete_parent_task(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
-        )
-
-        # Should not complete the task since not all subtasks are complete
-        assert result.is_valid is True
-        assert "not all children complete" in result.metadata.get("reason", "").lower()
-        assert not mock_client.mutate.called  # No completion mutation should be called
-
-    @pytest.mark.asyncio
-    async def test_check_and_complete_parent_task_already_complete(self):
-        """Test that already complete task is not processed again."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock task field values showing task is already complete
-        mock_task_fields_response = {
-            "node": {
-                "id": "PVTI_task123",
-                "project": {
-                    "id": "PVT_project123",
-                    "fields": {
-                        "nodes": [
-                            {
-                                "id": "FIELD_STATUS_ID",
-                                "name": "Status",
-                                "dataType": "SINGLE_SELECT",
-                            }
-                        ]
-                    },
-                },
-                "fieldValues": {
-                    "nodes": [
-                        {
-                            "field": {"id": "FIELD_STATUS_ID", "name": "Status"},
-                            "value": "Done",
-                        }
-                    ]
-                },
-            }
-        }
-
-        mock_client.query.return_value = mock_task_fields_response
-
-        result = await manager.check_and_complete_parent_task(
-            project_id="PVT_project123", task_item_id="PVTI_task123"
+        stub_github_client.query_results.append(mock_task_fields_response)
+
+        result = await relationship_manager.check_and_complete_parent_task(
+            project_id="PVT_project123", task_item_id="PVTI_task123"
         )
 
         # Should return success but no action needed
         assert result.is_valid is True
         assert "already complete" in result.metadata.get("reason", "").lower()
-        assert not mock_client.mutate.called
-
-    @pytest.mark.asyncio
-    async def test_check_and_complete_parent_prd_success(self):
-        """Test successful cascade completion of PRD when all tasks are complete."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock PRD field values response (showing PRD is not yet complete) - FIRST CALL
-        mock_prd_fields_response = {
-            "node": {
-                "id": "PVTI_prd123",
-                "project": {
-                    "id": "PVT_project123",
-                    "fields": {
-                        "nodes": [
-                            {
-                                "id": "FIELD_STATUS_ID",
-                                "name": "Status",
-                                "dataType": "SINGLE_SELECT",
-                            }
-                        ]
-                    },
-                },
-                "fieldValues": {
-                    "nodes": [
-                        {
-                            "field": {"id": "FIELD_STATUS_ID", "name": "Status"},
-                            "value": "In Progress",
-                        }
-                    ]
-                },
-            }
-        }
-
-        # Mock the main project items query that get_prd_children uses - SECOND CALL
-        mock_project_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 1 description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 2 description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        # Mock the task completion status query for checking if all tasks are complete - THIRD CALL
-        mock_tasks_status_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 1 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "value": "Done"}
-                                ]
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 2 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "value": "Done"}
-                                ]
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        # Mock successful PRD completion response
-        mock_prd_update_response = {
-            "updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_prd123"}}
-        }
-
-        # Mock the project response with tasks that have field values showing completion status
-        mock_project_with_status_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd123\n**Status:** Done\n\nTask 1 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "value": "Done"}
-                                ]
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PVTI_prd123\n**Status:** Done\n\nTask 2 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "value": "Done"}
-                                ]
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_client.query.return_value = mock_project_with_status_response
-        mock_client.mutate.return_value = mock_prd_update_response
-
-        result = await manager.check_and_complete_parent_prd(
-            project_id="PVT_project123", prd_item_id="PVTI_prd123"
+        assert not stub_github_client.mutate_calls
+
+    @pytest.mark.parametrize(
+        "statuses,metadata_key,expected_text",
+        [
+            (("Done", "Done"), "action", "completed automatically"),
+            (("Done", "In Progress"), "reason", "not all children complete"),
+        ],
+        ids=["all_complete", "incomplete_children"],
+    )
+    async def test_check_and_complete_parent_prd(
+        self,
+        relationship_manager,
+        stub_github_client,
+        statuses,
+        metadata_key,
+        expected_text,
+    ):
+        """Test that a PRD is completed only when all of its tasks are complete."""
+        stub_github_client.query_results.append(
+            _items_response(
+                _task_node(number, status=status, body_status=status)
+                for number, status in enumerate(statuses, 1)
+            )
         )
+        stub_github_client.mutate_results.append(_PRD_UPDATE_RESPONSE)
 
-        # Should complete the PRD since all tasks are complete
-        assert result.is_valid is True
-        assert "completed automatically" in result.metadata.get("action", "").lower()
-        assert mock_client.mutate.called  # PRD completion mutation should be called
-
-    @pytest.mark.asyncio
-    async def test_check_and_complete_parent_prd_incomplete_children(self):
-        """Test that PRD is not completed when some tasks are incomplete."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
-        # Mock tasks with mixed completion status
-        mock_tasks_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 1 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "value": "Done"}
-                                ]
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PVTI_prd123\n\nTask 2 description",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {
-                                        "field": {"name": "Status"},
-                                        "value": "In Progress",
-                                    }
-                                ]
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        mock_client.query.return_value = mock_tasks_response
-
-        result = await manager.check_and_complete_parent_prd(
+        result = await relationship_manager.check_and_complete_parent_prd(
             project_id="PVT_project123", prd_item_id="PVTI_prd123"
         )
 
-        # Should not complete the PRD since not all tasks are complete
         assert result.is_valid is True
-        assert "not all children complete" in result.metadata.get("reason", "").lower()
-        assert not mock_client.mutate.called  # No completion mutation should be called
-
-    @pytest.mark.asyncio
-    async def test_cascade_completion_full_hierarchy(self):
+        assert expected_text in result.metadata.get(metadata_key, "").lower()
+        # The PRD completion mutation runs only when every task is done
+        assert bool(stub_github_client.mutate_calls) is (set(statuses) == {"Done"})
+        # Children and their status come from a single items query
+        assert len(stub_github_client.query_calls) == 1
+
+    async def test_cascade_completion_full_hierarchy(
+        self, relationship_manager, stub_github_client
+    ):
         """Test full cascade completion from subtask to task to PRD."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
         # Mock the subtask query to get parent task ID
         mock_subtask_response = {
             "node": {
                 "content": {
-                    "body": "**Type:** Subtask\n**Parent Task:** PVTI_task123\n**Order:** 1\n**Status:** Complete\n\nSubtask description"
+                    "body": _subtask_body(
+                        "PVTI_task123",
+                        order=1,
+                        status="Complete",
+                        description="Subtask description",
+                    )
                 }
             }
         }
@@ -988,7 +855,9 @@ class TestCascadeCompletion:
         # Mock the task query to get parent PRD ID
         mock_task_response = {
             "node": {
-                "content": {"body": "**Parent PRD:** PVTI_prd123\n\nTask description"}
+                "content": {
+                    "body": _task_body("PVTI_prd123", description="Task description")
+                }
             }
         }
 
@@ -997,13 +866,15 @@ class TestCascadeCompletion:
             "updateProjectV2ItemFieldValue": {"projectV2Item": {"id": "PVTI_updated"}}
         }
 
-        mock_client.query.side_effect = [
-            mock_subtask_response,  # First call: get subtask to find parent task
-            mock_task_response,  # Second call: get task to find parent PRD
-        ]
-        mock_client.mutate.return_value = mock_mutation_response
+        stub_github_client.query_results.extend(
+            (
+                mock_subtask_response,  # First call: get subtask to find parent task
+                mock_task_response,  # Second call: get task to find parent PRD
+            )
+        )
+        stub_github_client.mutate_results.append(mock_mutation_response)
 
-        result = await manager.cascade_completion_check(
+        result = await relationship_manager.cascade_completion_check(
             project_id="PVT_project123",
             completed_item_id="PVTI_subtask1",
             item_type="subtask",
@@ -1016,561 +887,364 @@ class TestCascadeCompletion:
             len(result.metadata.get("cascade_actions", [])) >= 1
         )  # At least one cascade action should occur
 
-    @pytest.mark.asyncio
-    async def test_cascade_completion_error_handling(self):
+    async def test_cascade_completion_error_handling(
+        self, relationship_manager, stub_github_client
+    ):
         """Test error handling in cascade completion logic."""
-        mock_client = AsyncMock()
-        manager = RelationshipManager(github_client=mock_client)
-
         # Mock API exception
-        mock_client.query.side_effect = Exception("GitHub API error")
+        stub_github_client.query_results.append(_graphql_error())
 
-        result = await manager.cascade_completion_check(
+        result = await relationship_manager.cascade_completion_check(
             project_id="PVT_project123",
             completed_item_id="PVTI_subtask1",
             item_type="subtask",
         )
 
-        assert result.is_valid is False
-        assert "cascade completion failed" in result.errors[0].lower()
+        _assert_invalid(result, f"Cascade completion failed: {_GRAPHQL_ERROR}")
 
-    @pytest.mark.asyncio
-    async def test_cascade_completion_invalid_item_type(self):
+    async def test_cascade_completion_invalid_item_type(self, null_manager):
         """Test cascade completion with invalid item type."""
-        manager = RelationshipManager()
-
-        result = await manager.cascade_completion_check(
+        result = await null_manager.cascade_completion_check(
             project_id="PVT_project123",
             completed_item_id="PVTI_invalid",
             item_type="invalid_type",
         )
 
-        assert result.is_valid is False
-        assert "invalid item type" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_get_completion_status_from_body(self):
+        _assert_invalid(result, "Invalid item type")
+
+    @pytest.mark.parametrize(
+        "body,expected",
+        [
+            (_subtask_body("TASK_1", order=1, status="Complete"), "Complete"),
+            (_subtask_body("TASK_1", order=1, status="Incomplete"), "Incomplete"),
+            ("**Type:** Task\n**Status:** Done\n\nDescription", "Done"),
+            ("Status: In Review\n\nDescription", "In Review"),
+            ("**Completion:** complete", "complete"),
+            ("**Type:** Task\n\nDescription without status", None),
+            ("", ""),
+        ],
+        ids=[
+            "complete",
+            "incomplete",
+            "done",
+            "plain_label",
+            "completion_label",
+            "no_status",
+            "empty",
+        ],
+    )
+    def test_get_completion_status_from_body(self, null_manager, body, expected):
         """Test extraction of completion status from item body content."""
-        manager = RelationshipManager()
-
-        # Test complete status
-        complete_body = (
-            "**Type:** Subtask\n**Status:** Complete\n**Order:** 1\n\nDescription"
-        )
-        assert manager._get_completion_status_from_body(complete_body) == "Complete"
-
-        # Test incomplete status
-        incomplete_body = (
-            "**Type:** Subtask\n**Status:** Incomplete\n**Order:** 1\n\nDescription"
-        )
-        assert manager._get_completion_status_from_body(incomplete_body) == "Incomplete"
-
-        # Test done status
-        done_body = "**Type:** Task\n**Status:** Done\n\nDescription"
-        assert manager._get_completion_status_from_body(done_body) == "Done"
-
-        # Test no status
-        no_status_body = "**Type:** Task\n\nDescription without status"
-        assert manager._get_completion_status_from_body(no_status_body) is None
-
-    @pytest.mark.asyncio
-    async def test_is_item_complete_with_field_values(self):
-        """Test completion status checking with field values."""
-        manager = RelationshipManager()
-
-        # Test with field values indicating completion
-        complete_item = {
-            "fieldValues": {"nodes": [{"field": {"name": "Status"}, "value": "Done"}]}
-        }
-        assert manager._is_item_complete(complete_item) is True
-
-        # Test with field values indicating incomplete
-        incomplete_item = {
-            "fieldValues": {
-                "nodes": [{"field": {"name": "Status"}, "value": "In Progress"}]
-            }
-        }
-        assert manager._is_item_complete(incomplete_item) is False
-
-        # Test with no field values but complete body content
-        body_complete_item = {
-            "content": {"body": "**Status:** Complete\n\nDescription"}
-        }
-        assert manager._is_item_complete(body_complete_item) is True
-
-    @pytest.mark.asyncio
-    async def test_is_item_complete_edge_cases(self):
-        """Test completion status checking edge cases."""
-        manager = RelationshipManager()
-
-        # Test with empty item
-        assert manager._is_item_complete({}) is False
-
-        # Test with None item
-        assert manager._is_item_complete(None) is False
-
-        # Test with item missing content and field values
-        minimal_item = {"id": "PVTI_test"}
-        assert manager._is_item_complete(minimal_item) is False
+        assert null_manager._get_completion_status_from_body(body) == expected
+
+    @pytest.mark.parametrize(
+        "body,prd_id,task_id",
+        [
+            (_task_body("PVTI_prd123"), "PVTI_prd123", ""),
+            (_subtask_body("PVTI_task123", order=2), "", "PVTI_task123"),
+            ("Description without references", "", ""),
+        ],
+        ids=["task", "subtask", "no_reference"],
+    )
+    def test_extract_parent_ids(self, null_manager, body, prd_id, task_id):
+        """Test parent reference extraction from item body content."""
+        assert null_manager._extract_parent_prd_id(body) == prd_id
+        assert null_manager._extract_parent_task_id(body) == task_id
+
+    @pytest.mark.parametrize(
+        "item,expected",
+        [
+            ({"fieldValues": {"nodes": [_FV_DONE]}}, True),
+            ({"fieldValues": {"nodes": [_FV_IN_PROGRESS]}}, False),
+            ({"fieldValues": {"nodes": [_FVN_DONE]}}, True),
+            ({"content": {"body": "**Status:** Complete\n\nDescription"}}, True),
+            ({}, False),
+            (None, False),
+            ({"id": "PVTI_test"}, False),
+        ],
+        ids=[
+            "field_value_done",
+            "field_value_in_progress",
+            "field_name_done",
+            "body_complete",
+            "empty",
+            "none",
+            "no_status",
+        ],
+    )
+    def test_is_item_complete(self, null_manager, item, expected):
+        """Test completion status checking from field values and body content."""
+        assert null_manager._is_item_complete(item) is expected
+
+    @pytest.mark.parametrize(
+        "field_value,expected",
+        [(_FV_DONE, True), (_FV_IN_PROGRESS, False)],
+        ids=["done", "in_progress"],
+    )
+    def test_is_item_complete_status_field_skips_body(
+        self, null_manager, field_value, expected
+    ):
+        """Test that a set Status field decides without parsing the body."""
+        # A non-string body would fail if it reached the body regexes
+        item = {"fieldValues": {"nodes": [field_value]}, "content": {"body": object()}}
+
+        assert null_manager._is_item_complete(item) is expected
+
+
+# Progress methods with valid arguments and their API failure message.
+_PROGRESS_ERROR_CASES = (
+    pytest.param(
+        "calculate_prd_progress",
+        ("PROJECT_123", "PRD_123"),
+        "Progress calculation failed",
+        id="progress",
+    ),
+    pytest.param(
+        "synchronize_hierarchy_status",
+        ("PROJECT_123",),
+        "Status synchronization failed",
+        id="synchronize",
+    ),
+    pytest.param(
+        "get_project_completion_statistics",
+        ("PROJECT_123",),
+        "Statistics calculation failed",
+        id="statistics",
+    ),
+)
 
 
 class TestStatusSynchronizationAndProgress:
     """Test status synchronization and progress tracking functionality."""
 
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def relationship_manager(self, mock_github_client):
-        """Create a RelationshipManager instance with mock client."""
-        return RelationshipManager(github_client=mock_github_client)
-
-    @pytest.mark.asyncio
-    async def test_calculate_prd_progress_success(
-        self, relationship_manager, mock_github_client
+    @pytest.mark.parametrize(
+        "statuses,expected",
+        [
+            (("Done", "In Progress", "Done"), (3, 2, 66.67, "In Progress")),
+            (("Done", "Done"), (2, 2, 100.0, "Complete")),
+            ((), (0, 0, 0.0, "Not Started")),
+        ],
+        ids=["mixed", "all_complete", "no_tasks"],
+    )
+    async def test_calculate_prd_progress(
+        self, relationship_manager, stub_github_client, statuses, expected
     ):
-        """Test successful PRD progress calculation."""
-        # Mock response for getting PRD children (tasks) - need to mock the project query structure
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "TASK_1",
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                        },
-                        {
-                            "id": "TASK_2",
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "In Progress"}
-                                ]
-                            },
-                        },
-                        {
-                            "id": "TASK_3",
-                            "content": {
-                                "id": "CONTENT_3",
-                                "title": "Task 3",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                        },
-                        {
-                            "id": "OTHER_TASK",
-                            "content": {
-                                "id": "CONTENT_OTHER",
-                                "title": "Other Task",
-                                "body": "**Parent PRD:** OTHER_PRD",
-                            },
-                        },
-                    ]
-                }
+        """Test PRD progress calculation over tasks with the given statuses."""
+        nodes = [
+            {
+                "id": f"TASK_{i}",
+                "content": {
+                    "id": f"CONTENT_{i}",
+                    "title": f"Task {i}",
+                    "body": _task_body("PRD_123"),
+                },
+                "fieldValues": {
+                    "nodes": [{"field": {"name": "Status"}, "name": status}]
+                },
             }
-        }
-
-        result = await relationship_manager.calculate_prd_progress(
-            "PROJECT_123", "PRD_123"
+            for i, status in enumerate(statuses, 1)
+        ]
+        # A task of another PRD must not be counted
+        nodes.append(
+            _item_node(
+                "OTHER_TASK", "CONTENT_OTHER", "Other Task", _task_body("OTHER_PRD")
+            )
         )
-
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert result.metadata["total_tasks"] == 3
-        assert result.metadata["completed_tasks"] == 2
-        assert result.metadata["progress_percentage"] == 66.67
-        assert result.metadata["status"] == "In Progress"
-
-    @pytest.mark.asyncio
-    async def test_calculate_prd_progress_all_complete(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test PRD progress calculation when all tasks are complete."""
-        # Mock response for getting PRD children (all tasks complete)
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "TASK_1",
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                        },
-                        {
-                            "id": "TASK_2",
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        stub_github_client.query_results.append(_items_response(nodes))
 
         result = await relationship_manager.calculate_prd_progress(
             "PROJECT_123", "PRD_123"
         )
 
-        assert result.is_valid is True
-        assert result.metadata["total_tasks"] == 2
-        assert result.metadata["completed_tasks"] == 2
-        assert result.metadata["progress_percentage"] == 100.0
-        assert result.metadata["status"] == "Complete"
-
-    @pytest.mark.asyncio
-    async def test_calculate_prd_progress_no_tasks(
-        self, relationship_manager, mock_github_client
+        _assert_valid(result)
+        metadata = result.metadata
+        assert (
+            metadata["total_tasks"],
+            metadata["completed_tasks"],
+            metadata["progress_percentage"],
+            metadata["status"],
+        ) == expected
+
+    @pytest.mark.parametrize(
+        "statuses,expected",
+        [
+            (("Complete", "Incomplete", "Complete"), (3, 2, 66.67, "In Progress")),
+            (("Complete", "Complete"), (2, 2, 100.0, "Complete")),
+            ((), (0, 0, 0.0, "Not Started")),
+        ],
+        ids=["mixed", "all_complete", "no_subtasks"],
+    )
+    async def test_calculate_task_progress(
+        self, relationship_manager, stub_github_client, statuses, expected
     ):
-        """Test PRD progress calculation when no tasks exist."""
-        # Mock response for getting PRD children (no tasks)
-        mock_github_client.query.return_value = {"node": {"items": {"nodes": []}}}
-
-        result = await relationship_manager.calculate_prd_progress(
-            "PROJECT_123", "PRD_123"
+        """Test task progress calculation over subtasks with the given statuses."""
+        nodes = [
+            _item_node(
+                f"SUBTASK_{i}",
+                f"CONTENT_{i}",
+                f"Subtask {i}",
+                _subtask_body("TASK_123", order=i, status=status),
+            )
+            for i, status in enumerate(statuses, 1)
+        ]
+        # A subtask of another task must not be counted
+        nodes.append(
+            _item_node(
+                "OTHER_SUBTASK",
+                "CONTENT_OTHER",
+                "Other Subtask",
+                _subtask_body("OTHER_TASK", status="Complete"),
+            )
         )
-
-        assert result.is_valid is True
-        assert result.metadata["total_tasks"] == 0
-        assert result.metadata["completed_tasks"] == 0
-        assert result.metadata["progress_percentage"] == 0.0
-        assert result.metadata["status"] == "Not Started"
-
-    @pytest.mark.asyncio
-    async def test_calculate_task_progress_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test successful task progress calculation."""
-        # Mock response for getting task children (subtasks)
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "SUBTASK_1",
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Status:** Complete\n**Order:** 1",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_2",
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Status:** Incomplete\n**Order:** 2",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_3",
-                            "content": {
-                                "id": "CONTENT_3",
-                                "title": "Subtask 3",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Status:** Complete\n**Order:** 3",
-                            },
-                        },
-                        {
-                            "id": "OTHER_SUBTASK",
-                            "content": {
-                                "id": "CONTENT_OTHER",
-                                "title": "Other Subtask",
-                                "body": "**Type:** Subtask\n**Parent Task:** OTHER_TASK\n**Status:** Complete",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        stub_github_client.query_results.append(_items_response(nodes))
 
         result = await relationship_manager.calculate_task_progress(
             "PROJECT_123", "TASK_123"
         )
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert result.metadata["total_subtasks"] == 3
-        assert result.metadata["completed_subtasks"] == 2
-        assert result.metadata["progress_percentage"] == 66.67
-        assert result.metadata["status"] == "In Progress"
-
-    @pytest.mark.asyncio
-    async def test_calculate_task_progress_all_complete(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test task progress calculation when all subtasks are complete."""
-        # Mock response for getting task children (all subtasks complete)
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "SUBTASK_1",
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Status:** Complete\n**Order:** 1",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_2",
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Status:** Complete\n**Order:** 2",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        _assert_valid(result)
+        metadata = result.metadata
+        assert (
+            metadata["total_subtasks"],
+            metadata["completed_subtasks"],
+            metadata["progress_percentage"],
+            metadata["status"],
+        ) == expected
 
-        result = await relationship_manager.calculate_task_progress(
-            "PROJECT_123", "TASK_123"
-        )
+    @pytest.mark.parametrize("method,args,failure", _PROGRESS_ERROR_CASES)
+    async def test_missing_parameters(self, null_manager, method, args, failure):
+        """Test that a blank project ID is rejected before any query."""
+        result = await getattr(null_manager, method)("", *args[1:])
 
-        assert result.is_valid is True
-        assert result.metadata["total_subtasks"] == 2
-        assert result.metadata["completed_subtasks"] == 2
-        assert result.metadata["progress_percentage"] == 100.0
-        assert result.metadata["status"] == "Complete"
+        _assert_invalid(result, _MISSING_PARAMETERS)
 
-    @pytest.mark.asyncio
-    async def test_calculate_task_progress_no_subtasks(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test task progress calculation when no subtasks exist."""
-        # Mock response for getting task children (no subtasks)
-        mock_github_client.query.return_value = {"node": {"items": {"nodes": []}}}
+    @pytest.mark.parametrize("method,args,failure", _PROGRESS_ERROR_CASES)
+    async def test_no_github_client(self, null_manager, method, args, failure):
+        """Test that calls without a GitHub client fail cleanly."""
+        result = await getattr(null_manager, method)(*args)
 
-        result = await relationship_manager.calculate_task_progress(
-            "PROJECT_123", "TASK_123"
-        )
+        _assert_invalid(result, _NO_CLIENT)
 
-        assert result.is_valid is True
-        assert result.metadata["total_subtasks"] == 0
-        assert result.metadata["completed_subtasks"] == 0
-        assert result.metadata["progress_percentage"] == 0.0
-        assert result.metadata["status"] == "Not Started"
-
-    @pytest.mark.asyncio
-    async def test_calculate_progress_api_error(
-        self, relationship_manager, mock_github_client
+    @pytest.mark.parametrize("method,args,failure", _PROGRESS_ERROR_CASES)
+    async def test_api_error(
+        self, relationship_manager, stub_github_client, method, args, failure
     ):
-        """Test progress calculation with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
+        """Test that API errors are reported in the failed result."""
+        stub_github_client.query_results.append(_graphql_error())
 
-        result = await relationship_manager.calculate_prd_progress(
-            "PROJECT_123", "PRD_123"
-        )
+        result = await getattr(relationship_manager, method)(*args)
 
-        assert result.is_valid is False  # The method properly propagates API errors
-        assert "Progress calculation failed: API Error" in result.errors[0]
+        _assert_invalid(result, f"{failure}: {_GRAPHQL_ERROR}")
 
-    @pytest.mark.asyncio
     async def test_synchronize_hierarchy_status_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
-        """Test successful hierarchy status synchronization."""
-        # Mock responses for getting hierarchy data - need to handle multiple calls
-        mock_github_client.query.side_effect = [
-            # First call: Get all project items for synchronization
-            {
-                "node": {
-                    "items": {
-                        "nodes": [
-                            {
-                                "id": "PRD_1",
-                                "fieldValues": {
-                                    "nodes": [
-                                        {
-                                            "field": {"name": "Status"},
-                                            "name": "In Progress",
-                                        }
-                                    ]
-                                },
-                                "content": {
-                                    "id": "CONTENT_PRD1",
-                                    "title": "PRD 1",
-                                    "body": "**Type:** PRD",
-                                },
-                            },
-                            {
-                                "id": "TASK_1",
-                                "fieldValues": {
-                                    "nodes": [
-                                        {"field": {"name": "Status"}, "name": "Done"}
-                                    ]
-                                },
-                                "content": {
-                                    "id": "CONTENT_TASK1",
-                                    "title": "Task 1",
-                                    "body": "**Parent PRD:** PRD_1",
-                                },
-                            },
-                        ]
-                    }
-                }
-            },
-            # Second call: Get tasks for PRD_1 progress calculation
-            {
-                "node": {
-                    "items": {
-                        "nodes": [
-                            {
-                                "id": "TASK_1",
-                                "content": {
-                                    "id": "CONTENT_TASK1",
-                                    "title": "Task 1",
-                                    "body": "**Parent PRD:** PRD_1",
-                                },
-                                "fieldValues": {
-                                    "nodes": [
-                                        {"field": {"name": "Status"}, "name": "Done"}
-                                    ]
-                                },
-                            }
-                        ]
-                    }
-                }
-            },
-            # Third call: Get subtasks for TASK_1 progress calculation
-            {
-                "node": {
-                    "items": {
-                        "nodes": [
-                            {
-                                "id": "SUBTASK_1",
-                                "content": {
-                                    "id": "CONTENT_SUB1",
-                                    "title": "Subtask 1",
-                                    "body": "**Type:** Subtask\n**Parent Task:** TASK_1\n**Status:** Complete",
-                                },
-                            }
-                        ]
-                    }
-                }
-            },
-        ]
+        """Test hierarchy status synchronization from a single items query."""
+        stub_github_client.query_results.append(
+            _items_response(
+                (
+                    _item_node(
+                        "PRD_1",
+                        "CONTENT_PRD1",
+                        "PRD 1",
+                        "**Type:** PRD",
+                        _FVN_IN_PROGRESS,
+                    ),
+                    _item_node(
+                        "TASK_1",
+                        "CONTENT_TASK1",
+                        "Task 1",
+                        _task_body("CONTENT_PRD1"),
+                        _FVN_DONE,
+                    ),
+                    _item_node(
+                        "SUBTASK_1",
+                        "CONTENT_SUB1",
+                        "Subtask 1",
+                        _subtask_body("CONTENT_TASK1", status="Complete"),
+                    ),
+                )
+            )
+        )
 
         result = await relationship_manager.synchronize_hierarchy_status("PROJECT_123")
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        _assert_valid(result)
         assert "synchronization_summary" in result.metadata
-        assert "prds_processed" in result.metadata
-        assert "tasks_processed" in result.metadata
+        assert result.metadata["prds_processed"] == 1
+        assert result.metadata["tasks_processed"] == 1
+        assert result.metadata["prd_progress"]["CONTENT_PRD1"]["completed_tasks"] == 1
+        task_progress = result.metadata["task_progress"]["CONTENT_TASK1"]
+        assert task_progress["completed_subtasks"] == 1
+        assert task_progress["status"] == "Complete"
+        # Progress comes from the items already fetched, not per-item queries
+        assert len(stub_github_client.query_calls) == 1
+
+    async def test_synchronize_hierarchy_status_matches_prd_progress(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test that sync's single-pass tallies agree with calculate_prd_progress."""
+        stub_github_client.query_results.append(
+            _items_response(
+                (
+                    {
+                        "id": "PRD_1",
+                        "content": {"id": "PRD_1", "body": "**Type:** PRD"},
+                    },
+                    {
+                        "id": "TASK_1",
+                        "fieldValues": {"nodes": [_FVN_DONE]},
+                        "content": {"id": "TASK_1", "body": _task_body("PRD_1")},
+                    },
+                    {
+                        "id": "TASK_2",
+                        "fieldValues": {"nodes": [_FVN_IN_PROGRESS]},
+                        "content": {"id": "TASK_2", "body": _task_body("PRD_1")},
+                    },
+                    # Parent ID sharing a prefix with PRD_1 must not be counted
+                    {
+                        "id": "TASK_3",
+                        "fieldValues": {"nodes": [_FVN_DONE]},
+                        "content": {"id": "TASK_3", "body": _task_body("PRD_12")},
+                    },
+                )
+            )
+        )
+
+        sync_result = await relationship_manager.synchronize_hierarchy_status(
+            "PROJECT_123"
+        )
+        progress_result = await relationship_manager.calculate_prd_progress(
+            "PROJECT_123", "PRD_1"
+        )
+
+        assert progress_result.metadata["total_tasks"] == 2
+        assert sync_result.metadata["prd_progress"]["PRD_1"] == progress_result.metadata
 
-    @pytest.mark.asyncio
     async def test_get_project_completion_statistics_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test successful project completion statistics calculation."""
-        # Mock response for getting all project items
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PRD_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_PRD1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "PRD_2",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "In Progress"}
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_PRD2",
-                                "title": "PRD 2",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "TASK_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_TASK1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PRD_1",
-                            },
-                        },
-                        {
-                            "id": "TASK_2",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "Backlog"}
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_TASK2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** PRD_2",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_1",
-                            "content": {
-                                "id": "CONTENT_SUB1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_1\n**Status:** Complete",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_2",
-                            "content": {
-                                "id": "CONTENT_SUB2",
-                                "title": "Subtask 2",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_2\n**Status:** Incomplete",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        stub_github_client.query_results.append(
+            _items_response(
+                _build_items(
+                    (
+                        ("PRD_1", "PRD", "Done", None),
+                        ("PRD_2", "PRD", "In Progress", None),
+                        ("TASK_1", "Task", "Done", "PRD_1"),
+                        ("TASK_2", "Task", "Backlog", "PRD_2"),
+                        ("SUBTASK_1", "Subtask", "Complete", "TASK_1"),
+                        ("SUBTASK_2", "Subtask", "Incomplete", "TASK_2"),
+                    )
+                )
+            )
+        )
 
         result = await relationship_manager.get_project_completion_statistics(
             "PROJECT_123"
         )
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        _assert_valid(result)
         assert result.metadata["total_prds"] == 2
         assert result.metadata["completed_prds"] == 1
         assert result.metadata["total_tasks"] == 2
@@ -1579,569 +1253,484 @@ class TestStatusSynchronizationAndProgress:
         assert result.metadata["completed_subtasks"] == 1
         assert result.metadata["overall_progress_percentage"] == 50.0
 
-    @pytest.mark.asyncio
-    async def test_calculate_progress_missing_parameters(self, relationship_manager):
-        """Test progress calculation with missing parameters."""
-        result = await relationship_manager.calculate_prd_progress("", "PRD_123")
-
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_calculate_progress_no_github_client(self):
-        """Test progress calculation without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.calculate_prd_progress("PROJECT_123", "PRD_123")
-
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_synchronize_status_missing_parameters(self, relationship_manager):
-        """Test status synchronization with missing parameters."""
-        result = await relationship_manager.synchronize_hierarchy_status("")
-
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_synchronize_status_no_github_client(self):
-        """Test status synchronization without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.synchronize_hierarchy_status("PROJECT_123")
-
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_synchronize_status_api_error(
-        self, relationship_manager, mock_github_client
+    async def test_get_project_completion_statistics_single_pass(
+        self, relationship_manager, stub_github_client
     ):
-        """Test status synchronization with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
-
-        result = await relationship_manager.synchronize_hierarchy_status("PROJECT_123")
-
-        assert result.is_valid is False
-        assert "Status synchronization failed" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_statistics_missing_parameters(self, relationship_manager):
-        """Test statistics calculation with missing parameters."""
-        result = await relationship_manager.get_project_completion_statistics("")
-
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_statistics_no_github_client(self):
-        """Test statistics calculation without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.get_project_completion_statistics("PROJECT_123")
-
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
-
-    @pytest.mark.asyncio
-    async def test_statistics_api_error(self, relationship_manager, mock_github_client):
-        """Test statistics calculation with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
-
-        result = await relationship_manager.get_project_completion_statistics(
-            "PROJECT_123"
-        )
-
-        assert result.is_valid is False
-        assert "Statistics calculation failed" in result.errors[0]
+        """Test that each item is checked for completion exactly once."""
+        items = [
+            *_build_items(
+                (
+                    ("PRD_1", "PRD", "Done", None),
+                    ("TASK_1", "Task", "Done", "PRD_1"),
+                    ("SUBTASK_1", "Subtask", "Incomplete", "TASK_1"),
+                )
+            ),
+            {"id": "NOTE_1", "content": {"id": "CONTENT_NOTE_1", "body": ""}},
+        ]
+        stub_github_client.query_results.append(_items_response(items))
+
+        with patch.object(
+            relationship_manager,
+            "_is_item_complete",
+            wraps=relationship_manager._is_item_complete,
+        ) as is_item_complete:
+            result = await relationship_manager.get_project_completion_statistics(
+                "PROJECT_123"
+            )
+
+        assert is_item_complete.call_count == len(items)
+        # Items of unknown type are checked but not counted
+        assert result.metadata["total_items"] == 3
+        assert result.metadata["completed_items"] == 2
+
+
+# Canned responses for the query and filter tests below.
+
+# Two Done items: a PRD and a task.
+_ITEMS_BY_STATUS_RESPONSE = _items_response(
+    (
+        _item_node("ITEM_1", "CONTENT_1", "Item 1", "**Type:** PRD", _FVN_DONE),
+        _item_node("ITEM_2", "CONTENT_2", "Item 2", _task_body("PRD_123"), _FVN_DONE),
+    )
+)
 
+# Two PRDs and a task under PRD_1.
+_ITEMS_BY_TYPE_RESPONSE = _items_response(
+    (
+        _item_node("PRD_1", "CONTENT_1", "PRD 1", "**Type:** PRD", _FVN_IN_PROGRESS),
+        _item_node("PRD_2", "CONTENT_2", "PRD 2", "**Type:** PRD", _FVN_DONE),
+        _item_node("TASK_1", "CONTENT_3", "Task 1", _task_body("PRD_1"), _FVN_DONE),
+    )
+)
 
-class TestEnhancedRelationshipQuerying:
-    """Test enhanced relationship querying and filtering capabilities."""
+# Two items whose titles start with "User".
+_ITEMS_BY_TITLE_RESPONSE = _items_response(
+    (
+        _item_node(
+            "ITEM_1",
+            "CONTENT_1",
+            "User Authentication Feature",
+            "**Type:** PRD",
+            _FVN_DONE,
+        ),
+        _item_node(
+            "ITEM_2",
+            "CONTENT_2",
+            "User Profile Management",
+            _task_body("PRD_123"),
+            _FVN_IN_PROGRESS,
+        ),
+    )
+)
 
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client."""
-        return AsyncMock()
+# A task and a subtask whose parents are missing, plus a valid PRD.
+_ORPHANED_ITEMS_RESPONSE = _items_response(
+    (
+        _item_node(
+            "TASK_1", "CONTENT_1", "Orphaned Task", _task_body("MISSING_PRD"), _FVN_DONE
+        ),
+        _item_node(
+            "SUBTASK_1",
+            "CONTENT_2",
+            "Orphaned Subtask",
+            _subtask_body("MISSING_TASK", status="Complete"),
+        ),
+        _item_node("PRD_1", "CONTENT_3", "Valid PRD", "**Type:** PRD", _FVN_DONE),
+    )
+)
 
-    @pytest.fixture
-    def relationship_manager(self, mock_github_client):
-        """Create a RelationshipManager instance with mock client."""
-        return RelationshipManager(github_client=mock_github_client)
+# Two High priority items.
+_ITEMS_BY_PRIORITY_RESPONSE = _items_response(
+    (
+        _item_node(
+            "ITEM_1",
+            "CONTENT_1",
+            "High Priority Item",
+            "**Type:** PRD",
+            _FVN_DONE,
+            _FVN_PRIORITY_HIGH,
+        ),
+        _item_node(
+            "ITEM_2",
+            "CONTENT_2",
+            "Another High Priority",
+            _task_body("PRD_123"),
+            _FVN_IN_PROGRESS,
+            _FVN_PRIORITY_HIGH,
+        ),
+    )
+)
 
-    @pytest.mark.asyncio
-    async def test_query_items_by_status_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test successful querying of items by status."""
-        # Mock response for querying items by status
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "ITEM_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Item 1",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "ITEM_2",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Item 2",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+# One PRD with one task and one completed subtask.
+_HIERARCHY_TREE_RESPONSE = _items_response(
+    (
+        _item_node("PRD_1", "CONTENT_PRD1", "PRD 1", "**Type:** PRD", _FVN_IN_PROGRESS),
+        _item_node("TASK_1", "CONTENT_TASK1", "Task 1", _task_body("PRD_1"), _FVN_DONE),
+        _item_node(
+            "SUBTASK_1",
+            "CONTENT_SUB1",
+            "Subtask 1",
+            _subtask_body("TASK_1", status="Complete"),
+        ),
+    )
+)
 
-        result = await relationship_manager.query_items_by_status("PROJECT_123", "Done")
+# Two items created in January 2024.
+_ITEMS_BY_DATE_RESPONSE = _items_response(
+    (
+        _item_node(
+            "ITEM_1",
+            "CONTENT_1",
+            "Recent Item",
+            "**Type:** PRD",
+            _FVN_DONE,
+            created_at="2024-01-15T10:00:00Z",
+        ),
+        _item_node(
+            "ITEM_2",
+            "CONTENT_2",
+            "Another Recent Item",
+            _task_body("PRD_123"),
+            _FVN_IN_PROGRESS,
+            created_at="2024-01-16T10:00:00Z",
+        ),
+    )
+)
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert len(result.metadata["items"]) == 2
-        assert result.metadata["status_filter"] == "Done"
-        assert result.metadata["total_count"] == 2
 
-    @pytest.mark.asyncio
-    async def test_query_items_by_type_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test successful querying of items by type."""
-        # Mock response for querying items by type
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PRD_1",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "In Progress"}
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "PRD_2",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "PRD 2",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "TASK_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_3",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** PRD_1",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+# Query methods with valid arguments and their API failure message.
+_QUERY_ERROR_CASES = (
+    pytest.param(
+        "query_items_by_status", ("PROJECT_123", "Done"), "Query failed", id="query"
+    ),
+    pytest.param(
+        "search_items_by_title", ("PROJECT_123", "test"), "Search failed", id="search"
+    ),
+    pytest.param(
+        "get_orphaned_items",
+        ("PROJECT_123",),
+        "Orphaned items detection failed",
+        id="orphaned_items",
+    ),
+)
 
-        result = await relationship_manager.query_items_by_type("PROJECT_123", "PRD")
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert len(result.metadata["items"]) == 2
-        assert result.metadata["item_type"] == "PRD"
-        assert result.metadata["total_count"] == 2
+class TestEnhancedRelationshipQuerying:
+    """Test enhanced relationship querying and filtering capabilities."""
 
-    @pytest.mark.asyncio
-    async def test_search_items_by_title_success(
-        self, relationship_manager, mock_github_client
+    @pytest.mark.parametrize(
+        "method,args,response,expected_metadata",
+        [
+            (
+                "query_items_by_status",
+                ("PROJECT_123", "Done"),
+                _ITEMS_BY_STATUS_RESPONSE,
+                {"status_filter": "Done", "total_count": 2},
+            ),
+            (
+                "query_items_by_type",
+                ("PROJECT_123", "PRD"),
+                _ITEMS_BY_TYPE_RESPONSE,
+                {"item_type": "PRD", "total_count": 2},
+            ),
+            (
+                "search_items_by_title",
+                ("PROJECT_123", "User"),
+                _ITEMS_BY_TITLE_RESPONSE,
+                {"search_query": "User", "total_count": 2},
+            ),
+            (
+                "get_items_by_priority",
+                ("PROJECT_123", "High"),
+                _ITEMS_BY_PRIORITY_RESPONSE,
+                {"priority_filter": "High", "total_count": 2},
+            ),
+            (
+                "filter_items_by_date_range",
+                ("PROJECT_123", "2024-01-01", "2024-01-31"),
+                _ITEMS_BY_DATE_RESPONSE,
+                {"date_from": "2024-01-01", "date_to": "2024-01-31"},
+            ),
+        ],
+        ids=["by_status", "by_type", "by_title", "by_priority", "by_date_range"],
+    )
+    async def test_item_filter_success(
+        self,
+        relationship_manager,
+        stub_github_client,
+        method,
+        args,
+        response,
+        expected_metadata,
     ):
-        """Test successful searching of items by title."""
-        # Mock response for searching items by title
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "ITEM_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "User Authentication Feature",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "ITEM_2",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "In Progress"}
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "User Profile Management",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        """Test that each item filter returns both matching items."""
+        stub_github_client.query_results.append(response)
 
-        result = await relationship_manager.search_items_by_title("PROJECT_123", "User")
+        result = await getattr(relationship_manager, method)(*args)
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        _assert_valid(result)
         assert len(result.metadata["items"]) == 2
-        assert result.metadata["search_query"] == "User"
-        assert result.metadata["total_count"] == 2
+        for key, value in expected_metadata.items():
+            assert result.metadata[key] == value
 
-    @pytest.mark.asyncio
     async def test_get_orphaned_items_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test successful detection of orphaned items."""
-        # Mock response for getting orphaned items
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "TASK_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Orphaned Task",
-                                "body": "**Parent PRD:** MISSING_PRD",
-                            },
-                        },
-                        {
-                            "id": "SUBTASK_1",
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Orphaned Subtask",
-                                "body": "**Type:** Subtask\n**Parent Task:** MISSING_TASK\n**Status:** Complete",
-                            },
-                        },
-                        {
-                            "id": "PRD_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_3",
-                                "title": "Valid PRD",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
+        stub_github_client.query_results.append(_ORPHANED_ITEMS_RESPONSE)
 
         result = await relationship_manager.get_orphaned_items("PROJECT_123")
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        _assert_valid(result)
         assert len(result.metadata["orphaned_items"]) == 2
         assert result.metadata["total_orphaned"] == 2
 
-    @pytest.mark.asyncio
-    async def test_get_items_by_priority_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test successful querying of items by priority."""
-        # Mock response for querying items by priority
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "ITEM_1",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "Done"},
-                                    {"field": {"name": "Priority"}, "name": "High"},
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "High Priority Item",
-                                "body": "**Type:** PRD",
-                            },
-                        },
-                        {
-                            "id": "ITEM_2",
-                            "fieldValues": {
-                                "nodes": [
-                                    {
-                                        "field": {"name": "Status"},
-                                        "name": "In Progress",
-                                    },
-                                    {"field": {"name": "Priority"}, "name": "High"},
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Another High Priority",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-
-        result = await relationship_manager.get_items_by_priority("PROJECT_123", "High")
-
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert len(result.metadata["items"]) == 2
-        assert result.metadata["priority_filter"] == "High"
-        assert result.metadata["total_count"] == 2
-
-    @pytest.mark.asyncio
     async def test_get_hierarchy_tree_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test successful retrieval of complete hierarchy tree."""
-        # Mock responses for building hierarchy tree
-        mock_github_client.query.side_effect = [
-            # First call: Get all project items
-            {
-                "node": {
-                    "items": {
-                        "nodes": [
-                            {
-                                "id": "PRD_1",
-                                "fieldValues": {
-                                    "nodes": [
-                                        {
-                                            "field": {"name": "Status"},
-                                            "name": "In Progress",
-                                        }
-                                    ]
-                                },
-                                "content": {
-                                    "id": "CONTENT_PRD1",
-                                    "title": "PRD 1",
-                                    "body": "**Type:** PRD",
-                                },
-                            },
-                            {
-                                "id": "TASK_1",
-                                "fieldValues": {
-                                    "nodes": [
-                                        {"field": {"name": "Status"}, "name": "Done"}
-                                    ]
-                                },
-                                "content": {
-                                    "id": "CONTENT_TASK1",
-                                    "title": "Task 1",
-                                    "body": "**Parent PRD:** PRD_1",
-                                },
-                            },
-                            {
-                                "id": "SUBTASK_1",
-                                "content": {
-                                    "id": "CONTENT_SUB1",
-                                    "title": "Subtask 1",
-                                    "body": "**Type:** Subtask\n**Parent Task:** TASK_1\n**Status:** Complete",
-                                },
-                            },
-                        ]
-                    }
-                }
-            }
-        ]
+        stub_github_client.query_results.append(_HIERARCHY_TREE_RESPONSE)
 
         result = await relationship_manager.get_hierarchy_tree("PROJECT_123")
 
-        assert result.is_valid is True
-        assert len(result.errors) == 0
+        _assert_valid(result)
         assert "hierarchy_tree" in result.metadata
         assert len(result.metadata["hierarchy_tree"]) > 0
+        # The tree is built from a single items query
+        assert len(stub_github_client.query_calls) == 1
 
-    @pytest.mark.asyncio
-    async def test_filter_items_by_date_range_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test successful filtering of items by date range."""
-        # Mock response for filtering items by date
-        mock_github_client.query.return_value = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "ITEM_1",
-                            "fieldValues": {
-                                "nodes": [{"field": {"name": "Status"}, "name": "Done"}]
-                            },
-                            "content": {
-                                "id": "CONTENT_1",
-                                "title": "Recent Item",
-                                "body": "**Type:** PRD",
-                            },
-                            "createdAt": "2024-01-15T10:00:00Z",
-                        },
-                        {
-                            "id": "ITEM_2",
-                            "fieldValues": {
-                                "nodes": [
-                                    {"field": {"name": "Status"}, "name": "In Progress"}
-                                ]
-                            },
-                            "content": {
-                                "id": "CONTENT_2",
-                                "title": "Another Recent Item",
-                                "body": "**Parent PRD:** PRD_123",
-                            },
-                            "createdAt": "2024-01-16T10:00:00Z",
-                        },
-                    ]
-                }
-            }
-        }
-
-        result = await relationship_manager.filter_items_by_date_range(
-            "PROJECT_123", "2024-01-01", "2024-01-31"
-        )
-
-        assert result.is_valid is True
-        assert len(result.errors) == 0
-        assert len(result.metadata["items"]) == 2
-        assert result.metadata["date_from"] == "2024-01-01"
-        assert result.metadata["date_to"] == "2024-01-31"
+    @pytest.mark.parametrize("method,args,failure", _QUERY_ERROR_CASES)
+    async def test_missing_parameters(self, null_manager, method, args, failure):
+        """Test that a blank project ID is rejected before any query."""
+        result = await getattr(null_manager, method)("", *args[1:])
 
-    @pytest.mark.asyncio
-    async def test_query_missing_parameters(self, relationship_manager):
-        """Test querying with missing parameters."""
-        result = await relationship_manager.query_items_by_status("", "Done")
+        _assert_invalid(result, _MISSING_PARAMETERS)
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
+    @pytest.mark.parametrize("method,args,failure", _QUERY_ERROR_CASES)
+    async def test_no_github_client(self, null_manager, method, args, failure):
+        """Test that calls without a GitHub client fail cleanly."""
+        result = await getattr(null_manager, method)(*args)
 
-    @pytest.mark.asyncio
-    async def test_query_no_github_client(self):
-        """Test querying without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.query_items_by_status("PROJECT_123", "Done")
+        _assert_invalid(result, _NO_CLIENT)
 
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
+    @pytest.mark.parametrize("method,args,failure", _QUERY_ERROR_CASES)
+    async def test_api_error(
+        self, relationship_manager, stub_github_client, method, args, failure
+    ):
+        """Test that API errors are reported in the failed result."""
+        stub_github_client.query_results.append(_graphql_error())
+
+        result = await getattr(relationship_manager, method)(*args)
+
+        _assert_invalid(result, f"{failure}: {_GRAPHQL_ERROR}")
+
+
+# Canned responses for the dependency validation tests below.
+
+# Two tasks that depend on PRD_123.
+_PRD_DEPENDENT_TASKS_RESPONSE = _items_response(
+    (
+        _item_node(
+            "PVTI_task1",
+            "DI_task1",
+            "Dependent Task 1",
+            _task_body("PRD_123", description="Task description"),
+        ),
+        _item_node(
+            "PVTI_task2",
+            "DI_task2",
+            "Dependent Task 2",
+            _task_body("PRD_123", description="Another task"),
+        ),
+    )
+)
 
-    @pytest.mark.asyncio
-    async def test_query_api_error(self, relationship_manager, mock_github_client):
-        """Test querying with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
+# One subtask that depends on TASK_123.
+_TASK_DEPENDENT_SUBTASKS_RESPONSE = _items_response(
+    (
+        _item_node(
+            "PVTI_subtask1",
+            "DI_subtask1",
+            "Dependent Subtask 1",
+            _subtask_body(
+                "TASK_123",
+                order=1,
+                description="Subtask description",
+            ),
+        ),
+    )
+)
 
-        result = await relationship_manager.query_items_by_status("PROJECT_123", "Done")
+# The node lookup for an existing PRD_123.
+_EXISTING_PRD_NODE_RESPONSE = {
+    "node": _item_node("PRD_123", "DI_prd123", "Existing PRD", "PRD description")
+}
 
-        assert result.is_valid is False
-        assert "Query failed" in result.errors[0]
+# The node lookup for an ID that does not exist.
+_MISSING_NODE_RESPONSE = {"node": None}
 
-    @pytest.mark.asyncio
-    async def test_search_missing_parameters(self, relationship_manager):
-        """Test searching with missing parameters."""
-        result = await relationship_manager.search_items_by_title("", "test")
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
+# PRD 1 -> Task 1 -> Subtask 1, used by the hierarchy payloads below.
+def _prd1_node():
+    """Build the project item node for PVTI_prd1."""
+    return _item_node(
+        "PVTI_prd1", "DI_prd1", "PRD 1", "**Type:** PRD\n\nPRD description"
+    )
 
-    @pytest.mark.asyncio
-    async def test_search_no_github_client(self):
-        """Test searching without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.search_items_by_title("PROJECT_123", "test")
 
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
+def _task1_node():
+    """Build the project item node for PVTI_task1, parented to DI_prd1."""
+    return _item_node(
+        "PVTI_task1",
+        "DI_task1",
+        "Task 1",
+        _task_body("DI_prd1", description="Task description"),
+    )
 
-    @pytest.mark.asyncio
-    async def test_search_api_error(self, relationship_manager, mock_github_client):
-        """Test searching with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
 
-        result = await relationship_manager.search_items_by_title("PROJECT_123", "test")
+def _subtask1_node():
+    """Build the project item node for PVTI_subtask1, parented to DI_task1."""
+    return _item_node(
+        "PVTI_subtask1",
+        "DI_subtask1",
+        "Subtask 1",
+        _subtask_body("DI_task1", order=1, description="Subtask description"),
+    )
 
-        assert result.is_valid is False
-        assert "Search failed" in result.errors[0]
 
-    @pytest.mark.asyncio
-    async def test_orphaned_items_missing_parameters(self, relationship_manager):
-        """Test orphaned items detection with missing parameters."""
-        result = await relationship_manager.get_orphaned_items("")
+# A PRD with one task that has one subtask.
+_PRD_TASK_SUBTASK_RESPONSE = _items_response(
+    (_prd1_node(), _task1_node(), _subtask1_node())
+)
 
-        assert result.is_valid is False
-        assert "Missing required parameters" in result.errors[0]
+# Two tasks that name each other as parent.
+_CYCLIC_TASKS_RESPONSE = _items_response(
+    (
+        _item_node(
+            "PVTI_task1",
+            "DI_task1",
+            "Task 1",
+            _task_body("DI_task2", description="Cyclic dependency"),
+        ),
+        _item_node(
+            "PVTI_task2",
+            "DI_task2",
+            "Task 2",
+            _task_body("DI_task1", description="Another cyclic dependency"),
+        ),
+    )
+)
 
-    @pytest.mark.asyncio
-    async def test_orphaned_items_no_github_client(self):
-        """Test orphaned items detection without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-        result = await manager.get_orphaned_items("PROJECT_123")
+# A PRD with one task.
+_PRD_TASK_RESPONSE = _items_response((_prd1_node(), _task1_node()))
+
+# A task and a subtask whose parents do not exist.
+_MISSING_PARENTS_RESPONSE = _items_response(
+    (
+        _item_node(
+            "PVTI_task1",
+            "DI_task1",
+            "Orphaned Task",
+            _task_body(
+                "NONEXISTENT_PRD",
+                description="Task with missing parent",
+            ),
+        ),
+        _item_node(
+            "PVTI_subtask1",
+            "DI_subtask1",
+            "Invalid Subtask",
+            _subtask_body(
+                "NONEXISTENT_TASK",
+                order=1,
+                description="Subtask with missing parent",
+            ),
+        ),
+    )
+)
 
-        assert result.is_valid is False
-        assert "GitHub client not initialized" in result.errors[0]
+# A PRD with two tasks.
+_PRD_TWO_TASKS_RESPONSE = _items_response(
+    (
+        _prd1_node(),
+        _task1_node(),
+        _item_node(
+            "PVTI_task2",
+            "DI_task2",
+            "Task 2",
+            _task_body("DI_prd1", description="Another task"),
+        ),
+    )
+)
 
-    @pytest.mark.asyncio
-    async def test_orphaned_items_api_error(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test orphaned items detection with API error."""
-        mock_github_client.query.side_effect = Exception("API Error")
 
-        result = await relationship_manager.get_orphaned_items("PROJECT_123")
+# Dependency methods with valid arguments and their API failure message.
+# (method, response, error, exact metadata, metadata lengths) per project scan
+_GRAPH_SCAN_CASES = (
+    pytest.param(
+        "check_dependency_cycles",
+        _PRD_TASK_SUBTASK_RESPONSE,
+        None,
+        {"cycles_detected": False, "total_items_checked": 3},
+        {"dependency_graph": 3, "detected_cycles": 0},
+        id="no_cycles",
+    ),
+    pytest.param(
+        "check_dependency_cycles",
+        _CYCLIC_TASKS_RESPONSE,
+        "Circular dependencies detected",
+        {"cycles_detected": True, "total_items_checked": 2},
+        {"detected_cycles": 1},
+        id="cycle_detected",
+    ),
+    pytest.param(
+        "enforce_hierarchy_constraints",
+        _PRD_TASK_RESPONSE,
+        None,
+        {"constraints_violated": False, "total_items_validated": 2},
+        {"violations": 0},
+        id="hierarchy_ok",
+    ),
+    pytest.param(
+        "enforce_hierarchy_constraints",
+        _MISSING_PARENTS_RESPONSE,
+        "Hierarchy constraint violations detected",
+        {"constraints_violated": True},
+        {"violations": 2},
+        id="hierarchy_violations",
+    ),
+)
 
-        assert result.is_valid is False
-        assert "Orphaned items detection failed" in result.errors[0]
+_DEPENDENCY_ERROR_CASES = (
+    pytest.param(
+        "validate_prd_deletion_dependencies",
+        ("PROJECT_123", "PRD_123"),
+        "Dependency validation failed",
+        id="dependency_validation",
+    ),
+    pytest.param(
+        "validate_parent_exists",
+        ("PROJECT_123", "PARENT_123", "PRD"),
+        "Parent validation failed",
+        id="parent_validation",
+    ),
+    pytest.param(
+        "check_dependency_cycles",
+        ("PROJECT_123",),
+        "Dependency cycle check failed",
+        id="cycle_detection",
+    ),
+)
 
 
 class TestDependencyManagementAndValidation:
     """Test suite for dependency management and validation between hierarchy levels."""
 
-    @pytest.fixture
-    def mock_github_client(self):
-        """Create a mock GitHub client for testing."""
-        return AsyncMock()
-
-    @pytest.fixture
-    def relationship_manager(self, mock_github_client):
-        """Create RelationshipManager with mock client."""
-        return RelationshipManager(github_client=mock_github_client)
-
-    @pytest.mark.asyncio
     async def test_validate_prd_deletion_dependencies_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test PRD can be deleted when no dependent tasks exist."""
-        # Mock response showing no tasks depend on this PRD
-        mock_response = {"node": {"items": {"nodes": []}}}  # No dependent tasks
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_EMPTY_ITEMS_RESPONSE)
 
         result = await relationship_manager.validate_prd_deletion_dependencies(
             "PROJECT_123", "PRD_123"
@@ -2152,37 +1741,11 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["dependent_tasks"] == 0
         assert result.metadata["deletion_safe"] is True
 
-    @pytest.mark.asyncio
     async def test_validate_prd_deletion_dependencies_blocked(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test PRD deletion is blocked when dependent tasks exist."""
-        # Mock response showing tasks depend on this PRD
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Dependent Task 1",
-                                "body": "**Parent PRD:** PRD_123\n\nTask description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Dependent Task 2",
-                                "body": "**Parent PRD:** PRD_123\n\nAnother task",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_PRD_DEPENDENT_TASKS_RESPONSE)
 
         result = await relationship_manager.validate_prd_deletion_dependencies(
             "PROJECT_123", "PRD_123"
@@ -2192,18 +1755,17 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["can_delete"] is False
         assert result.metadata["dependent_tasks"] == 2
         assert result.metadata["deletion_safe"] is False
-        assert "dependent tasks must be deleted first" in result.errors[0].lower()
-        assert "Dependent Task 1" in str(result.metadata["blocking_items"])
-        assert "Dependent Task 2" in str(result.metadata["blocking_items"])
+        assert "dependent tasks must be deleted first" in result.errors[0]
+        assert {item["title"] for item in result.metadata["blocking_items"]} == {
+            "Dependent Task 1",
+            "Dependent Task 2",
+        }
 
-    @pytest.mark.asyncio
     async def test_validate_task_deletion_dependencies_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test task can be deleted when no dependent subtasks exist."""
-        # Mock response showing no subtasks depend on this task
-        mock_response = {"node": {"items": {"nodes": []}}}  # No dependent subtasks
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_EMPTY_ITEMS_RESPONSE)
 
         result = await relationship_manager.validate_task_deletion_dependencies(
             "PROJECT_123", "TASK_123"
@@ -2214,29 +1776,11 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["dependent_subtasks"] == 0
         assert result.metadata["deletion_safe"] is True
 
-    @pytest.mark.asyncio
     async def test_validate_task_deletion_dependencies_blocked(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test task deletion is blocked when dependent subtasks exist."""
-        # Mock response showing subtasks depend on this task
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Dependent Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** TASK_123\n**Order:** 1\n\nSubtask description",
-                            },
-                        }
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_TASK_DEPENDENT_SUBTASKS_RESPONSE)
 
         result = await relationship_manager.validate_task_deletion_dependencies(
             "PROJECT_123", "TASK_123"
@@ -2246,25 +1790,13 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["can_delete"] is False
         assert result.metadata["dependent_subtasks"] == 1
         assert result.metadata["deletion_safe"] is False
-        assert "dependent subtasks must be deleted first" in result.errors[0].lower()
+        assert "dependent subtasks must be deleted first" in result.errors[0]
 
-    @pytest.mark.asyncio
     async def test_validate_parent_exists_prd_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test validation succeeds when parent PRD exists."""
-        # Mock response showing PRD exists
-        mock_response = {
-            "node": {
-                "id": "PRD_123",
-                "content": {
-                    "id": "DI_prd123",
-                    "title": "Existing PRD",
-                    "body": "PRD description",
-                },
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_EXISTING_PRD_NODE_RESPONSE)
 
         result = await relationship_manager.validate_parent_exists(
             "PROJECT_123", "PRD_123", "PRD"
@@ -2275,14 +1807,11 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["parent_type"] == "PRD"
         assert result.metadata["parent_id"] == "PRD_123"
 
-    @pytest.mark.asyncio
     async def test_validate_parent_exists_missing_parent(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test validation fails when parent does not exist."""
-        # Mock response showing parent doesn't exist
-        mock_response = {"node": None}
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_MISSING_NODE_RESPONSE)
 
         result = await relationship_manager.validate_parent_exists(
             "PROJECT_123", "NONEXISTENT_PRD", "PRD"
@@ -2290,210 +1819,62 @@ class TestDependencyManagementAndValidation:
 
         assert result.is_valid is False
         assert result.metadata["parent_exists"] is False
-        assert "parent prd does not exist" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_check_dependency_cycles_no_cycles(
-        self, relationship_manager, mock_github_client
+        assert "Parent prd does not exist" in result.errors[0]
+
+    @pytest.mark.parametrize("method,response,error,metadata,sizes", _GRAPH_SCAN_CASES)
+    async def test_project_graph_scan(
+        self,
+        relationship_manager,
+        stub_github_client,
+        method,
+        response,
+        error,
+        metadata,
+        sizes,
     ):
-        """Test dependency cycle detection when no cycles exist."""
-        # Mock project items with proper hierarchy
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_prd1",
-                            "content": {
-                                "id": "DI_prd1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD\n\nPRD description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** DI_prd1\n\nTask description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** DI_task1\n**Order:** 1\n\nSubtask description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
-
-        result = await relationship_manager.check_dependency_cycles("PROJECT_123")
-
-        assert result.is_valid is True
-        assert result.metadata["cycles_detected"] is False
-        assert result.metadata["total_items_checked"] == 3
-        assert len(result.metadata["dependency_graph"]) == 3
-
-    @pytest.mark.asyncio
-    async def test_check_dependency_cycles_cycle_detected(
-        self, relationship_manager, mock_github_client
+        """Test the whole-project cycle and hierarchy scans."""
+        stub_github_client.query_results.append(response)
+
+        result = await getattr(relationship_manager, method)("PROJECT_123")
+
+        if error is None:
+            assert result.is_valid is True
+        else:
+            _assert_invalid(result, error)
+        for key, expected in metadata.items():
+            assert result.metadata[key] == expected, key
+        for key, expected in sizes.items():
+            assert len(result.metadata[key]) == expected, key
+        # The whole project is read with a single GraphQL query
+        assert len(stub_github_client.query_calls) == 1
+
+    async def test_check_dependency_cycles_reports_each_cycle_once(
+        self, relationship_manager, stub_github_client
     ):
-        """Test dependency cycle detection when cycles exist."""
-        # Mock project items with circular dependency
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** DI_task2\n\nCyclic dependency",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** DI_task1\n\nAnother cyclic dependency",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        """Test that items hanging off a cycle do not report it again."""
+        stub_github_client.query_results.append(
+            _items_response(
+                (
+                    _subtask_node(1, parent_task="DI_task1"),
+                    *_CYCLIC_TASKS_RESPONSE["node"]["items"]["nodes"],
+                    _prd1_node(),
+                )
+            )
+        )
 
         result = await relationship_manager.check_dependency_cycles("PROJECT_123")
 
-        assert result.is_valid is False
-        assert result.metadata["cycles_detected"] is True
-        assert "circular dependencies detected" in result.errors[0].lower()
-        assert len(result.metadata["detected_cycles"]) > 0
-
-    @pytest.mark.asyncio
-    async def test_enforce_hierarchy_constraints_success(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test hierarchy constraint enforcement succeeds with valid structure."""
-        # Mock project items with valid hierarchy
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_prd1",
-                            "content": {
-                                "id": "DI_prd1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD\n\nPRD description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** DI_prd1\n\nTask description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
-
-        result = await relationship_manager.enforce_hierarchy_constraints("PROJECT_123")
-
-        assert result.is_valid is True
-        assert result.metadata["constraints_violated"] is False
-        assert result.metadata["total_items_validated"] == 2
-
-    @pytest.mark.asyncio
-    async def test_enforce_hierarchy_constraints_violations(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test hierarchy constraint enforcement detects violations."""
-        # Mock project items with constraint violations
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Orphaned Task",
-                                "body": "**Parent PRD:** NONEXISTENT_PRD\n\nTask with missing parent",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Invalid Subtask",
-                                "body": "**Type:** Subtask\n**Parent Task:** NONEXISTENT_TASK\n**Order:** 1\n\nSubtask with missing parent",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
-
-        result = await relationship_manager.enforce_hierarchy_constraints("PROJECT_123")
-
-        assert result.is_valid is False
-        assert result.metadata["constraints_violated"] is True
-        assert "hierarchy constraint violations detected" in result.errors[0].lower()
-        assert len(result.metadata["violations"]) >= 2
+        _assert_invalid(result, "Circular dependencies detected: 1 cycles found")
+        assert result.metadata["total_items_checked"] == 4
+        assert result.metadata["detected_cycles"] == [
+            ["DI_task1", "DI_task2", "DI_task1"]
+        ]
 
-    @pytest.mark.asyncio
     async def test_get_dependency_chain_success(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test dependency chain retrieval for a complete hierarchy."""
-        # Mock project items
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_prd1",
-                            "content": {
-                                "id": "DI_prd1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD\n\nPRD description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** DI_prd1\n\nTask description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_subtask1",
-                            "content": {
-                                "id": "DI_subtask1",
-                                "title": "Subtask 1",
-                                "body": "**Type:** Subtask\n**Parent Task:** DI_task1\n**Order:** 1\n\nSubtask description",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_PRD_TASK_SUBTASK_RESPONSE)
 
         result = await relationship_manager.get_dependency_chain(
             "PROJECT_123", "DI_subtask1"
@@ -2504,45 +1885,28 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["chain_root"] == "DI_prd1"
         assert result.metadata["target_item"] == "DI_subtask1"
 
-    @pytest.mark.asyncio
+    async def test_get_dependency_chain_stops_on_cycle(
+        self, relationship_manager, stub_github_client
+    ):
+        """Test that a parent loop ends the chain instead of spinning forever."""
+        stub_github_client.query_results.append(_CYCLIC_TASKS_RESPONSE)
+
+        result = await relationship_manager.get_dependency_chain(
+            "PROJECT_123", "DI_task1"
+        )
+
+        assert result.is_valid is True
+        assert [item["content_id"] for item in result.metadata["dependency_chain"]] == [
+            "DI_task2",
+            "DI_task1",
+        ]
+        assert result.metadata["chain_root"] is None
+
     async def test_validate_deletion_impact_analysis(
-        self, relationship_manager, mock_github_client
+        self, relationship_manager, stub_github_client
     ):
         """Test deletion impact analysis for cascading effects."""
-        # Mock project items with dependencies
-        mock_response = {
-            "node": {
-                "items": {
-                    "nodes": [
-                        {
-                            "id": "PVTI_prd1",
-                            "content": {
-                                "id": "DI_prd1",
-                                "title": "PRD 1",
-                                "body": "**Type:** PRD\n\nPRD description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task1",
-                            "content": {
-                                "id": "DI_task1",
-                                "title": "Task 1",
-                                "body": "**Parent PRD:** DI_prd1\n\nTask description",
-                            },
-                        },
-                        {
-                            "id": "PVTI_task2",
-                            "content": {
-                                "id": "DI_task2",
-                                "title": "Task 2",
-                                "body": "**Parent PRD:** DI_prd1\n\nAnother task",
-                            },
-                        },
-                    ]
-                }
-            }
-        }
-        mock_github_client.query.return_value = mock_response
+        stub_github_client.query_results.append(_PRD_TWO_TASKS_RESPONSE)
 
         result = await relationship_manager.validate_deletion_impact(
             "PROJECT_123", "DI_prd1", "PRD"
@@ -2552,107 +1916,30 @@ class TestDependencyManagementAndValidation:
         assert result.metadata["deletion_impact"]["total_affected_items"] == 2
         assert result.metadata["deletion_impact"]["affected_tasks"] == 2
         assert result.metadata["deletion_impact"]["affected_subtasks"] == 0
-        assert "Task 1" in str(result.metadata["deletion_impact"]["affected_items"])
-        assert "Task 2" in str(result.metadata["deletion_impact"]["affected_items"])
-
-    @pytest.mark.asyncio
-    async def test_dependency_validation_missing_parameters(self, relationship_manager):
-        """Test dependency validation with missing required parameters."""
-        result = await relationship_manager.validate_prd_deletion_dependencies(
-            "", "PRD_123"
-        )
-
-        assert result.is_valid is False
-        assert "missing required parameters" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_dependency_validation_no_github_client(self):
-        """Test dependency validation without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-
-        result = await manager.validate_prd_deletion_dependencies(
-            "PROJECT_123", "PRD_123"
-        )
+        affected_items = result.metadata["deletion_impact"]["affected_items"]
+        assert {item["title"] for item in affected_items} == {"Task 1", "Task 2"}
 
-        assert result.is_valid is False
-        assert "github client not initialized" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_dependency_validation_api_error(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test dependency validation with API error."""
-        mock_github_client.query.side_effect = Exception("API error")
-
-        result = await relationship_manager.validate_prd_deletion_dependencies(
-            "PROJECT_123", "PRD_123"
-        )
-
-        assert result.is_valid is False
-        assert "dependency validation failed" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_parent_validation_missing_parameters(self, relationship_manager):
-        """Test parent validation with missing parameters."""
-        result = await relationship_manager.validate_parent_exists(
-            "", "PARENT_123", "PRD"
-        )
-
-        assert result.is_valid is False
-        assert "missing required parameters" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_parent_validation_no_github_client(self):
-        """Test parent validation without GitHub client."""
-        manager = RelationshipManager(github_client=None)
-
-        result = await manager.validate_parent_exists(
-            "PROJECT_123", "PARENT_123", "PRD"
-        )
-
-        assert result.is_valid is False
-        assert "github client not initialized" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_parent_validation_api_error(
-        self, relationship_manager, mock_github_client
-    ):
-        """Test parent validation with API error."""
-        mock_github_client.query.side_effect = Exception("API error")
-
-        result = await relationship_manager.validate_parent_exists(
-            "PROJECT_123", "PARENT_123", "PRD"
-        )
+    @pytest.mark.parametrize("method,args,failure", _DEPENDENCY_ERROR_CASES)
+    async def test_missing_parameters(self, null_manager, method, args, failure):
+        """Test that a blank project ID is rejected before any query."""
+        result = await getattr(null_manager, method)("", *args[1:])
 
-        assert result.is_valid is False
-        assert "parent validation failed" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_cycle_detection_missing_parameters(self, relationship_manager):
-        """Test cycle detection with missing parameters."""
-        result = await relationship_manager.check_dependency_cycles("")
-
-        assert result.is_valid is False
-        assert "missing required parameters" in result.errors[0].lower()
+        _assert_invalid(result, _MISSING_PARAMETERS)
 
-    @pytest.mark.asyncio
-    async def test_cycle_detection_no_github_client(self):
-        """Test cycle detection without GitHub client."""
-        manager = RelationshipManager(github_client=None)
+    @pytest.mark.parametrize("method,args,failure", _DEPENDENCY_ERROR_CASES)
+    async def test_no_github_client(self, null_manager, method, args, failure):
+        """Test that calls without a GitHub client fail cleanly."""
+        result = await getattr(null_manager, method)(*args)
 
-        result = await manager.check_dependency_cycles("PROJECT_123")
+        _assert_invalid(result, _NO_CLIENT)
 
-        assert result.is_valid is False
-        assert "github client not initialized" in result.errors[0].lower()
-
-    @pytest.mark.asyncio
-    async def test_cycle_detection_api_error(
-        self, relationship_manager, mock_github_client
+    @pytest.mark.parametrize("method,args,failure", _DEPENDENCY_ERROR_CASES)
+    async def test_api_error(
+        self, relationship_manager, stub_github_client, method, args, failure
     ):
-        """Test cycle detection with API error."""
-        mock_github_client.query.side_effect = Exception("API error")
+        """Test that API errors are reported in the failed result."""
+        stub_github_client.query_results.append(_graphql_error())
 
-        result = await relationship_manager.check_dependency_cycles("PROJECT_123")
+        result = await getattr(relationship_manager, method)(*args)
 
-        assert result.is_valid is False
-        assert "dependency cycle check failed" in result.errors[0].lower()
+        _assert_invalid(result, f"{failure}: {_GRAPHQL_ERROR}")